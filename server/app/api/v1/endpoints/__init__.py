@@ -1,7 +1,12 @@
 from fastapi import APIRouter
+from app.database.session import engine, replicas
+from app.database.pool import pool_metrics
+from app.core.user_cache import user_cache
+from app.core.token_reaper import token_reaper
 from app.api.v1.endpoints.posts import router as post_router
 from app.api.v1.endpoints.users import router as user_router
-from app.api.v1.endpoints.auth import router as auth_router
+from app.api.v1.endpoints.auth import router as auth_router, AdminUser
+from app.api.v1.endpoints.blocked_ips import router as blocked_ip_router
 # from app.api.v1.endpoints.email import router as email_router
 
 
@@ -14,10 +19,30 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "version": "1.0.0"}
 
+@router.get("/internal/db-pool", tags=["internal"], include_in_schema=False)
+async def db_pool_metrics(admin_user: AdminUser):
+    """Connection pool occupancy and checkout wait times for this worker (admin only)"""
+    return {
+        "primary": pool_metrics(engine),
+        "replicas": [pool_metrics(replica) for replica in replicas.engines],
+    }
+
+@router.get("/internal/user-cache", tags=["internal"], include_in_schema=False)
+async def user_cache_metrics(admin_user: AdminUser):
+    """Authenticated-user cache size and hit/miss counters for this worker (admin only)"""
+    return user_cache.stats()
+
+@router.get("/internal/token-reaper", tags=["internal"], include_in_schema=False)
+async def token_reaper_report(admin_user: AdminUser):
+    """Rows reclaimed by this worker's last token reaper run (admin only)"""
+    report = token_reaper.last_report
+    return vars(report) if report else None
+
 # Include all route modules
 router.include_router(post_router, prefix="/api/v1")
 router.include_router(user_router, prefix="/api/v1")
 router.include_router(auth_router, prefix="/api/v1")
+router.include_router(blocked_ip_router, prefix="/api/v1")
 # router.include_router(email_router, prefix="/api/v1")
 # Add other routers as needed
 # router.include_router(user_router, prefix="/api/v1")
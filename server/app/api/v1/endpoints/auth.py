@@ -168,6 +168,7 @@ from fastapi import APIRouter, Depends, status, BackgroundTasks, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
+from uuid import UUID
 from pydantic import EmailStr, BaseModel
 
 from app.database import get_db
@@ -176,13 +177,15 @@ from app.services.email import EmailService
 from app.services.auth_service import AuthService
 from app.models.users import User
 from app.repositories.auth import AuthRepository, get_auth_repository
+from app.core.user_cache import user_cache
+from app.utils.security import TokenPrincipal
 from app.exceptions.database import (
-    DatabaseError, InvalidTokenError, TokenExpiredError, DatabaseCommitException,InvalidDataException
+    DatabaseError, InvalidTokenError, TokenExpiredError, DatabaseCommitException,InvalidDataException,
+    ServiceOverloadedError
 )
 from app.schemas.user import UserResponse
 from app.schemas.auth import TokenSchema, UserLogin, ResetPassword
 from app.schemas.token import RefreshTokenRequest
-from app.core.ratelimit import RateLimit
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -197,28 +200,39 @@ async def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 async def get_email_service() -> EmailService:
     return EmailService()
 
-async def get_current_user(
+async def get_current_principal(
     token: str = Depends(oauth2_scheme),
     auth_repo: AuthRepository = Depends(get_auth_repository)
+) -> TokenPrincipal:
+    """
+    Dependency to authenticate a token from its signed claims, without
+    loading the user.
+    """
+    principal = await auth_repo.get_principal(token)
+    return await auth_repo.verify_active_user(principal)
+
+async def get_current_user(
+    principal: TokenPrincipal = Depends(get_current_principal),
+    auth_repo: AuthRepository = Depends(get_auth_repository)
 ) -> User:
     """
     Dependency to get the current authenticated user from a token.
     """
-    user = await auth_repo.get_user_by_token(token)
-    return await auth_repo.verify_active_user(user)
+    return await auth_repo.get_active_user(principal.id)
 
 async def get_admin_user(
-    current_user: User = Depends(get_current_user),
+    principal: TokenPrincipal = Depends(get_current_principal),
     auth_repo: AuthRepository = Depends(get_auth_repository)
-) -> User:
+) -> TokenPrincipal:
     """
     Dependency to get current user and verify they have admin privileges.
     """
-    return await auth_repo.verify_admin_user(current_user)
+    return await auth_repo.verify_admin_user(principal)
 
 # Type aliases for cleaner dependency injection
+CurrentPrincipal = Annotated[TokenPrincipal, Depends(get_current_principal)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
-AdminUser = Annotated[User, Depends(get_admin_user)]
+AdminUser = Annotated[TokenPrincipal, Depends(get_admin_user)]
 
 # Test email endpoint schema
 class TestEmailSchema(BaseModel):
@@ -246,7 +260,6 @@ async def test_email(
         raise DatabaseError(detail=f"Failed to send test email: {str(e)}")
 
 @router.post("/activate/{token}", response_model=UserResponse)
-@rate_limiter.rate_limit(max_requests=5, window_seconds=60, block_minutes=15)
 async def activate_account(
     token: str, 
     background_tasks: BackgroundTasks,
@@ -272,9 +285,12 @@ async def activate_account(
         raise DatabaseError(detail=str(e))
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: CurrentUser):
+async def get_current_user_info(
+    principal: CurrentPrincipal,
+    auth_repo: AuthRepository = Depends(get_auth_repository)
+):
     """Get current user's information"""
-    return current_user
+    return await auth_repo.get_user_snapshot(principal)
 
 @router.get("/users", response_model=list[UserResponse])
 async def get_users(
@@ -349,6 +365,8 @@ async def login_for_access_token(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except ServiceOverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -377,7 +395,7 @@ async def refresh_token(
 
 @router.post("/logout")
 async def logout(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: AsyncSession = Depends(get_db)
 ):
     try:
@@ -394,30 +412,30 @@ async def logout_all_users(
 ):
     """Revoke tokens for all users (admin only)"""
     try:
-        users = await auth_repo.get_all_users()
         token_service = TokenService(auth_repo._session)
-        for user in users:
-            await token_service.revoke_all_user_tokens(user.id)
+        await token_service.revoke_all_tokens(revoked_by=admin_user.id)
+        user_cache.clear()
         return {"message": "Successfully logged out all users"}
     except DatabaseCommitException as e:
         raise DatabaseError(detail=str(e))
 
 @router.post("/admin/revoke/{user_id}")
 async def revoke_user_access(
-    user_id: str,
+    user_id: UUID,
     admin_user: AdminUser,
     auth_repo: AuthRepository = Depends(get_auth_repository)
 ):
     """Revoke a specific user's access (admin only)"""
     try:
-        user = await auth_repo.get_by_id(user_id)
-        if not user:
+        # Access tokens still claim an active user; the version bump that
+        # deactivates the account also makes the change effective immediately
+        token_service = TokenService(auth_repo._session)
+        if await token_service.revoke_all_user_tokens(user_id, deactivate=True) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        user.is_active = False
-        await auth_repo.update(user)
+        user_cache.invalidate(user_id)
         return {"message": f"Access revoked for user {user_id}"}
     except DatabaseCommitException as e:
         raise DatabaseError(detail=str(e))
\ No newline at end of file
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import PlainTextResponse
+from typing import List
+from app.dependencies import get_blocked_ip_repository
+from app.repositories.blocked_ip import BlockedIPRepository
+from app.schemas.blocked_ip import BlockedIPImport, BlockedIPRemove, BlockedIPResponse
+from app.schemas.common import BulkResult
+from app.exceptions.database import DatabaseError, InvalidDataException
+from app.core.blocked_ips import blocked_ip_cache
+from app.api.v1.endpoints.auth import AdminUser
+
+router = APIRouter(
+    prefix="/blocked-ips",
+    tags=["blocked-ips"],
+    responses={
+        400: {"description": "Bad request or database error"},
+        403: {"description": "Admin privileges required"},
+        422: {"description": "Validation error"},
+        500: {"description": "Internal server error"}
+    },
+)
+
+@router.post(
+    "/import",
+    response_model=BulkResult,
+    summary="Bulk block IPs",
+    description="Admin only: block many IP addresses and CIDR ranges (e.g. 203.0.113.0/24) in one call"
+)
+async def import_blocked_ips(
+    payload: BlockedIPImport,
+    admin_user: AdminUser,
+    repo: BlockedIPRepository = Depends(get_blocked_ip_repository)
+) -> BulkResult:
+    """Block the given addresses and ranges, extending existing blocks."""
+    try:
+        result = await repo.import_blocks(payload.ips, payload.minutes)
+        # Other workers pick the blocks up on their next cache refresh
+        await blocked_ip_cache.refresh()
+        return result
+    except (ValueError, InvalidDataException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get(
+    "/export",
+    response_model=List[BlockedIPResponse],
+    summary="Export blocked IPs",
+    description="Admin only: list every active block; format=text returns one address or range per line"
+)
+async def export_blocked_ips(
+    admin_user: AdminUser,
+    format: str = Query("json", pattern="^(json|text)$"),
+    repo: BlockedIPRepository = Depends(get_blocked_ip_repository)
+):
+    """Export active blocks as JSON or as a plain-text list."""
+    try:
+        blocks = await repo.export_blocks()
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if format == "text":
+        return PlainTextResponse("".join(f"{block.ip}\n" for block in blocks))
+    return blocks
+
+@router.post(
+    "/remove",
+    response_model=BulkResult,
+    summary="Bulk unblock IPs",
+    description="Admin only: remove blocks for the given addresses and ranges, exactly as they were blocked"
+)
+async def remove_blocked_ips(
+    payload: BlockedIPRemove,
+    admin_user: AdminUser,
+    repo: BlockedIPRepository = Depends(get_blocked_ip_repository)
+) -> BulkResult:
+    """Delete the given blocks."""
+    try:
+        result = await repo.remove_blocks(payload.ips)
+        await blocked_ip_cache.refresh()
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status,Request, Query
 from uuid import UUID
 from app.dependencies import get_post_repository
-from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostPatch
+from app.schemas.post import (
+    PostCreate, PostUpdate, PostResponse, PostPatch, PostSearchResponse,
+    PostFilter, PostBulkUpdate
+)
 from app.repositories.post import PostRepository
 from app.exceptions.database import (
     DatabaseError,
@@ -12,7 +15,8 @@ from app.exceptions.database import (
     UpdateFailedException
 )
 from typing import List, Optional
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, CountMode, BulkResult
+from app.api.v1.endpoints.auth import AdminUser
  
 from app.models.users import User
  
@@ -47,6 +51,14 @@ async def get_posts(
         default=None,
         description="Filter by publication status"
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous page (next_cursor/prev_cursor); enables keyset pagination and ignores skip"
+    ),
+    count_mode: CountMode = Query(
+        default=CountMode.EXACT,
+        description="How the total is computed: exact, estimated (planner estimate) or none"
+    ),
     repo: PostRepository = Depends(get_post_repository),
     # current_user: User = Depends(get_current_user),
    
@@ -57,6 +69,8 @@ async def get_posts(
     - Use skip and limit for pagination
     - Use order_by for sorting (prefix field with - for descending order)
     - Use published=true/false to filter by publication status
+    - Pass next_cursor/prev_cursor back as cursor for fast keyset pagination on deep pages
+    - Use count_mode=estimated or count_mode=none to skip the exact count (has_more is always set)
     """
     
     try:
@@ -68,7 +82,14 @@ async def get_posts(
             skip=skip,
             limit=limit,
             order_by=order_by,
-            filters=filters
+            filters=filters,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+    except (InvalidFieldException, InvalidDataException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e.detail)
         )
     except DatabaseError as e:
         raise HTTPException(
@@ -83,23 +104,24 @@ async def get_posts(
 
 @router.get(
     "/search/",
-    response_model=PaginatedResponse[PostResponse],
-    summary="Search posts by any field",
-    description="Search posts where any text field matches the query string"
+    response_model=PaginatedResponse[PostSearchResponse],
+    summary="Full-text search posts",
+    description="Search post titles, authors and content, ranked by relevance with highlighted snippets"
 )
 async def search_posts(
-    q: str = Query(..., min_length=1, description="Search query string"),
+    q: str = Query(..., min_length=1, description="Search query (websearch syntax: \"phrase\", -exclude, or)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    count_mode: CountMode = Query(CountMode.EXACT, description="How the total is computed: exact, estimated or none"),
     repo: PostRepository = Depends(get_post_repository)
-) -> PaginatedResponse[PostResponse]:
+) -> PaginatedResponse[PostSearchResponse]:
     """
-    Search posts by any field containing the query string.
-    Returns paginated results.
+    Full-text search over posts.
+    Returns paginated results ordered by rank, each with a highlighted snippet.
     """
     try:
-        result = await repo.get_by_any_field(q, skip=skip, limit=limit)
-        if result.total == 0:
+        result = await repo.search(q, skip=skip, limit=limit, count_mode=count_mode)
+        if not result.items and skip == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No posts found matching query: {q}"
@@ -196,7 +218,10 @@ async def update_post(
 ) -> PostResponse:
     """Update a post."""
     try:
-        updated_post = await repo.update(id=post_id, schema=post_update)
+        updated_post = await repo.update_returning(
+            id=post_id,
+            values=post_update.model_dump(exclude_unset=True)
+        )
         return updated_post
     except NotFoundException as e:
         raise HTTPException(
@@ -208,6 +233,11 @@ async def update_post(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except InvalidDataException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     except UpdateFailedException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -232,13 +262,16 @@ async def patch_post(
 ) -> PostResponse:
     """Partially update an existing post."""
     try:
-        return await repo.patch(id=post_id, schema=post_update)
+        return await repo.update_returning(
+            id=post_id,
+            values=post_update.model_dump(exclude_unset=True, exclude_none=True)
+        )
     except NotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except InvalidFieldException as e:
+    except (InvalidFieldException, InvalidDataException) as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e)
@@ -286,4 +319,67 @@ async def delete_post(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.patch(
+    "/admin/bulk",
+    response_model=BulkResult,
+    summary="Bulk update posts",
+    description="Admin only: update every post matching the filters in one statement, e.g. unpublish all posts by an author"
+)
+async def bulk_update_posts(
+    payload: PostBulkUpdate,
+    admin_user: AdminUser,
+    repo: PostRepository = Depends(get_post_repository)
+) -> BulkResult:
+    """Update all posts matching the filters and return the affected count."""
+    try:
+        return await repo.bulk_update(
+            filters=payload.filters.model_dump(exclude_none=True),
+            values=payload.values.model_dump(exclude_none=True)
+        )
+    except (InvalidFieldException, InvalidDataException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.post(
+    "/admin/bulk-delete",
+    response_model=BulkResult,
+    summary="Bulk delete posts",
+    description="Admin only: delete every post matching the filters in one statement"
+)
+async def bulk_delete_posts(
+    filters: PostFilter,
+    admin_user: AdminUser,
+    repo: PostRepository = Depends(get_post_repository)
+) -> BulkResult:
+    """Delete all posts matching the filters and return the affected count."""
+    try:
+        return await repo.bulk_delete(filters.model_dump(exclude_none=True))
+    except (InvalidFieldException, InvalidDataException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
@@ -2,7 +2,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.user import UserCreate, UserUpdate, UserPatch, UserResponse
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, CountMode
 from app.repositories.user import UserRepository
 from app.database.session import get_db
 from uuid import UUID
@@ -28,22 +28,30 @@ async def list_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     order_by: Optional[List[str]] = Query(None),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page; enables keyset pagination"),
+    count_mode: CountMode = Query(CountMode.EXACT, description="How the total is computed: exact, estimated or none"),
     db: AsyncSession = Depends(get_db)
 ):
     """List users with pagination"""
     repo = UserRepository(db)
-    return await repo.get_all(skip=skip, limit=limit, order_by=order_by)
+    return await repo.get_all(
+        skip=skip, limit=limit, order_by=order_by, cursor=cursor, count_mode=count_mode
+    )
 
 @router.get("/search", response_model=PaginatedResponse[UserResponse])
 async def search_users(
     q: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    threshold: Optional[float] = Query(None, ge=0, le=1, description="Minimum trigram similarity"),
+    count_mode: CountMode = Query(CountMode.EXACT),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search users by any field"""
+    """Fuzzy search users by username, email or slug"""
     repo = UserRepository(db)
-    return await repo.get_by_any_field(q, skip=skip, limit=limit)
+    return await repo.search(
+        q, skip=skip, limit=limit, threshold=threshold, count_mode=count_mode
+    )
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
@@ -62,7 +70,10 @@ async def update_user(
 ):
     """Update a user"""
     repo = UserRepository(db)
-    return await repo.update(id=user_id, schema=user_in)
+    return await repo.update_returning(
+        id=user_id,
+        values=user_in.model_dump(exclude_unset=True)
+    )
 
 @router.patch("/{user_id}", response_model=UserResponse)
 async def patch_user(
@@ -72,7 +83,10 @@ async def patch_user(
 ):
     """Partially update a user"""
     repo = UserRepository(db)
-    return await repo.patch(id=user_id, schema=user_in)
+    return await repo.update_returning(
+        id=user_id,
+        values=user_in.model_dump(exclude_unset=True, exclude_none=True)
+    )
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 from functools import lru_cache
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from app.core.ratelimit.policies import DEFAULT_POLICIES, RateLimitPolicy
 
 # Determine the root directory
 current_file = Path(__file__)
@@ -29,6 +30,14 @@ class Settings(BaseSettings):
 
     ALLOW_ORIGINS: List[str] = Field(default=["*"])
 
+    # Comma separated CIDRs of reverse proxies (the nginx tier) whose
+    # X-Forwarded-For entries are trusted; set it to the proxy network.
+    # docker-compose.yml adds the app_network subnet (172.20.0.0/16), since
+    # nginx does not connect over loopback there. If the proxy is not
+    # trusted, every request gets the proxy's address as client_ip and
+    # shares one rate limit bucket.
+    TRUSTED_PROXIES: str = "127.0.0.1/32,::1/128"
+
     DATABASE_URL: str
     SECRET_KEY: str
     JWT_SECRET_KEY: str
@@ -38,6 +47,79 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     MINIMUM_PASSWORD_LENGTH: int = 8
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 20
+    # bcrypt runs on a dedicated thread pool; beyond PASSWORD_HASH_MAX_PENDING
+    # queued or running hashes, logins are rejected with 503 instead of queueing
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=32, ge=1)
+    # Scheme for new hashes; stored hashes using another scheme or older costs
+    # are upgraded on the next successful login. Pick costs for the deployment
+    # hardware with: python -m app.utils.password_calibration --target-ms 250
+    PASSWORD_HASH_SCHEME: str = Field(default="bcrypt", pattern="^(bcrypt|argon2id)$")
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    ARGON2_TIME_COST: int = Field(default=3, ge=1)
+    ARGON2_MEMORY_COST_KIB: int = Field(default=65536, ge=8)
+    ARGON2_PARALLELISM: int = Field(default=1, ge=1)
+    # Trust the signed user claims of access tokens (id, active flag, roles,
+    # token version) instead of loading the user on every request. Claims
+    # may lag behind the database by up to ACCESS_TOKEN_EXPIRE_MINUTES;
+    # revoked tokens (token version bumps) are rejected once the revocation
+    # cache has refreshed.
+    AUTH_STATELESS_ACCESS_TOKENS: bool = True
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = Field(default=15.0, gt=0)
+    # Per-worker cache of authenticated users' profiles; other workers may
+    # serve a changed profile for up to USER_CACHE_TTL_SECONDS
+    USER_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=0)
+    USER_CACHE_TTL_SECONDS: float = Field(default=30.0, gt=0)
+    # Expired and revoked tokens are deleted once older than the retention,
+    # in batches; disable the in-process reaper to run
+    # "python -m app.core.token_reaper" from cron instead
+    TOKEN_REAPER_ENABLED: bool = True
+    TOKEN_REAPER_INTERVAL_SECONDS: float = Field(default=3600.0, gt=0)
+    TOKEN_REAPER_BATCH_SIZE: int = Field(default=1000, ge=1)
+    TOKEN_REAPER_BATCH_PAUSE_SECONDS: float = Field(default=0.1, ge=0)
+    TOKEN_REAPER_RETENTION_HOURS: float = Field(default=24.0, ge=0)
+
+    # Database engine and pool. Pool size and overflow default to an even
+    # share of DB_MAX_CONNECTIONS across WEB_CONCURRENCY worker processes;
+    # the default leaves headroom under Postgres' max_connections=100.
+    WEB_CONCURRENCY: int = Field(default=1, ge=1)
+    DB_MAX_CONNECTIONS: int = Field(default=90, ge=1)
+    DB_POOL_SIZE: Optional[int] = Field(default=None, ge=1)
+    DB_MAX_OVERFLOW: Optional[int] = Field(default=None, ge=0)
+    DB_POOL_TIMEOUT: float = Field(default=10.0, gt=0)
+    DB_POOL_RECYCLE: int = Field(default=1800)
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    DB_STATEMENT_TIMEOUT_MS: int = Field(default=30000, ge=0)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=100, ge=0)
+    DB_APPLICATION_NAME: str = "fastapi"
+    DB_JIT: bool = False
+
+    # Read replicas (comma separated URLs). Repository reads go to a replica
+    # picked by DB_REPLICA_STRATEGY (round_robin or least_connections); a
+    # client that wrote stays on the primary for DB_READ_YOUR_WRITES_SECONDS.
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_STRATEGY: str = Field(default="round_robin", pattern="^(round_robin|least_connections)$")
+    DB_READ_YOUR_WRITES_SECONDS: int = Field(default=5, ge=0)
+
+    # Blocked IP cache: reload interval for active blocks and the number of
+    # known-good IPs remembered between reloads
+    BLOCKED_IP_CACHE_REFRESH_SECONDS: float = Field(default=15.0, gt=0)
+    BLOCKED_IP_NEGATIVE_CACHE_SIZE: int = Field(default=10000, ge=0)
+
+    # Rate limiter state: "memory" (per worker) or "redis" (shared, needs REDIS_URL)
+    RATE_LIMIT_BACKEND: str = Field(default="memory", pattern="^(memory|redis)$")
+    RATE_LIMIT_ALGORITHM: str = Field(default="token_bucket", pattern="^(token_bucket|sliding_window)$")
+    REDIS_URL: Optional[str] = None
+    # In-process backend: most client keys kept (LRU evicted) and how often
+    # expired keys are purged in the background
+    RATE_LIMIT_MAX_KEYS: int = Field(default=100_000, ge=1)
+    RATE_LIMIT_PURGE_SECONDS: float = Field(default=30.0, gt=0)
+    # Per-route limits enforced by RateLimitMiddleware (JSON list in the env)
+    RATE_LIMIT_POLICIES: List[RateLimitPolicy] = Field(default_factory=lambda: list(DEFAULT_POLICIES))
+
+    # Minimum pg_trgm similarity for fuzzy user search matches
+    USER_SEARCH_SIMILARITY_THRESHOLD: float = Field(default=0.3, ge=0, le=1)
 
     class Config:
         case_sensitive = True
@@ -52,6 +134,32 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.ENVIRONMENT.lower() == "production"
 
+    @property
+    def trusted_proxies(self) -> List[str]:
+        return [cidr.strip() for cidr in self.TRUSTED_PROXIES.split(",") if cidr.strip()]
+
+    @property
+    def database_replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+    @property
+    def db_connections_per_worker(self) -> int:
+        # An async worker rarely benefits from more than ~30 connections
+        return max(2, min(30, self.DB_MAX_CONNECTIONS // self.WEB_CONCURRENCY))
+
+    @property
+    def db_pool_size(self) -> int:
+        if self.DB_POOL_SIZE is not None:
+            return self.DB_POOL_SIZE
+        # Keep about two thirds of the worker's share open, the rest as overflow
+        return max(1, self.db_connections_per_worker * 2 // 3)
+
+    @property
+    def db_max_overflow(self) -> int:
+        if self.DB_MAX_OVERFLOW is not None:
+            return self.DB_MAX_OVERFLOW
+        return max(0, self.db_connections_per_worker - self.db_pool_size)
+
 @lru_cache()
 def get_settings() -> Settings:
     return Settings()
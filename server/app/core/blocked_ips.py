@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, or_, select
+
+from app.config import get_settings
+from app.database.session import AsyncSessionLocal
+from app.models.blockedips import BlockedIP
+from app.utils.ip_ranges import IPRangeIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Epoch seconds for ``value``; naive datetimes (SQLite) are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class BlockedIPCache:
+    """
+    Process-local view of the blocked_ips table.
+
+    Blocks are kept until their ``expires_at`` (None blocks forever). Single
+    addresses live in a dict; CIDR ranges in an IPRangeIndex. A background
+    task reloads every active block each ``refresh_seconds`` so blocks
+    created by other workers propagate; while that snapshot is fresh a
+    lookup never touches the database. A cold cache loads the snapshot on
+    first use; if that fails, addresses are looked up one by one and misses
+    remembered in a bounded negative cache for one refresh interval.
+    """
+
+    def __init__(self, refresh_seconds: float, negative_cache_size: int):
+        self.refresh_seconds = refresh_seconds
+        self.negative_cache_size = negative_cache_size
+        self._blocked: Dict[str, Optional[float]] = {}
+        self._range_rows: List[Tuple[str, Optional[float]]] = []
+        self._ranges = IPRangeIndex()
+        self._refresh_lock = asyncio.Lock()
+        self._allowed: "OrderedDict[str, float]" = OrderedDict()
+        self._loaded_at: Optional[float] = None
+        self._retry_load_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def _snapshot_fresh(self, now: float) -> bool:
+        # Allow one missed refresh before falling back to per-IP lookups
+        return self._loaded_at is not None and now - self._loaded_at < 2 * self.refresh_seconds
+
+    def _remember_allowed(self, ip: str, now: float) -> None:
+        self._allowed[ip] = now + self.refresh_seconds
+        self._allowed.move_to_end(ip)
+        while len(self._allowed) > self.negative_cache_size:
+            self._allowed.popitem(last=False)
+
+    async def is_blocked(self, ip: str) -> bool:
+        now = time.time()
+        if ip in self._blocked:
+            expires = self._blocked[ip]
+            if expires is None or expires > now:
+                return True
+            del self._blocked[ip]
+
+        if self._ranges.contains(ip, now):
+            return True
+
+        if self._snapshot_fresh(now):
+            return False
+
+        if now >= self._retry_load_at:
+            try:
+                async with self._refresh_lock:
+                    if not self._snapshot_fresh(time.time()):
+                        await self.refresh()
+                return self._ranges.contains(ip, now) or ip in self._blocked
+            except Exception as e:
+                # Use exact per-IP lookups until the next attempt
+                self._retry_load_at = now + self.refresh_seconds
+                logger.error(f"Blocked IP cache load failed: {str(e)}")
+
+        allowed_until = self._allowed.get(ip)
+        if allowed_until is not None and allowed_until > now:
+            return False
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(BlockedIP.expires_at).where(BlockedIP.ip == ip))
+            row = result.one_or_none()
+
+        if row is not None:
+            expires = _timestamp(row.expires_at)
+            if expires is None or expires > now:
+                self._blocked[ip] = expires
+                self._allowed.pop(ip, None)
+                return True
+        self._remember_allowed(ip, now)
+        return False
+
+    def add(self, ip: str, expires_at: Optional[datetime]) -> None:
+        """Record a block created by this worker without waiting for a refresh."""
+        if "/" in ip:
+            self._range_rows.append((ip, _timestamp(expires_at)))
+            self._ranges = IPRangeIndex(self._range_rows)
+            self._allowed.clear()
+            return
+        self._blocked[ip] = _timestamp(expires_at)
+        self._allowed.pop(ip, None)
+
+    async def refresh(self) -> None:
+        """Reload active blocks and purge expired rows."""
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(BlockedIP).where(BlockedIP.expires_at <= now))
+            result = await session.execute(
+                select(BlockedIP.ip, BlockedIP.expires_at).where(
+                    or_(BlockedIP.expires_at.is_(None), BlockedIP.expires_at > now)
+                )
+            )
+            rows = [(row.ip, _timestamp(row.expires_at)) for row in result]
+            await session.commit()
+
+        # Stored blocks are canonical: ranges in CIDR notation, addresses bare
+        self._blocked = {ip: expires for ip, expires in rows if "/" not in ip}
+        self._range_rows = [(ip, expires) for ip, expires in rows if "/" in ip]
+        self._ranges = IPRangeIndex(self._range_rows)
+        self._allowed.clear()
+        self._loaded_at = time.time()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Blocked IP cache refresh failed: {str(e)}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+settings = get_settings()
+
+blocked_ip_cache = BlockedIPCache(
+    refresh_seconds=settings.BLOCKED_IP_CACHE_REFRESH_SECONDS,
+    negative_cache_size=settings.BLOCKED_IP_NEGATIVE_CACHE_SIZE,
+)
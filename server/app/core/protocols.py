@@ -1,10 +1,27 @@
-from typing import Protocol
+from typing import TYPE_CHECKING, Optional, Protocol, Tuple
 from email.mime.multipart import MIMEMultipart
 
+if TYPE_CHECKING:
+    from app.core.ratelimit import RateLimit, RateLimitResult
+
 class SMTPClient(Protocol):
     """Protocol for SMTP client implementations"""
     async def connect(self) -> None: ...
     async def starttls(self) -> None: ...
     async def login(self, username: str, password: str) -> None: ...
     async def send_message(self, message: MIMEMultipart) -> None: ...
-    async def quit(self) -> None: ...
\ No newline at end of file
+    async def quit(self) -> None: ...
+
+class RateLimitBackend(Protocol):
+    """Protocol for rate limiter state backends"""
+    async def hit(self, key: str, limit: "RateLimit", now: Optional[float] = None) -> "RateLimitResult": ...
+    async def reset(self, key: str) -> None: ...
+    async def purge_expired(self, now: Optional[float] = None) -> int: ...
+
+class PasswordScheme(Protocol):
+    """Protocol for password hashing schemes registered with PasswordHasher"""
+    name: str
+    prefixes: Tuple[str, ...]
+    def hash(self, password: str) -> str: ...
+    def verify(self, password: str, hashed_password: str) -> bool: ...
+    def needs_rehash(self, hashed_password: str) -> bool: ...
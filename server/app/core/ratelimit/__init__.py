@@ -0,0 +1,19 @@
+from app.core.ratelimit.limits import (
+    TOKEN_BUCKET,
+    SLIDING_WINDOW,
+    RateLimit,
+    RateLimitResult,
+)
+from app.core.ratelimit.backends import MemoryBackend, RedisBackend, create_backend
+from app.core.ratelimit.policies import RateLimitPolicy
+
+__all__ = [
+    'TOKEN_BUCKET',
+    'SLIDING_WINDOW',
+    'RateLimit',
+    'RateLimitResult',
+    'MemoryBackend',
+    'RedisBackend',
+    'create_backend',
+    'RateLimitPolicy',
+]
@@ -0,0 +1,176 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.core.ratelimit.limits import (
+    ALGORITHMS,
+    SLIDING_WINDOW,
+    RateLimit,
+    RateLimitResult,
+    hit,
+    sliding_window_result,
+    token_bucket_result,
+)
+
+MEMORY = "memory"
+REDIS = "redis"
+
+
+class MemoryBackend:
+    """
+    Per-process limiter state. Each worker enforces the limit on its own, so
+    with several workers use RedisBackend for a shared limit.
+
+    Keys are kept in least-recently-used order with the time their state
+    becomes equivalent to a fresh key. At most ``max_keys`` are kept, the
+    least recently used being evicted first, and purge_expired() drops
+    expired keys from the cold end. Both are O(1) per key.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._state: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    async def hit(self, key: str, limit: RateLimit, now: Optional[float] = None) -> RateLimitResult:
+        now = time.time() if now is None else now
+        key = f"{limit.algorithm}:{key}"
+        entry = self._state.get(key)
+        result, state = hit(entry[0] if entry is not None else None, limit, now)
+        self._state[key] = (state, now + limit.ttl_seconds)
+        self._state.move_to_end(key)
+        if len(self._state) > self.max_keys:
+            self._state.popitem(last=False)
+        return result
+
+    async def reset(self, key: str) -> None:
+        for algorithm in ALGORITHMS:
+            self._state.pop(f"{algorithm}:{key}", None)
+
+    async def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop expired keys from the least recently used end, stopping at the
+        first live one. Keys whose policy has a longer TTL than a colder
+        neighbour may linger until a later pass or LRU eviction.
+        """
+        now = time.time() if now is None else now
+        purged = 0
+        while self._state:
+            key, (_, expires_at) = next(iter(self._state.items()))
+            if expires_at > now:
+                break
+            del self._state[key]
+            purged += 1
+        return purged
+
+
+# The scripts mirror token_bucket_hit and sliding_window_hit so a check is
+# one atomic round-trip. Floats are stored and returned as %.17g strings:
+# Redis truncates Lua numbers to integers and tostring() rounds them.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local rate = capacity / window
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', string.format('%.17g', tokens), 'ts', string.format('%.17g', now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return {allowed, string.format('%.17g', tokens)}
+"""
+
+_SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local current_index = math.floor(now / window)
+local state = redis.call('HMGET', KEYS[1], 'index', 'current', 'previous')
+local index = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if index == nil then
+    index = current_index
+    current = 0
+    previous = 0
+elseif index ~= current_index then
+    if current_index - index == 1 then
+        previous = current
+    else
+        previous = 0
+    end
+    current = 0
+    index = current_index
+end
+local estimated = previous * (1 - (now - index * window) / window) + current
+local allowed = 0
+if estimated + 1 <= limit then
+    current = current + 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'index', index, 'current', current, 'previous', previous)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 2000))
+return {allowed, index, current, previous}
+"""
+
+
+class RedisBackend:
+    """
+    Limiter state shared by every worker through a Redis-compatible client
+    (``redis.asyncio.Redis`` or any client exposing ``register_script``).
+    """
+
+    def __init__(self, client, prefix: str = "ratelimit"):
+        self.client = client
+        self.prefix = prefix
+        self._token_bucket = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._sliding_window = client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, key: str, limit: RateLimit, now: Optional[float] = None) -> RateLimitResult:
+        now = time.time() if now is None else now
+        name = f"{self.prefix}:{limit.algorithm}:{key}"
+        args = [limit.limit, repr(float(limit.window_seconds)), repr(now)]
+
+        if limit.algorithm == SLIDING_WINDOW:
+            allowed, index, current, previous = await self._sliding_window(keys=[name], args=args)
+            state = (int(index), int(current), int(previous))
+            return sliding_window_result(bool(allowed), state, limit, now)
+
+        allowed, tokens = await self._token_bucket(keys=[name], args=args)
+        return token_bucket_result(bool(allowed), (float(tokens), now), limit)
+
+    async def reset(self, key: str) -> None:
+        await self.client.delete(*[
+            f"{self.prefix}:{algorithm}:{key}" for algorithm in ALGORITHMS
+        ])
+
+    async def purge_expired(self, now: Optional[float] = None) -> int:
+        # Keys carry a PEXPIRE, so Redis drops them itself
+        return 0
+
+
+def create_backend(name: str, redis_url: Optional[str] = None, max_keys: int = 100_000):
+    """Build the limiter backend named in Settings.RATE_LIMIT_BACKEND."""
+    if name == MEMORY:
+        return MemoryBackend(max_keys=max_keys)
+    if name == REDIS:
+        if not redis_url:
+            raise ValueError("RATE_LIMIT_BACKEND=redis requires REDIS_URL")
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError("The redis rate limit backend requires the 'redis' package") from e
+        return RedisBackend(Redis.from_url(redis_url))
+    raise ValueError(f"Unknown rate limit backend: {name}")
@@ -0,0 +1,133 @@
+import math
+from dataclasses import dataclass
+from typing import Tuple
+
+TOKEN_BUCKET = "token_bucket"
+SLIDING_WINDOW = "sliding_window"
+
+ALGORITHMS = (TOKEN_BUCKET, SLIDING_WINDOW)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    ``limit`` requests per ``window_seconds``.
+
+    TOKEN_BUCKET allows bursts up to ``limit`` and refills continuously at
+    limit/window. SLIDING_WINDOW weights the previous fixed window by how
+    much of it still overlaps the sliding window, which avoids the burst a
+    plain fixed window allows at its edges.
+    """
+    limit: int
+    window_seconds: float
+    algorithm: str = TOKEN_BUCKET
+
+    def __post_init__(self):
+        if self.limit < 1 or self.window_seconds <= 0:
+            raise ValueError("RateLimit needs limit >= 1 and window_seconds > 0")
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {self.algorithm}")
+
+    @property
+    def ttl_seconds(self) -> float:
+        """How long idle state must be kept before it is equivalent to none."""
+        return self.window_seconds * 2 if self.algorithm == SLIDING_WINDOW else self.window_seconds
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the next request would be allowed (0 when allowed)
+    retry_after: float
+    # Seconds until the full allowance is available again
+    reset_after: float
+
+
+# Token bucket state: (tokens, updated_at)
+TokenBucketState = Tuple[float, float]
+# Sliding window state: (window_index, current_count, previous_count)
+SlidingWindowState = Tuple[int, int, int]
+
+
+def token_bucket_hit(state, limit: RateLimit, now: float) -> Tuple[bool, TokenBucketState]:
+    rate = limit.limit / limit.window_seconds
+    tokens, updated_at = state if state is not None else (float(limit.limit), now)
+    tokens = min(float(limit.limit), tokens + max(0.0, now - updated_at) * rate)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    return allowed, (tokens, now)
+
+
+def token_bucket_result(allowed: bool, state: TokenBucketState, limit: RateLimit) -> RateLimitResult:
+    rate = limit.limit / limit.window_seconds
+    tokens = state[0]
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit.limit,
+        remaining=int(tokens),
+        retry_after=0.0 if allowed else (1 - tokens) / rate,
+        reset_after=(limit.limit - tokens) / rate,
+    )
+
+
+def sliding_window_hit(state, limit: RateLimit, now: float) -> Tuple[bool, SlidingWindowState]:
+    window = limit.window_seconds
+    current_index = math.floor(now / window)
+    if state is None:
+        index, current, previous = current_index, 0, 0
+    else:
+        index, current, previous = state
+        if current_index != index:
+            previous = current if current_index - index == 1 else 0
+            current = 0
+            index = current_index
+
+    estimated = previous * (1 - (now - index * window) / window) + current
+    allowed = estimated + 1 <= limit.limit
+    if allowed:
+        current += 1
+    return allowed, (index, current, previous)
+
+
+def sliding_window_result(
+    allowed: bool, state: SlidingWindowState, limit: RateLimit, now: float
+) -> RateLimitResult:
+    window = limit.window_seconds
+    index, current, previous = state
+    elapsed = now - index * window
+    estimated = previous * (1 - elapsed / window) + current
+
+    retry_after = 0.0
+    if not allowed:
+        if current + 1 <= limit.limit and previous:
+            # The previous window's weight decays enough within this window
+            retry_after = window * (1 - (limit.limit - 1 - current) / previous) - elapsed
+        else:
+            # Wait for the next window, where this window's count decays instead
+            retry_after = window - elapsed
+            if current:
+                retry_after += window * max(0.0, 1 - (limit.limit - 1) / current)
+
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit.limit,
+        remaining=max(0, int(limit.limit - estimated)),
+        retry_after=max(0.0, retry_after),
+        reset_after=(2 * window if current else window) - elapsed,
+    )
+
+
+def hit(state, limit: RateLimit, now: float):
+    """
+    Apply one request to ``state`` (None for a new key).
+
+    Returns the RateLimitResult and the state to store.
+    """
+    if limit.algorithm == SLIDING_WINDOW:
+        allowed, state = sliding_window_hit(state, limit, now)
+        return sliding_window_result(allowed, state, limit, now), state
+    allowed, state = token_bucket_hit(state, limit, now)
+    return token_bucket_result(allowed, state, limit), state
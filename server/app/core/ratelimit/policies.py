@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.ratelimit.limits import RateLimit
+
+
+class RateLimitPolicy(BaseModel):
+    """
+    Rate limit for one route, declared in Settings.RATE_LIMIT_POLICIES.
+
+    ``path`` is a route template such as ``/auth/activate/{token}`` and is
+    matched against the end of the request path, so policies do not depend
+    on the prefix the API is mounted under. All requests matching a template
+    share one limit per client IP.
+    """
+    path: str
+    methods: List[str] = Field(default_factory=list, description="Empty matches every method")
+    limit: int = Field(ge=1)
+    window_seconds: float = Field(gt=0)
+    algorithm: Optional[str] = Field(None, description="Defaults to RATE_LIMIT_ALGORITHM")
+    block_minutes: int = Field(0, ge=0, description="Block the IP this long once the limit is exceeded")
+
+    def rate_limit(self, default_algorithm: str) -> RateLimit:
+        return RateLimit(self.limit, self.window_seconds, self.algorithm or default_algorithm)
+
+
+DEFAULT_POLICIES = [
+    RateLimitPolicy(path="/auth/activate/{token}", methods=["POST"], limit=5, window_seconds=60, block_minutes=15),
+    RateLimitPolicy(path="/auth/login", methods=["POST"], limit=10, window_seconds=60),
+    RateLimitPolicy(path="/auth/login/token", methods=["POST"], limit=10, window_seconds=60),
+    RateLimitPolicy(path="/auth/resend-activation", methods=["POST"], limit=5, window_seconds=300),
+    RateLimitPolicy(path="/auth/request-password-reset", methods=["POST"], limit=5, window_seconds=300),
+    RateLimitPolicy(path="/auth/reset-password", methods=["POST"], limit=5, window_seconds=300),
+]
@@ -1,24 +1,18 @@
 from functools import wraps
 from fastapi import HTTPException, Request, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy import delete
 from datetime import datetime, timezone, timedelta
-from typing import Callable, Optional, Dict, Type
-from collections import defaultdict
-import time
-from dataclasses import dataclass
+from typing import Callable, Optional
+import asyncio
 import logging
-from app.database import get_db
-from app.models.blocked_ip import BlockedIP
+from app.config import get_settings
+from app.database.session import managed_transaction
+from app.models.blockedips import BlockedIP
+from app.core.blocked_ips import blocked_ip_cache
+from app.core.protocols import RateLimitBackend
+from app.core.ratelimit import RateLimit, create_backend
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class RateWindow:
-    count: int = 0
-    start_time: float = time.time()
-
 class RateLimitConfig:
     def __init__(
         self,
@@ -34,10 +28,12 @@ class RateLimitConfig:
 
 class AsyncRateLimiter:
     """
-    Asynchronous rate limiter with database persistence for blocked IPs
+    Asynchronous rate limiter with database persistence for blocked IPs.
+
+    Request counting is delegated to a RateLimitBackend: in-process state by
+    default, or Redis so the limit holds across workers.
     """
     _instance = None
-    _windows: Dict[str, Dict[str, RateWindow]] = defaultdict(lambda: defaultdict(RateWindow))
 
     def __new__(cls):
         if cls._instance is None:
@@ -50,48 +46,53 @@ class AsyncRateLimiter:
             return
         
         self._initialized = True
-        self._cleanup_task = None
-
-    async def _get_db_session(self) -> AsyncSession:
-        """Get database session"""
-        async for session in get_db():
-            return session
-
-    async def is_ip_blocked(self, ip: str, session: AsyncSession) -> bool:
-        """Check if IP is blocked in database"""
-        stmt = select(BlockedIP).where(BlockedIP.ip == ip)
-        result = await session.execute(stmt)
-        blocked_ip = result.scalar_one_or_none()
-        
-        if blocked_ip and blocked_ip.is_blocked():
-            return True
-        elif blocked_ip:
-            # Clean up expired block
-            await session.delete(blocked_ip)
-            await session.commit()
-        return False
-
-    async def block_ip(self, ip: str, minutes: int, session: AsyncSession) -> None:
-        """Block IP in database"""
-        expires_at = datetime.now(timezone.utc) + timedelta(minutes=minutes)
-        blocked_ip = BlockedIP(
-            ip=ip,
-            blocked_at=datetime.now(timezone.utc),
-            expires_at=expires_at
+        settings = get_settings()
+        self.algorithm = settings.RATE_LIMIT_ALGORITHM
+        self.backend: RateLimitBackend = create_backend(
+            settings.RATE_LIMIT_BACKEND, settings.REDIS_URL, max_keys=settings.RATE_LIMIT_MAX_KEYS
         )
-        session.add(blocked_ip)
-        await session.commit()
+        self.purge_seconds = settings.RATE_LIMIT_PURGE_SECONDS
+        self._purge_task: Optional[asyncio.Task] = None
+
+    async def _purge_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.purge_seconds)
+            try:
+                await self.backend.purge_expired()
+            except Exception as e:
+                logger.error(f"Rate limiter purge failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start purging expired limiter state; called from the app lifespan"""
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._purge_loop())
+
+    async def stop(self) -> None:
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+
+    async def is_ip_blocked(self, ip: str) -> bool:
+        """Check if IP is blocked, through the process-local blocked IP cache"""
+        return await blocked_ip_cache.is_blocked(ip)
+
+    async def block_ip(self, ip: str, minutes: int) -> None:
+        """Block IP in database and in this worker's cache"""
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+        async with managed_transaction() as session:
+            # merge: an expired row for this IP may still be awaiting the cache's purge
+            await session.merge(BlockedIP(
+                ip=ip,
+                blocked_at=datetime.now(timezone.utc),
+                expires_at=expires_at
+            ))
+        blocked_ip_cache.add(ip, expires_at)
         logger.warning(f"IP {ip} blocked until {expires_at}")
 
-    async def _clean_expired_windows(self, window_seconds: int) -> None:
-        """Clean expired rate windows"""
-        current_time = time.time()
-        for endpoint in list(self._windows.keys()):
-            for ip in list(self._windows[endpoint].keys()):
-                window = self._windows[endpoint][ip]
-                if current_time - window.start_time >= window_seconds:
-                    del self._windows[endpoint][ip]
-
     def rate_limit(
         self,
         max_requests: int = 5,
@@ -119,11 +120,8 @@ class AsyncRateLimiter:
                 ip = request.client.host
                 endpoint = request.url.path
 
-                # Get database session
-                session = await self._get_db_session()
-
                 # Check if IP is already blocked
-                if await self.is_ip_blocked(ip, session):
+                if await self.is_ip_blocked(ip):
                     raise HTTPException(
                         status_code=429,
                         detail={
@@ -132,24 +130,16 @@ class AsyncRateLimiter:
                         }
                     )
 
-                # Clean expired windows periodically
-                await self._clean_expired_windows(window_seconds)
-
                 # Check rate limit
-                window = self._windows[endpoint][ip]
-                current_time = time.time()
-
-                # Reset window if expired
-                if current_time - window.start_time >= window_seconds:
-                    window.count = 0
-                    window.start_time = current_time
-
-                window.count += 1
+                key = f"{endpoint}:{ip}"
+                result = await self.backend.hit(
+                    key, RateLimit(max_requests, window_seconds, self.algorithm)
+                )
 
                 # Block IP if limit exceeded
-                if window.count > max_requests:
-                    await self.block_ip(ip, block_minutes, session)
-                    del self._windows[endpoint][ip]
+                if not result.allowed:
+                    await self.block_ip(ip, block_minutes)
+                    await self.backend.reset(key)
                     raise HTTPException(
                         status_code=429,
                         detail={
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, or_, select, text
+
+from app.config import get_settings
+from app.database.session import AsyncSessionLocal, engine
+from app.models.tokens import Token
+from app.models.users import User  # noqa: F401  (resolves Token.user when run standalone)
+
+logger = logging.getLogger(__name__)
+
+# Postgres: address rows by ctid so each batch is a TID scan, and skip rows
+# another worker's reaper has already locked instead of waiting on them
+_PG_DELETE_BATCH = text(
+    "DELETE FROM tokens WHERE ctid IN ("
+    " SELECT ctid FROM tokens"
+    " WHERE expires_at < :cutoff OR (is_revoked AND updated_at < :cutoff)"
+    " LIMIT :batch_size FOR UPDATE SKIP LOCKED"
+    ")"
+)
+
+
+@dataclass
+class ReapReport:
+    deleted: int
+    batches: int
+    seconds: float
+
+
+class TokenReaper:
+    """
+    Deletes tokens that expired or were revoked more than ``retention``
+    ago, in batches of ``batch_size`` rows, each in its own short
+    transaction, pausing ``batch_pause_seconds`` between batches so the
+    reaper never holds locks or saturates I/O for long. Runs every
+    ``interval_seconds`` when started from the lifespan hook, or once
+    from the command line:
+
+        python -m app.core.token_reaper
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        batch_size: int,
+        batch_pause_seconds: float,
+        retention: timedelta,
+    ):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.retention = retention
+        self.last_report: Optional[ReapReport] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _delete_batch(self, cutoff: datetime) -> int:
+        async with AsyncSessionLocal() as session:
+            if engine.dialect.name == "postgresql":
+                result = await session.execute(
+                    _PG_DELETE_BATCH, {"cutoff": cutoff, "batch_size": self.batch_size}
+                )
+            else:
+                reapable = (
+                    select(Token.id)
+                    .where(or_(
+                        Token.expires_at < cutoff,
+                        Token.is_revoked.is_(True) & (Token.updated_at < cutoff),
+                    ))
+                    .limit(self.batch_size)
+                )
+                result = await session.execute(
+                    delete(Token).where(Token.id.in_(reapable)).execution_options(synchronize_session=False)
+                )
+            await session.commit()
+            return result.rowcount
+
+    async def run_once(self) -> ReapReport:
+        """Delete every reapable token, batch by batch."""
+        started = time.perf_counter()
+        cutoff = datetime.now(timezone.utc) - self.retention
+        deleted = batches = 0
+        while True:
+            count = await self._delete_batch(cutoff)
+            deleted += count
+            batches += 1
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause_seconds)
+
+        report = ReapReport(deleted=deleted, batches=batches, seconds=time.perf_counter() - started)
+        self.last_report = report
+        logger.info(
+            f"Token reaper deleted {report.deleted} rows in {report.batches} batches "
+            f"({report.seconds:.2f}s)"
+        )
+        return report
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Token reaper run failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+settings = get_settings()
+
+token_reaper = TokenReaper(
+    interval_seconds=settings.TOKEN_REAPER_INTERVAL_SECONDS,
+    batch_size=settings.TOKEN_REAPER_BATCH_SIZE,
+    batch_pause_seconds=settings.TOKEN_REAPER_BATCH_PAUSE_SECONDS,
+    retention=timedelta(hours=settings.TOKEN_REAPER_RETENTION_HOURS),
+)
+
+
+if __name__ == "__main__":
+    report = asyncio.run(token_reaper.run_once())
+    print(f"Deleted {report.deleted} tokens in {report.batches} batches ({report.seconds:.2f}s)")
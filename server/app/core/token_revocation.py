@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database.session import AsyncSessionLocal
+from app.models.tokens import GlobalTokenRevocation
+from app.models.users import User
+
+logger = logging.getLogger(__name__)
+
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def revocation_epoch(revoked_at: Optional[datetime]) -> int:
+    """
+    Global revocation epoch: the time of the latest "log out all users" in
+    whole microseconds (0: none). Tokens carry the epoch current when they
+    were issued in their ``gen`` claim and are revoked once a later epoch
+    exists. Comparing epochs rather than the whole-second ``iat`` keeps
+    tokens issued right after a revocation valid.
+    """
+    if revoked_at is None:
+        return 0
+    if revoked_at.tzinfo is None:
+        revoked_at = revoked_at.replace(tzinfo=timezone.utc)
+    return (revoked_at - _UNIX_EPOCH) // timedelta(microseconds=1)
+
+
+async def load_revocation_epoch(session: AsyncSession) -> int:
+    """Current global revocation epoch, read from the database."""
+    return revocation_epoch(await GlobalTokenRevocation.latest(session))
+
+
+class TokenRevocationCache:
+    """
+    Process-local map of users whose access tokens were revoked recently,
+    to the token version their tokens must carry from now on.
+
+    Revoking a user's tokens bumps ``users.token_version`` and stamps
+    ``tokens_revoked_at``; access tokens carry the version they were issued
+    with. Only bumps newer than the access token lifetime matter (older
+    tokens have expired), so the map stays small. A background task reloads
+    it every ``refresh_seconds``, so revocations made by other workers
+    propagate within one interval. While the snapshot is fresh, access
+    tokens can be verified from their signed claims alone; callers must
+    fall back to the database otherwise.
+
+    A global revocation ("log out all users") is tracked separately, as a
+    single epoch (see revocation_epoch).
+    """
+
+    def __init__(self, refresh_seconds: float, token_lifetime_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.token_lifetime_seconds = token_lifetime_seconds
+        self._versions: Dict[UUID, int] = {}
+        self._epoch = 0
+        self._refresh_lock = asyncio.Lock()
+        self._loaded_at: Optional[float] = None
+        self._retry_load_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        # Allow one missed refresh before callers fall back to the database
+        now = time.time() if now is None else now
+        return self._loaded_at is not None and now - self._loaded_at < 2 * self.refresh_seconds
+
+    async def ensure_fresh(self) -> bool:
+        """Load the snapshot if it is stale; False if it could not be loaded."""
+        now = time.time()
+        if self.is_fresh(now):
+            return True
+        if now < self._retry_load_at:
+            return False
+        try:
+            async with self._refresh_lock:
+                if not self.is_fresh():
+                    await self.refresh()
+            return True
+        except Exception as e:
+            self._retry_load_at = now + self.refresh_seconds
+            logger.error(f"Token revocation cache load failed: {str(e)}")
+            return False
+
+    def is_revoked(self, user_id: UUID, token_version: int, epoch: int = 0) -> bool:
+        return epoch < self._epoch or token_version < self._versions.get(user_id, 0)
+
+    def add(self, user_id: UUID, token_version: int) -> None:
+        """Record a revocation made by this worker without waiting for a refresh."""
+        if token_version > self._versions.get(user_id, 0):
+            self._versions[user_id] = token_version
+
+    def add_epoch(self, epoch: int) -> None:
+        """Record a global revocation made by this worker without waiting for a refresh."""
+        self._epoch = max(self._epoch, epoch)
+
+    async def refresh(self) -> None:
+        """Reload the global epoch and the token versions of users revoked within a token lifetime."""
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.token_lifetime_seconds)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(User.id, User.token_version).where(User.tokens_revoked_at >= since)
+            )
+            self._versions = {row.id: row.token_version for row in result}
+            self._epoch = await load_revocation_epoch(session)
+        self._loaded_at = time.time()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Token revocation cache refresh failed: {str(e)}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+settings = get_settings()
+
+token_revocations = TokenRevocationCache(
+    refresh_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS,
+    token_lifetime_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from app.config import get_settings
+from app.schemas.user import UserResponse
+
+
+class UserCache:
+    """
+    Per-worker TTL + LRU cache of authenticated users' UserResponse
+    snapshots, keyed by user id.
+
+    An entry is only served for the token version it was stored with, so
+    bumping a user's token version misses immediately. Writes through
+    UserRepository invalidate this worker's entry; other workers serve
+    theirs for at most ``ttl_seconds``.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[int, float, UserResponse]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: UUID, version: int) -> Optional[UserResponse]:
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            entry_version, expires_at, snapshot = entry
+            if entry_version == version and expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return snapshot
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def put(self, user_id: UUID, version: int, snapshot: UserResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[user_id] = (version, time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+settings = get_settings()
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,77 @@
+import json
+from typing import Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the wrapped statement's bind parameters."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class SortKey(FunctionElement):
+    """
+    Comparable form of a datetime expression for ORDER BY and seek predicates.
+
+    SQLite stores datetimes as text whose format depends on the writer:
+    CURRENT_TIMESTAMP omits fractional seconds, SQLAlchemy always writes
+    six digits. Equal instants then compare unequal, so keyset pages repeat
+    or skip rows. SQLite compares julianday() instead; other databases use
+    the expression unchanged so their indexes still apply.
+    """
+    inherit_cache = True
+
+    def __init__(self, expression):
+        super().__init__(expression)
+        self.type = expression.type
+
+
+@compiles(SortKey)
+def _compile_sort_key(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(SortKey, "sqlite")
+def _compile_sort_key_sqlite(element, compiler, **kw):
+    return "julianday(%s)" % compiler.process(element.clauses, **kw)
+
+
+def sort_key(expression):
+    """Wrap datetime expressions in SortKey; anything else is returned as is."""
+    if isinstance(expression.type, DateTime):
+        return SortKey(expression)
+    return expression
+
+
+def is_postgres(session: AsyncSession) -> bool:
+    """Whether ``session`` is bound to a Postgres database."""
+    return session.get_bind().dialect.name == "postgresql"
+
+
+async def estimate_row_count(session: AsyncSession, statement) -> Optional[int]:
+    """
+    Return the planner's row estimate for ``statement`` without executing it.
+
+    Returns None on non-Postgres databases so callers can fall back to an
+    exact count.
+    """
+    if not is_postgres(session):
+        return None
+
+    result = await session.execute(Explain(statement))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -15,9 +15,12 @@ async def drop_tables():
 
 # Optional: Initialize database
 async def init_db():
-    """Initialize the database with tables."""
+    """Initialize the database with tables and apply Postgres migrations."""
+    from app.database.migrations import run_migrations
+
     try:
         await create_tables()
+        await run_migrations()
     except Exception as e:
         print(f"Error initializing database: {e}")
         raise
\ No newline at end of file
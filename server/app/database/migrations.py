@@ -0,0 +1,110 @@
+import asyncio
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from app.core.logging import app_logger
+from app.database.session import engine
+from app.models.post import POST_SEARCH_VECTOR_SQL
+
+# Idempotent Postgres-only DDL applied on top of Base.metadata.create_all.
+# Each entry is (name, statements); statements must be safe to re-run.
+POSTGRES_MIGRATIONS: List[Tuple[str, List[str]]] = [
+    (
+        # Adding a STORED generated column rewrites the table, which computes
+        # search_vector for every existing row; no separate backfill is needed.
+        "posts_search_vector",
+        [
+            "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({POST_SEARCH_VECTOR_SQL}) STORED",
+            "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING gin (search_vector)",
+        ],
+    ),
+    (
+        # Trigram indexes back both the similarity operator (%) and
+        # ILIKE '%q%' substring matches used by UserRepository.search.
+        "users_trigram_search",
+        [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (username gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_users_slug_trgm ON users USING gin (slug gin_trgm_ops)",
+        ],
+    ),
+    (
+        # Lets the LIKE 'base-%' scans in app.database.slugs use an index
+        # range scan regardless of the database collation.
+        "slug_prefix_indexes",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_posts_slug_pattern ON posts (slug text_pattern_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_users_slug_pattern ON users (slug text_pattern_ops)",
+        ],
+    ),
+    (
+        # Version embedded in access token claims (app.utils.security)
+        "users_token_version",
+        [
+            "ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version integer NOT NULL DEFAULT 0",
+        ],
+    ),
+    (
+        # Lets the revocation cache load only recently bumped token versions
+        "users_tokens_revoked_at",
+        [
+            "ALTER TABLE users ADD COLUMN IF NOT EXISTS tokens_revoked_at timestamptz",
+            "CREATE INDEX IF NOT EXISTS ix_users_tokens_revoked_at ON users (tokens_revoked_at)",
+        ],
+    ),
+    (
+        # Tokens are stored as their SHA-256 digest (app.models.tokens).
+        # Refresh rows already held the hex digest; every other row held the
+        # plaintext. Dropping the plaintext column also drops its indexes.
+        "tokens_token_hash",
+        [
+            "ALTER TABLE tokens ADD COLUMN IF NOT EXISTS token_hash bytea",
+            """DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'tokens' AND column_name = 'token'
+                ) THEN
+                    UPDATE tokens SET token_hash = CASE
+                        WHEN token_type = 'refresh' AND token ~ '^[0-9a-f]{64}$' THEN decode(token, 'hex')
+                        ELSE sha256(convert_to(token, 'UTF8'))
+                    END
+                    WHERE token_hash IS NULL;
+                    ALTER TABLE tokens DROP COLUMN token;
+                END IF;
+            END $$""",
+            "ALTER TABLE tokens ALTER COLUMN token_hash SET NOT NULL",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_tokens_token_hash_type ON tokens (token_hash, token_type)",
+        ],
+    ),
+    (
+        # Token lookups only ever want unrevoked rows, so a partial index
+        # keeps revoked ones out of the lookup path; the unique index above
+        # still covers every row. The reaper (app.core.token_reaper) scans
+        # by expiry.
+        "tokens_active_indexes",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_tokens_active ON tokens (token_hash, token_type, expires_at) "
+            "WHERE is_revoked = false",
+            "CREATE INDEX IF NOT EXISTS ix_tokens_expires_at ON tokens (expires_at)",
+        ],
+    ),
+]
+
+
+async def run_migrations() -> None:
+    """Apply POSTGRES_MIGRATIONS. Does nothing on other databases."""
+    async with engine.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            return
+        for name, statements in POSTGRES_MIGRATIONS:
+            for statement in statements:
+                await conn.execute(text(statement))
+            app_logger.log_success(f"Applied migration {name}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_migrations())
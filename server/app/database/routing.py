@@ -0,0 +1,103 @@
+import itertools
+import threading
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+# bind_arguments key repositories pass to ask for a replica
+REPLICA = "replica"
+
+
+class ReplicaSet:
+    """Read replica engines and the policy used to pick one."""
+
+    def __init__(self, engines: List[AsyncEngine], strategy: str = ROUND_ROBIN):
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.engines = engines
+        self.strategy = strategy
+        self._cycle = itertools.cycle(engines)
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine:
+        if self.strategy == LEAST_CONNECTIONS:
+            return min(self.engines, key=lambda engine: engine.pool.checkedout())
+        with self._lock:
+            return next(self._cycle)
+
+
+class RequestRouting:
+    """Per-request routing state shared between the middleware and sessions."""
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned
+        self.wrote = False
+
+
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar("request_routing", default=None)
+
+
+def begin_request_routing(pinned: bool = False) -> RequestRouting:
+    routing = RequestRouting(pinned)
+    _request_routing.set(routing)
+    return routing
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica when asked and everything else to
+    the primary.
+
+    A statement goes to a replica only when it is executed with
+    ``bind_arguments={"replica": True}``, replicas are configured, and
+    neither this session nor the current request has written. One replica
+    is picked per session so session-local settings such as ``set_config``
+    stay on the same connection as the query that relies on them.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self._replica: Optional[Engine] = None
+        self.wrote = False
+
+    def mark_written(self) -> None:
+        self.wrote = True
+        routing = _request_routing.get()
+        if routing is not None:
+            routing.wrote = True
+
+    def _use_primary(self) -> bool:
+        if self.wrote or self._flushing:
+            return True
+        routing = _request_routing.get()
+        return routing is not None and (routing.pinned or routing.wrote)
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kw):
+        replica = kw.pop(REPLICA, False)
+        if replica and bind is None and self.replicas and not self._use_primary():
+            if self._replica is None:
+                self._replica = self.replicas.choose().sync_engine
+            return self._replica
+        return super().get_bind(mapper, clause=clause, bind=bind, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session: RoutingSession, flush_context) -> None:
+    session.mark_written()
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _after_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.mark_written()
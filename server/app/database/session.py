@@ -64,46 +64,106 @@
 #     """
 #     return session
 
-from typing import AsyncGenerator
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, HTTPException
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from app.config import get_settings
+from app.config.settings import Settings
+from app.database.pool import InstrumentedAsyncPool
+from app.database.routing import ReplicaSet, RoutingSession
 from contextlib import asynccontextmanager
 from app.exceptions.database import DatabaseError
 import logging
 
 logger = logging.getLogger(__name__)
 
+def create_engine_from_settings(settings: Settings, url: Optional[str] = None) -> AsyncEngine:
+    """
+    Build the async engine from Settings.
+
+    Pool size and overflow come from Settings.db_pool_size/db_max_overflow so
+    every worker gets its share of the server's connection budget. On
+    asyncpg, the prepared statement cache, statement_timeout,
+    application_name and JIT are set per connection.
+    """
+    url = make_url(url or settings.DATABASE_URL)
+    options = {"echo": settings.DB_ECHO, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite uses a single static connection; pool options do not apply
+        return create_async_engine(url, **options)
+
+    options.update(
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "application_name": settings.DB_APPLICATION_NAME,
+                "jit": "on" if settings.DB_JIT else "off",
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            },
+        }
+    return create_async_engine(url, **options)
+
 # Get settings instance
 settings = get_settings()
 
-# Debug: Print DATABASE_URL
-print(f"DATABASE_URL: {settings.DATABASE_URL}")
+engine = create_engine_from_settings(settings)
 
-# Create SQLAlchemy engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,  # Enable SQLAlchemy logging
-    pool_pre_ping=True,  # Enable connection pool "pre-ping" feature
-    pool_size=5,  # Set initial pool size
-    max_overflow=10,  # Allow up to 10 connections beyond pool_size
+replicas = ReplicaSet(
+    [create_engine_from_settings(settings, url) for url in settings.database_replica_urls],
+    strategy=settings.DB_REPLICA_STRATEGY,
 )
 
 # Create sessionmaker
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=replicas,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False
 )
 
 @asynccontextmanager
-async def managed_transaction():
+async def managed_transaction(session: Optional[AsyncSession] = None):
+    """
+    Commit on success and roll back on error. Unexpected errors are
+    re-raised as DatabaseError.
+
+    Wraps ``session`` when one is given (it is left open for its owner),
+    otherwise opens and closes a new session.
+    """
+    if session is not None:
+        try:
+            yield session
+            await session.commit()
+        except HTTPException:
+            # Repository errors already carry an API status; keep them intact
+            await session.rollback()
+            raise
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Transaction failed: {str(e)}")
+            raise DatabaseError(f"Transaction failed: {str(e)}")
+        return
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
+        except HTTPException:
+            # Repository errors already carry an API status; keep them intact
+            await session.rollback()
+            raise
         except Exception as e:
             await session.rollback()
             logger.error(f"Transaction failed: {str(e)}")
@@ -115,6 +175,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
+        except HTTPException:
+            # Already an API error (including the DatabaseError subclasses)
+            raise
         except Exception as e:
             logger.error(f"Database session error: {str(e)}")
             raise DatabaseError(f"Database session error: {str(e)}")
@@ -0,0 +1,158 @@
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from slugify import slugify
+from sqlalchemy import Integer, and_, case, cast, func, literal, or_, select, union_all
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+SLUG_RETRY_ATTEMPTS = 5
+
+# Distinct bases per stats query: one UNION ALL term each, and SQLite allows
+# at most 500 terms per compound SELECT. At about a dozen binds per base this
+# also stays well below the Postgres and SQLite bind parameter limits.
+SLUG_STATS_BATCH = 500
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def slug_matches(slug_column, base: str):
+    """
+    True where ``slug_column`` is ``base`` or a numbered sibling ``base-N``.
+
+    The LIKE prefix lets Postgres range-scan the slug index; the regex keeps
+    only numbered siblings so unrelated slugs such as ``base-other`` are ignored.
+    Suffixes are capped at nine digits so the integer cast in _slug_stats
+    cannot overflow; longer ones (e.g. from a title ending in a big number)
+    never come from allocation and are ignored too.
+    """
+    return or_(
+        slug_column == base,
+        and_(
+            slug_column.like(_escape_like(base) + "-%", escape="\\"),
+            slug_column.regexp_match(f"^{base}-[0-9]{{1,9}}$"),
+        ),
+    )
+
+
+def _slug_stats(slug_column, base: str, id_column=None, exclude_id=None):
+    """
+    Single-row aggregate describing how ``base`` is already used:
+    (base, whether ``base`` itself is taken, highest ``base-N`` suffix).
+    """
+    suffix = cast(func.substr(slug_column, len(base) + 2), Integer)
+    query = select(
+        literal(base).label("base"),
+        func.coalesce(func.sum(case((slug_column == base, 1), else_=0)), 0).label("taken"),
+        func.max(case((slug_column == base, 0), else_=suffix)).label("max_suffix"),
+    ).where(slug_matches(slug_column, base))
+    if id_column is not None and exclude_id is not None:
+        query = query.where(id_column != exclude_id)
+    return query
+
+
+def _assign(bases: Sequence[str], stats: Dict[str, tuple]) -> List[str]:
+    """Hand out slugs for ``bases`` in order, given (taken, max_suffix) per base."""
+    slugs = []
+    for base in bases:
+        taken, max_suffix = stats.get(base, (0, None))
+        if not taken:
+            slugs.append(base)
+            stats[base] = (1, max_suffix or 0)
+            continue
+        next_suffix = (max_suffix or 0) + 1
+        slugs.append(f"{base}-{next_suffix}")
+        stats[base] = (taken, next_suffix)
+    return slugs
+
+
+def allocate_slug(connection: Connection, slug_column, text: str, id_column=None, exclude_id=None) -> str:
+    """
+    Return the next free slug for ``text`` in one query.
+
+    Takes the sync Connection handed to mapper events, so it runs inside the
+    flush of an AsyncSession without the legacy Query API.
+    """
+    base = slugify(text)
+    row = connection.execute(_slug_stats(slug_column, base, id_column, exclude_id)).one()
+    return _assign([base], {base: (row.taken, row.max_suffix)})[0]
+
+
+async def allocate_slugs(
+    session: AsyncSession,
+    slug_column,
+    texts: Iterable[str],
+    id_column=None,
+    exclude_id=None,
+) -> List[str]:
+    """
+    Allocate unique slugs for a whole batch with one round-trip per
+    SLUG_STATS_BATCH distinct bases.
+
+    ``exclude_id`` ignores the row being renamed so it can keep its own slug.
+    """
+    bases = [slugify(text) for text in texts]
+    unique_bases = list(dict.fromkeys(bases))
+
+    stats = {}
+    for start in range(0, len(unique_bases), SLUG_STATS_BATCH):
+        result = await session.execute(
+            union_all(*[
+                _slug_stats(slug_column, base, id_column, exclude_id)
+                for base in unique_bases[start:start + SLUG_STATS_BATCH]
+            ])
+        )
+        stats.update((row.base, (row.taken, row.max_suffix)) for row in result)
+    return _assign(bases, stats)
+
+
+async def slug_update_value(session: AsyncSession, slug_column, text: str, id_column, row_id):
+    """
+    SET expression for the slug of row ``row_id`` when its source becomes ``text``.
+
+    The row keeps its current slug while that still derives from ``text``
+    (``base`` or ``base-N``), so rewriting an unchanged title does not move
+    the permalink; otherwise it gets the next free slug.
+    """
+    base = slugify(text)
+    allocated = (await allocate_slugs(
+        session, slug_column, [text], id_column=id_column, exclude_id=row_id
+    ))[0]
+    return case((slug_matches(slug_column, base), slug_column), else_=allocated)
+
+
+def is_slug_violation(error: IntegrityError) -> bool:
+    return "slug" in str(error.orig).lower()
+
+
+async def flush_with_slug_retry(
+    session: AsyncSession,
+    objects: List,
+    prepare: Optional[Callable[[], Awaitable[None]]] = None,
+    attempts: int = SLUG_RETRY_ATTEMPTS,
+) -> None:
+    """
+    Insert ``objects`` inside a SAVEPOINT, retrying when a concurrent writer
+    claimed the same slug between allocation and INSERT.
+
+    Slugs are cleared before a retry so the insert hooks allocate them again;
+    ``prepare`` runs before every attempt and can assign them up front
+    instead. Objects are re-added because rolling back the savepoint
+    expunges them.
+    """
+    for attempt in range(attempts):
+        try:
+            if attempt:
+                for obj in objects:
+                    obj.slug = None
+            if prepare is not None:
+                await prepare()
+            async with session.begin_nested():
+                session.add_all(objects)
+                await session.flush()
+            return
+        except IntegrityError as e:
+            if not is_slug_violation(e) or attempt == attempts - 1:
+                raise
@@ -5,6 +5,8 @@ from app.database.session import get_db_session
 from app.repositories.base import BaseRepository
 from app.repositories.post import PostRepository
 from app.models.post import Post
+from app.repositories.blocked_ip import BlockedIPRepository
+from app.models.blockedips import BlockedIP
 
 # Type alias for dependency injection
 DbSession = Annotated[Session, Depends(get_db_session)]
@@ -21,6 +23,18 @@ def get_post_repository(db: DbSession) -> PostRepository:
     """
     return PostRepository(Post, db)
 
+def get_blocked_ip_repository(db: DbSession) -> BlockedIPRepository:
+    """
+    Get BlockedIP repository instance with database session.
+    
+    Args:
+        db: Database session dependency
+    
+    Returns:
+        BlockedIPRepository: Repository instance for BlockedIP model
+    """
+    return BlockedIPRepository(BlockedIP, db)
+
  
 
 # Generic repository factory function
@@ -52,6 +52,14 @@ class TokenCreationError(JWTError):
 # class EmailSendError(Exception): 
 #     def __init__(self, detail: str): super().__init__(f"An error occurred while sending the email: {detail}")
 
+class ServiceOverloadedError(HTTPException):
+    def __init__(self, detail: str = "Service temporarily overloaded", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)}
+        )
+
 class EmailSendError(HTTPException):
     def __init__(self, detail: str = "Failed to send email"):
         super().__init__(
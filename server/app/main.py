@@ -3,9 +3,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.api.v1.endpoints import router
 from app.database import init_db
+from app.core.blocked_ips import blocked_ip_cache
+from app.core.ratelimiter import rate_limiter
+from app.core.token_revocation import token_revocations
+from app.core.token_reaper import token_reaper
+from app.utils.password import PasswordHasher
 # from app.config import Settings
 from app.config import get_settings
 from app.middleware.ip_address_middleware import IPAddressMiddleware
+from app.middleware.rate_limit_middleware import RateLimitMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
  
 
  
@@ -18,9 +25,18 @@ async def lifespan(app: FastAPI):
     # Startup
      
     # await init_db()
+    blocked_ip_cache.start()
+    rate_limiter.start()
+    token_revocations.start()
+    if get_settings().TOKEN_REAPER_ENABLED:
+        token_reaper.start()
     yield
     # Shutdown
-    # Add cleanup code here if needed
+    await token_reaper.stop()
+    await token_revocations.stop()
+    PasswordHasher.shutdown()
+    await rate_limiter.stop()
+    await blocked_ip_cache.stop()
 
 def create_application() -> FastAPI:
     """
@@ -38,7 +54,12 @@ def create_application() -> FastAPI:
     )
 
     # Configure middlewares
-    app.add_middleware(IPAddressMiddleware)
+    app.add_middleware(RateLimitMiddleware, policies=settings.RATE_LIMIT_POLICIES)
+    app.add_middleware(IPAddressMiddleware, trusted_proxies=settings.trusted_proxies)
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS if settings.database_replica_urls else 0,
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOW_ORIGINS,
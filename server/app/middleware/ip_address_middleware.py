@@ -1,17 +1,65 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Final
-
-class IPAddressMiddleware(BaseHTTPMiddleware):
-    X_FORWARDED_FOR: Final[str] = "X-Forwarded-For"
-    
-    async def dispatch(self, request: Request, call_next):
-        client_ip = self._get_client_ip(request)
-        request.state.client_ip = client_ip
-        return await call_next(request)
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request headers or client host"""
-        if x_forwarded_for := request.headers.get(self.X_FORWARDED_FOR):
-            return x_forwarded_for.split(",")[0].strip()
-        return request.client.host
\ No newline at end of file
+from functools import lru_cache
+from ipaddress import ip_address, ip_network
+from typing import Final, Iterable, List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class IPAddressMiddleware:
+    """
+    Resolve the client IP and store it as ``scope["state"]["client_ip"]``
+    (``request.state.client_ip`` in handlers).
+
+    ``X-Forwarded-For`` is only honoured when the direct peer is a trusted
+    proxy. Its hops are then read right to left and the first address that
+    is not a trusted proxy is the client, so a client cannot spoof its IP by
+    sending its own header.
+    """
+    X_FORWARDED_FOR: Final[bytes] = b"x-forwarded-for"
+
+    def __init__(self, app: ASGIApp, trusted_proxies: Iterable[str] = ()):
+        self.app = app
+        networks = [ip_network(cidr.strip(), strict=False) for cidr in trusted_proxies if cidr.strip()]
+        self._networks = networks
+
+        @lru_cache(maxsize=1024)
+        def is_trusted(address: str) -> bool:
+            try:
+                ip = ip_address(address)
+            except ValueError:
+                return False
+            return any(ip in network for network in networks)
+
+        self._is_trusted = is_trusted
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            scope.setdefault("state", {})["client_ip"] = self._get_client_ip(scope)
+        await self.app(scope, receive, send)
+
+    def _get_client_ip(self, scope: Scope) -> Optional[str]:
+        """Extract client IP from trusted X-Forwarded-For hops or the peer address"""
+        client = scope.get("client")
+        peer = client[0] if client else None
+        if peer is None or not self._networks or not self._is_trusted(peer):
+            return peer
+
+        hops: List[str] = []
+        for name, value in scope.get("headers", []):
+            if name == self.X_FORWARDED_FOR:
+                hops.extend(value.decode("latin-1").split(","))
+
+        client_ip = peer
+        for hop in reversed(hops):
+            hop = hop.strip()
+            if not hop:
+                continue
+            try:
+                hop = str(ip_address(hop))
+            except ValueError:
+                # Malformed hop: do not trust anything further left
+                break
+            client_ip = hop
+            if not self._is_trusted(hop):
+                break
+        return client_ip
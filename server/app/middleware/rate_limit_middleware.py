@@ -0,0 +1,116 @@
+import math
+from typing import List, Optional, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.ratelimit import RateLimit, RateLimitResult
+from app.core.ratelimit.policies import RateLimitPolicy
+from app.core.ratelimiter import AsyncRateLimiter, rate_limiter
+
+
+class RateLimitMiddleware:
+    """
+    Apply the configured per-route rate limits before routing, so rejected
+    clients never reach body parsing or dependencies such as a database
+    session.
+
+    Responses on limited routes carry ``RateLimit-Limit``,
+    ``RateLimit-Remaining``, ``RateLimit-Reset`` and ``RateLimit-Policy``;
+    rejections add ``Retry-After``. Register it inside IPAddressMiddleware so
+    the resolved client IP is available in ``scope["state"]``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: List[RateLimitPolicy],
+        limiter: Optional[AsyncRateLimiter] = None
+    ):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+        self._policies = [
+            (
+                policy,
+                compile_path("{_prefix:path}" + policy.path)[0],
+                policy.rate_limit(self.limiter.algorithm),
+                {method.upper() for method in policy.methods},
+            )
+            for policy in policies
+        ]
+
+    def _match(self, method: str, path: str) -> Optional[Tuple[RateLimitPolicy, RateLimit]]:
+        for policy, regex, limit, methods in self._policies:
+            if (not methods or method in methods) and regex.match(path):
+                return policy, limit
+        return None
+
+    @staticmethod
+    def _client_ip(scope: Scope) -> str:
+        client_ip = scope.get("state", {}).get("client_ip")
+        if client_ip:
+            return client_ip
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    def _headers(limit: RateLimit, result: RateLimitResult) -> List[Tuple[str, str]]:
+        return [
+            ("RateLimit-Limit", str(limit.limit)),
+            ("RateLimit-Remaining", str(result.remaining)),
+            ("RateLimit-Reset", str(math.ceil(result.reset_after))),
+            ("RateLimit-Policy", f"{limit.limit};w={math.ceil(limit.window_seconds)}"),
+        ]
+
+    @staticmethod
+    def _reject(error: str, retry_after: float, headers: List[Tuple[str, str]]) -> JSONResponse:
+        seconds = max(1, math.ceil(retry_after))
+        return JSONResponse(
+            status_code=429,
+            content={"detail": {"error": error, "try_again_after": f"{seconds} seconds"}},
+            headers=dict(headers + [("Retry-After", str(seconds))]),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        matched = self._match(scope["method"], scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        policy, limit = matched
+        ip = self._client_ip(scope)
+
+        if await self.limiter.is_ip_blocked(ip):
+            response = self._reject(
+                "IP is blocked due to excessive requests", policy.block_minutes * 60 or limit.window_seconds, []
+            )
+            await response(scope, receive, send)
+            return
+
+        key = f"{policy.path}:{ip}"
+        result = await self.limiter.backend.hit(key, limit)
+        headers = self._headers(limit, result)
+
+        if not result.allowed:
+            retry_after = result.retry_after
+            if policy.block_minutes:
+                await self.limiter.block_ip(ip, policy.block_minutes)
+                await self.limiter.backend.reset(key)
+                retry_after = policy.block_minutes * 60
+            response = self._reject("Too many requests", retry_after, headers)
+            await response(scope, receive, send)
+            return
+
+        raw_headers = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *raw_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,49 @@
+from http.cookies import SimpleCookie
+from typing import Final
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.routing import begin_request_routing
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin a client to the primary database for a short window after it writes.
+
+    Each request gets a RequestRouting context that sessions consult before
+    sending a read to a replica. When the request wrote, the response sets a
+    short-lived cookie; requests carrying it read from the primary so the
+    client sees its own writes despite replica lag.
+    """
+    COOKIE_NAME: Final[str] = "db_primary"
+
+    def __init__(self, app: ASGIApp, window_seconds: int):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        routing = begin_request_routing(pinned=self._has_cookie(scope))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and routing.wrote:
+                cookie = (
+                    f"{self.COOKIE_NAME}=1; Max-Age={self.window_seconds}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _has_cookie(self, scope: Scope) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == b"cookie":
+                cookies = SimpleCookie()
+                cookies.load(value.decode("latin-1"))
+                if self.COOKIE_NAME in cookies:
+                    return True
+        return False
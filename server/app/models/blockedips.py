@@ -7,6 +7,7 @@ from app.database.base_model import BaseModel
 class BlockedIP(BaseModel):
     __tablename__ = "blocked_ips"
 
+    # Single address, or a range in CIDR notation (see app.utils.ip_ranges.canonical_block)
     ip = Column(String, primary_key=True)
     blocked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=True)
@@ -3,12 +3,23 @@ from sqlalchemy.sql import func
 # from app.database import Base
 from app.database.base_model import BaseModel
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import validates, object_session
+from sqlalchemy.orm import validates
 import uuid
-from slugify import slugify
+from app.database.slugs import allocate_slug
+
+# Full-text search document for posts. The generated ``search_vector`` column
+# and its GIN index are Postgres-only and created by app.database.migrations,
+# so the column is deliberately not mapped here.
+POST_SEARCH_CONFIG = "english"
+POST_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', coalesce(author, '')), 'B') || "
+    f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', coalesce(content, '')), 'C')"
+)
 
 class Post(BaseModel):
     __tablename__ = "posts"
+    __slug_source__ = "title"
     extend_existing=True
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String, nullable=False)
@@ -23,30 +34,24 @@ class Post(BaseModel):
             raise ValueError("Title cannot be empty")
         return title
     
-    def generate_slug(self) -> str:
-        """Generate a slug from the title"""
-        base_slug = slugify(self.title)
-        slug = base_slug
-        counter = 1
-
-        while True:
-            existing_slug = object_session(self).query(Post).filter(
-                Post.slug == slug,
-                Post.id != self.id,
-            ).first()
-            if not existing_slug:
-                break
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        return slug
+    def generate_slug(self, connection) -> str:
+        """Generate a unique slug from the title"""
+        return allocate_slug(
+            connection,
+            Post.__table__.c.slug,
+            self.title,
+            id_column=Post.__table__.c.id,
+            exclude_id=self.id,
+        )
     
 
 @event.listens_for(Post, 'before_insert')
 def generate_slug_on_insert(mapper, connection, target):
-    if target.title:
-        target.slug = target.generate_slug()
+    # Slugs pre-allocated in bulk (see BaseRepository.bulk_create) are kept
+    if target.title and not target.slug:
+        target.slug = target.generate_slug(connection)
 
 @event.listens_for(Post, 'before_update')
 def update_slug_on_title_change(mapper, connection, target):
     if inspect(target).attrs.title.history.has_changes() and target.title:
-        target.slug = target.generate_slug()
+        target.slug = target.generate_slug(connection)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, LargeBinary, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import UUID
 from app.database.base_model import BaseModel
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
+from app.utils.security import token_digest
 
 ALLOWED_TOKEN_TYPES = {
     'access': 'access',
@@ -19,7 +22,8 @@ class Token(BaseModel):
     __tablename__ = "tokens"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
-    token = Column(String(255), nullable=False, unique=True, index=True)
+    # SHA-256 of the token; the token itself is never stored
+    token_hash = Column(LargeBinary(32), nullable=False)
     token_type = Column(String(50), nullable=False)  # Use string for token_type
     expires_at = Column(DateTime(timezone=True), nullable=False)
     is_revoked = Column(Boolean, default=False)
@@ -28,8 +32,25 @@ class Token(BaseModel):
     # relationship
     user = relationship('User', back_populates="tokens")
 
-    def __init__(self, **kwargs):
+    __table_args__ = (
+        Index("ix_tokens_token_hash_type", "token_hash", "token_type", unique=True),
+        Index(
+            "ix_tokens_active", "token_hash", "token_type", "expires_at",
+            postgresql_where=is_revoked.is_(False),
+            sqlite_where=is_revoked.is_(False),
+        ),
+        Index("ix_tokens_expires_at", "expires_at"),
+    )
+
+    # Plaintext of a token created in this process (e.g. to email it);
+    # None for rows loaded from the database
+    token = None
+
+    def __init__(self, token=None, **kwargs):
         super().__init__(**kwargs)
+        if token is not None:
+            self.token = token
+            self.token_hash = token_digest(token)
         if self.token_type not in ALLOWED_TOKEN_TYPES.values():
             raise ValueError(f"Invalid token_type: {self.token_type}. Must be one of {ALLOWED_TOKEN_TYPES.values()}")
 
@@ -38,3 +59,20 @@ class Token(BaseModel):
 
     def is_valid(self) -> bool:
         return not (self.is_expired() or self.is_revoked)
+
+
+class GlobalTokenRevocation(BaseModel):
+    """
+    One row per "log out all users". Every access and refresh token issued
+    before the latest ``revoked_at`` is invalid, so revoking everyone is a
+    single insert regardless of the number of users or tokens.
+    """
+    __tablename__ = "global_token_revocations"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    @classmethod
+    async def latest(cls, session: AsyncSession) -> Optional[datetime]:
+        """Time of the most recent global revocation, if any."""
+        return await session.scalar(select(func.max(cls.revoked_at)))
@@ -6,7 +6,6 @@ import uuid
 from typing import Optional, List
 
 from email_validator import validate_email, EmailNotValidError
-from slugify import slugify
 from sqlalchemy import (
     Boolean,
     Column,
@@ -22,11 +21,12 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import validates, relationship, object_session
+from sqlalchemy.orm import validates, relationship
 from sqlalchemy.sql import func
 
 from app.core.logging import app_logger, log_operation
 from app.database.base_model import BaseModel
+from app.database.slugs import allocate_slug
 from app.exceptions.database import (
     InvalidDataException,
     DatabaseCommitException,
@@ -37,6 +37,7 @@ from app.models.tokens import Token
 from app.models.roles import Role
 from app.models.models import user_roles
 from app.utils.password import PasswordHasher
+from app.utils.security import token_digest
 
 # Environment variables with defaults
 ACCOUNT_UNLOCK_DURATION = int(os.getenv("ACCOUNT_UNLOCK_DURATION", 15))
@@ -48,6 +49,7 @@ class User(BaseModel):
     User model representing application users with authentication and authorization capabilities.
     """
     __tablename__ = 'users'
+    __slug_source__ = 'username'
     
     # Primary columns
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -65,6 +67,10 @@ class User(BaseModel):
     last_login_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
     last_login_ip = Column(String(255), nullable=True, index=True)
     account_unlock = Column(DateTime, nullable=True)
+    # Embedded in access tokens; bumping it (and stamping tokens_revoked_at)
+    # invalidates every access token issued before
+    token_version = Column(Integer, nullable=False, default=0, server_default='0')
+    tokens_revoked_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
     # Relationships
     tokens = relationship("Token", back_populates="user", cascade="all, delete-orphan")
@@ -106,25 +112,16 @@ class User(BaseModel):
             )
             raise ValueError(str(e))
 
-    def generate_slug(self) -> str:
+    def generate_slug(self, connection) -> str:
         """Generate a unique slug from the username."""
         try:
-            base_slug = slugify(self.username)
-            slug = base_slug
-            counter = 1
-
-            while True:
-                existing_slug = (
-                    object_session(self)
-                    .query(User)
-                    .filter(User.slug == slug, User.id != self.id)
-                    .first()
-                )
-                if not existing_slug:
-                    break
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            return slug
+            return allocate_slug(
+                connection,
+                User.__table__.c.slug,
+                self.username,
+                id_column=User.__table__.c.id,
+                exclude_id=self.id,
+            )
         except Exception as e:
             app_logger.log_error(
                 "Slug generation failed",
@@ -189,7 +186,7 @@ class User(BaseModel):
         """Verify if a given token is valid and not expired."""
         try:
             token_record = next(
-                (t for t in self.tokens if t.token == token and t.token_type == token_type),
+                (t for t in self.tokens if t.token_hash == token_digest(token) and t.token_type == token_type),
                 None
             )
             
@@ -222,6 +219,14 @@ class User(BaseModel):
             )
             raise
 
+    async def check_password_async(self, password: str) -> bool:
+        """Verify the password on the hashing pool, without blocking the event loop."""
+        return await PasswordHasher.check_password(password, self.password_hash)
+
+    async def set_password_async(self, password: str) -> None:
+        """Hash and set the password on the hashing pool."""
+        self.password_hash = await PasswordHasher.hash_password(password)
+
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
         try:
@@ -316,10 +321,10 @@ class User(BaseModel):
 # SQLAlchemy Event Listeners
 @event.listens_for(User, 'before_insert')
 def generate_slug_on_insert(mapper, connection, target):
-    """Generate slug before inserting new user."""
-    if target.username:
+    """Generate slug before inserting new user, unless one was pre-allocated."""
+    if target.username and not target.slug:
         try:
-            target.slug = target.generate_slug()
+            target.slug = target.generate_slug(connection)
         except Exception as e:
             app_logger.log_error(
                 "Generating slug on insert failed",
@@ -333,7 +338,7 @@ def generate_slug_on_update(mapper, connection, target):
     """Update slug if username changes."""
     if inspect(target).attrs.username.history.has_changes() and target.username:
         try:
-            target.slug = target.generate_slug()
+            target.slug = target.generate_slug(connection)
         except Exception as e:
             app_logger.log_error(
                 "Updating slug failed",
@@ -2,11 +2,16 @@ from fastapi import HTTPException, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from typing import Optional, List
+from uuid import UUID
 from app.models.users import User
 from app.repositories.base import BaseRepository
 from app.core.logging import app_logger
 from app.exceptions.database import DatabaseError
-from app.utils.security import JWTHandler
+from app.utils.security import JWTHandler, TokenPrincipal
+from app.core.token_revocation import load_revocation_epoch, token_revocations
+from app.core.user_cache import user_cache
+from app.schemas.user import UserResponse
+from app.config import get_settings
 from sqlalchemy.exc import SQLAlchemyError
 from app.database.session import get_db_session, managed_transaction
 
@@ -23,7 +28,7 @@ class AuthRepository(BaseRepository):
         Args:
             session: AsyncSession from get_db_session dependency
         """
-        super().__init__(session, User)
+        super().__init__(User, session)
         self._session = session
 
     async def get_user_by_token(self, token: str) -> User:
@@ -73,15 +78,104 @@ class AuthRepository(BaseRepository):
             )
             raise credentials_exception
 
-    async def verify_active_user(self, user: User) -> User:
+    async def get_principal(self, token: str) -> TokenPrincipal:
+        """
+        Authenticate an access token, from its signed claims when possible.
+
+        Tokens carrying user claims are trusted without a database round
+        trip while the revocation cache is fresh. Older tokens, or any token
+        while the cache cannot be loaded, are checked against the user's
+        current token version in the database.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            TokenPrincipal: The authenticated user's claims
+
+        Raises:
+            HTTPException: If the token is invalid, revoked or its user not found
+        """
+        credentials_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+        try:
+            payload = JWTHandler.decode_token(token)
+            if payload.get("sub") is None:
+                raise credentials_exception
+
+            if (
+                get_settings().AUTH_STATELESS_ACCESS_TOKENS
+                and JWTHandler.has_user_claims(payload)
+                and await token_revocations.ensure_fresh()
+            ):
+                principal = TokenPrincipal.from_claims(payload)
+                if token_revocations.is_revoked(principal.id, principal.token_version, payload.get("gen", 0)):
+                    raise credentials_exception
+                return principal
+
+            async with managed_transaction(self._session):
+                user = await self._session.get(User, UUID(payload["sub"]))
+                epoch = await load_revocation_epoch(self._session)
+            # Tokens issued before claims were embedded count as version 0
+            if user is None or payload.get("ver", 0) < user.token_version:
+                raise credentials_exception
+            if payload.get("gen", 0) < epoch:
+                raise credentials_exception
+            return TokenPrincipal.from_user(user, issued_at=payload.get("iat", 0))
+
+        except Exception as e:
+            app_logger.log_error(
+                "Token validation failed",
+                error=str(e),
+                extra={"token": token[:10]}  # Log only first 10 chars of token
+            )
+            raise credentials_exception
+
+    async def get_active_user(self, user_id) -> User:
+        """
+        Load an authenticated user by id.
+
+        Raises:
+            HTTPException: If the user no longer exists or is inactive
+        """
+        async with managed_transaction(self._session):
+            user = await self._session.get(User, user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return await self.verify_active_user(user)
+
+    async def get_user_snapshot(self, principal: TokenPrincipal) -> UserResponse:
+        """
+        Profile of an authenticated user, served from the per-worker user
+        cache when it holds an entry for the principal's token version.
+
+        Raises:
+            HTTPException: If the user no longer exists or is inactive
+        """
+        snapshot = user_cache.get(principal.id, principal.token_version)
+        if snapshot is None:
+            user = await self.get_active_user(principal.id)
+            snapshot = UserResponse.model_validate(user, from_attributes=True)
+            user_cache.put(principal.id, principal.token_version, snapshot)
+        return snapshot
+
+    async def verify_active_user(self, user):
         """
         Verify if user is active.
         
         Args:
-            user: User to verify
+            user: User or TokenPrincipal to verify
             
         Returns:
-            User: The verified active user
+            The verified active user
             
         Raises:
             HTTPException: If user is inactive
@@ -93,15 +187,15 @@ class AuthRepository(BaseRepository):
             )
         return user
 
-    async def verify_admin_user(self, user: User) -> User:
+    async def verify_admin_user(self, user):
         """
         Verify if user has admin privileges.
         
         Args:
-            user: User to verify
+            user: User or TokenPrincipal to verify
             
         Returns:
-            User: The verified admin user
+            The verified admin user
             
         Raises:
             HTTPException: If user is not an admin
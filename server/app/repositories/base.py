@@ -1,14 +1,35 @@
-from typing import TypeVar, Generic, Type, Optional, List, Any, Dict
+from datetime import datetime
+from typing import TypeVar, Generic, Type, Optional, List, Any, Dict, Tuple
 from uuid import UUID
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, String, or_, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, insert, update, delete, String, or_, and_, func, tuple_, literal, false
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from pydantic import BaseModel
 from app.database import Base
-from app.exceptions.database import DatabaseError, NotFoundException, InvalidFieldException
+from app.exceptions.database import (
+    DatabaseError,
+    NotFoundException,
+    InvalidFieldException,
+    InvalidDataException
+)
 from app.core.logging import app_logger
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, CountMode, BulkResult
 from app.database.session import managed_transaction
+from app.database.expressions import estimate_row_count, sort_key
+from app.database.routing import REPLICA
+from app.database.slugs import (
+    SLUG_RETRY_ATTEMPTS,
+    allocate_slugs,
+    flush_with_slug_retry,
+    is_slug_violation,
+    slug_update_value
+)
+from app.utils.cursor import CursorHandler, CURSOR_NEXT, CURSOR_PREV
+
+POSTGRES_MAX_BIND_PARAMS = 32767
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -29,21 +50,164 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         }
         return {k: v for k, v in context.items() if v is not None}
 
+    def _resolve_order_by(self, order_by: Optional[List[str]]) -> List[Tuple[Any, bool]]:
+        """Translate an order_by list into (column, descending) pairs."""
+        columns = []
+        for field in order_by or []:
+            descending = field.startswith('-')
+            name = field[1:] if descending else field
+            if name not in self.model.__table__.columns:
+                raise InvalidFieldException(f"Field '{name}' is invalid for {self.model.__name__}")
+            columns.append((self.model.__table__.columns[name], descending))
+        return columns
+
+    def _keyset_columns(self, order_by: Optional[List[str]]) -> List[Tuple[Any, bool]]:
+        """Sort columns for keyset pagination, always ending with the id tie-breaker."""
+        columns = [
+            (column, descending)
+            for column, descending in self._resolve_order_by(order_by)
+            if column.key != "id"
+        ]
+        last_descending = columns[-1][1] if columns else False
+        columns.append((self.model.__table__.columns["id"], last_descending))
+        return columns
+
+    @staticmethod
+    def _order_clause(column, descending: bool):
+        """ORDER BY clause with explicit NULL placement matching _seek_predicate."""
+        key = sort_key(column)
+        clause = key.desc() if descending else key.asc()
+        if column.nullable:
+            clause = clause.nulls_first() if descending else clause.nulls_last()
+        return clause
+
+    @staticmethod
+    def _seek_predicate(columns: List[Tuple[Any, bool]], values: List[Any]):
+        """
+        Build the WHERE clause selecting rows strictly after ``values`` in the
+        given ordering. Uniform, non-nullable orderings compile to a row-value
+        comparison ``(col, id) > (...)`` so Postgres can use a composite index;
+        mixed directions or nullable columns fall back to the expanded form.
+        Values are bound with their column's type and compared through
+        sort_key, like the ORDER BY of _order_clause.
+        """
+        def bound(column, value):
+            return sort_key(literal(value, column.type))
+
+        directions = {descending for _, descending in columns}
+        nullable = any(column.nullable for column, _ in columns)
+
+        if len(directions) == 1 and not nullable and None not in values:
+            left = tuple_(*[sort_key(column) for column, _ in columns])
+            right = tuple_(*[bound(column, value) for (column, _), value in zip(columns, values)])
+            return left < right if directions.pop() else left > right
+
+        def equal(column, value):
+            return column.is_(None) if value is None else sort_key(column) == bound(column, value)
+
+        def after(column, value, descending):
+            # NULLs sort last ascending and first descending (see _order_clause)
+            if descending:
+                return column.is_not(None) if value is None else sort_key(column) < bound(column, value)
+            if value is None:
+                return false()
+            if column.nullable:
+                return or_(sort_key(column) > bound(column, value), column.is_(None))
+            return sort_key(column) > bound(column, value)
+
+        clauses = []
+        for index, (column, descending) in enumerate(columns):
+            prefix = [equal(c, v) for (c, _), v in zip(columns[:index], values[:index])]
+            clauses.append(and_(*prefix, after(column, values[index], descending)))
+        return or_(*clauses)
+
+    def _cursor_values(self, columns: List[Tuple[Any, bool]], item: ModelType) -> List[Any]:
+        return [getattr(item, column.key) for column, _ in columns]
+
+    def _parse_cursor_values(self, columns: List[Tuple[Any, bool]], values: List[Any]) -> List[Any]:
+        """Restore the python types of decoded cursor values."""
+        if len(values) != len(columns):
+            raise InvalidDataException("Invalid pagination cursor")
+        parsed = []
+        try:
+            for (column, _), value in zip(columns, values):
+                python_type = column.type.python_type
+                if value is None or isinstance(value, python_type):
+                    parsed.append(value)
+                elif python_type is datetime:
+                    parsed.append(datetime.fromisoformat(value))
+                else:
+                    parsed.append(python_type(value))
+        except (TypeError, ValueError):
+            raise InvalidDataException("Invalid pagination cursor")
+        return parsed
+
+    @staticmethod
+    def _read_bind(use_replica: bool = True) -> Dict[str, Any]:
+        """
+        bind_arguments for read queries. The routing session only honours
+        the replica hint when no write has happened in the session or the
+        current request.
+        """
+        return {REPLICA: use_replica}
+
+    async def _count(
+        self, query, count_mode: CountMode, use_replica: bool = True
+    ) -> Tuple[Optional[int], CountMode]:
+        """
+        Count the rows matched by ``query`` according to ``count_mode``.
+
+        Returns the total and the mode that actually produced it: estimated
+        counts fall back to an exact count on databases without a planner
+        estimate.
+        """
+        if count_mode == CountMode.NONE:
+            return None, count_mode
+
+        if count_mode == CountMode.ESTIMATED:
+            estimate = await estimate_row_count(self.db, query)
+            if estimate is not None:
+                return estimate, count_mode
+
+        total_query = select(func.count()).select_from(self.model)
+        if query._where_criteria:
+            total_query = total_query.where(*query._where_criteria)
+
+        total_result = await self.db.execute(total_query, bind_arguments=self._read_bind(use_replica))
+        return total_result.scalar(), CountMode.EXACT
+
     async def get_all(
         self, 
         *, 
         skip: int = 0, 
         limit: int = 100, 
         order_by: Optional[List[str]] = None, 
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        use_replica: bool = True
     ) -> PaginatedResponse[ModelType]:
-        """Retrieve all records with optional filters, pagination, and ordering."""
+        """
+        Retrieve all records with optional filters, pagination, and ordering.
+
+        Offset pagination (skip/limit) is used unless a ``cursor`` returned by
+        a previous call is supplied, in which case the page is fetched with a
+        keyset seek instead and ``skip`` is ignored. Both modes return
+        ``next_cursor``/``prev_cursor`` so clients can switch to keyset paging
+        after the first page.
+
+        ``count_mode`` selects how ``total`` is computed (see CountMode);
+        ``has_more`` is always derived from fetching one extra row. Reads go
+        to a replica when one is configured unless ``use_replica`` is False.
+        """
         context = self._log_context(
             "get_all",
             skip=skip,
             limit=limit,
             order_by=order_by,
-            filters=filters
+            filters=filters,
+            cursor=cursor,
+            count_mode=count_mode
         )
         
         try:
@@ -58,24 +222,64 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
                 for field, value in filters.items():
                     query = query.filter(getattr(self.model, field) == value)
 
-            if order_by:
-                for field in order_by:
-                    if field.startswith('-'):
-                        query = query.order_by(getattr(self.model, field[1:]).desc())
-                    else:
-                        query = query.order_by(getattr(self.model, field).asc())
+            columns = self._keyset_columns(order_by)
 
             # Count total items
-            total_query = select(func.count()).select_from(self.model)
-            if query._where_criteria:
-                total_query = total_query.where(*query._where_criteria)
-                
-            total_result = await self.db.execute(total_query)
-            total = total_result.scalar()
+            total, count_mode = await self._count(query, count_mode, use_replica)
+
+            if cursor:
+                decoded = CursorHandler.decode(cursor)
+                if decoded["order_by"] != list(order_by or []):
+                    raise InvalidDataException("Pagination cursor does not match order_by")
+                backwards = decoded["direction"] == CURSOR_PREV
+                values = self._parse_cursor_values(columns, decoded["values"])
+
+                seek_columns = [(column, descending != backwards) for column, descending in columns]
+                query = query.where(self._seek_predicate(seek_columns, values))
+                query = query.order_by(*[
+                    self._order_clause(column, descending)
+                    for column, descending in seek_columns
+                ])
+
+                # Fetch one extra row to know whether another page exists
+                result = await self.db.execute(
+                    query.limit(limit + 1), bind_arguments=self._read_bind(use_replica)
+                )
+                items = list(result.scalars().all())
+                has_extra = len(items) > limit
+                items = items[:limit]
+                if backwards:
+                    items.reverse()
+
+                has_next = True if backwards else has_extra
+                has_prev = has_extra if backwards else True
+                page = None
+            else:
+                query = query.order_by(*[
+                    self._order_clause(column, descending)
+                    for column, descending in columns
+                ])
+
+                # Get paginated results, plus one row to detect a next page
+                result = await self.db.execute(
+                    query.offset(skip).limit(limit + 1), bind_arguments=self._read_bind(use_replica)
+                )
+                items = list(result.scalars().all())
+                has_next = len(items) > limit
+                items = items[:limit]
 
-            # Get paginated results
-            result = await self.db.execute(query.offset(skip).limit(limit))
-            items = result.scalars().all()
+                has_prev = skip > 0
+                page = (skip // limit) + 1
+
+            next_cursor = prev_cursor = None
+            if items and has_next:
+                next_cursor = CursorHandler.encode(
+                    self._cursor_values(columns, items[-1]), order_by, CURSOR_NEXT
+                )
+            if items and has_prev:
+                prev_cursor = CursorHandler.encode(
+                    self._cursor_values(columns, items[0]), order_by, CURSOR_PREV
+                )
 
             app_logger.log_success(
                 f"Successfully retrieved {len(items)} {self.model.__name__} records",
@@ -85,10 +289,16 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
             return PaginatedResponse(
                 items=items,
                 total=total,
-                page=(skip // limit) + 1,
-                page_size=limit
+                page=page,
+                page_size=limit,
+                has_more=has_next,
+                count_mode=count_mode,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor
             )
 
+        except (InvalidFieldException, InvalidDataException):
+            raise
         except Exception as e:
             app_logger.log_error(
                 f"Error retrieving {self.model.__name__} list: {str(e)}",
@@ -97,13 +307,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
             )
             raise DatabaseError(f"Error retrieving {self.model.__name__} list: {str(e)}")
 
-    async def get_by_id(self, id: UUID) -> Optional[ModelType]:
-        """Retrieve a record by ID."""
+    async def get_by_id(self, id: UUID, use_replica: bool = True) -> Optional[ModelType]:
+        """Retrieve a record by ID. Write paths pass ``use_replica=False``."""
         context = self._log_context("get_by_id", id=str(id))
         
         try:
             query = select(self.model).filter(self.model.id == id)
-            result = await self.db.execute(query)
+            result = await self.db.execute(query, bind_arguments=self._read_bind(use_replica))
             item = result.scalar_one_or_none()
             
             app_logger.log_success(
@@ -130,7 +340,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         self, 
         value: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        use_replica: bool = True
     ) -> PaginatedResponse[ModelType]:
         """ Search records where any string-compatible field matches the provided value.
             
@@ -138,6 +350,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
                 value: Search value to match against any field
                 skip: Number of records to skip
                 limit: Maximum number of records to return
+                count_mode: How the total is computed (exact, estimated or none)
+                use_replica: Route the reads to a replica when one is configured
                 
             Returns:
                 PaginatedResponse containing matching model instances
@@ -149,7 +363,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
             "get_by_any_field", 
             search_value=value,
             skip=skip,
-            limit=limit
+            limit=limit,
+            count_mode=count_mode
         )
         
         try:
@@ -168,16 +383,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
                 query = query.filter(or_(*conditions))
             
             # Count total items
-            total_query = select(func.count()).select_from(self.model)
-            if query._where_criteria:
-                total_query = total_query.where(*query._where_criteria)
-                
-            total_result = await self.db.execute(total_query)
-            total = total_result.scalar()
+            total, count_mode = await self._count(query, count_mode, use_replica)
             
-            # Get paginated results
-            result = await self.db.execute(query.offset(skip).limit(limit))
+            # Get paginated results, plus one row to detect a next page
+            result = await self.db.execute(
+                query.offset(skip).limit(limit + 1), bind_arguments=self._read_bind(use_replica)
+            )
             items = list(result.scalars().all())
+            has_more = len(items) > limit
+            items = items[:limit]
             
             app_logger.log_success(
                 f"Found {len(items)} matching {self.model.__name__} records",
@@ -188,7 +402,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
                 items=items,
                 total=total,
                 page=(skip // limit) + 1,
-                page_size=limit
+                page_size=limit,
+                has_more=has_more,
+                count_mode=count_mode
             )
             
         except Exception as e:
@@ -205,8 +421,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         async with managed_transaction(self.db):
             try:
                 db_obj = self.model(**schema.model_dump())
-                self.db.add(db_obj)
-                await self.db.flush()
+                await flush_with_slug_retry(self.db, [db_obj])
                 
                 context = self._log_context("create", id=str(db_obj.id))
                 app_logger.log_success(
@@ -235,7 +450,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         context = self._log_context("update", id=str(id))
         
         try:
-            db_obj = await self.get_by_id(id)
+            db_obj = await self.get_by_id(id, use_replica=False)
             obj_data = schema.model_dump(exclude_unset=True)
 
             for field, value in obj_data.items():
@@ -270,7 +485,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         
         async with managed_transaction(self.db):
             try:
-                db_obj = await self.get_by_id(id)
+                db_obj = await self.get_by_id(id, use_replica=False)
                 await self.db.delete(db_obj)
                 
                 app_logger.log_success(
@@ -301,7 +516,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
         context = self._log_context("patch", id=str(id))
         
         try:
-            db_obj = await self.get_by_id(id)
+            db_obj = await self.get_by_id(id, use_replica=False)
             obj_data = schema.model_dump(exclude_unset=True, exclude_none=True)
 
             for field, value in obj_data.items():
@@ -330,15 +545,252 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
             await self.db.rollback()
             raise DatabaseError(f"Error patching {self.model.__name__}: {str(e)}")
 
+    async def _handle_integrity_error(self, error: IntegrityError) -> None:
+        """Translate a constraint violation into an API error"""
+        raise InvalidDataException("Data validation failed: duplicate entry detected.")
+
+    def _validate_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the model's @validates hooks over ``values``; Core UPDATE
+        statements bypass them.
+
+        Raises:
+            InvalidDataException: If a validator rejects a value
+        """
+        validators = self.model.__mapper__.validators
+        validated = dict(values)
+        for key, value in values.items():
+            if key in validators:
+                validator, _ = validators[key]
+                try:
+                    # Validators only inspect the value, never the instance
+                    validated[key] = validator(self.model.__new__(self.model), key, value)
+                except ValueError as e:
+                    raise InvalidDataException(str(e))
+        return validated
+
+    async def update_returning(
+        self,
+        *,
+        id: UUID,
+        values: Dict[str, Any],
+        auto_commit: bool = True
+    ) -> ModelType:
+        """
+        Update a record with a single ``UPDATE ... WHERE id = :id RETURNING *``.
+
+        Replaces the read-modify-write cycle of update/patch (SELECT, UPDATE,
+        SELECT). Values go through the model's @validates hooks first, as
+        attribute assignment would. Setting a model's __slug_source__ column
+        costs one extra query to allocate a slug, retried if a concurrent
+        writer takes it first; the row keeps its slug while it still matches
+        the source value.
+
+        Args:
+            id: Record ID
+            values: Column values to set
+            auto_commit: Whether to commit changes immediately
+
+        Raises:
+            InvalidFieldException: If a field is not a column of the model
+            NotFoundException: If no record has this ID
+            InvalidDataException: If a unique constraint is violated
+            DatabaseError: For other database errors
+        """
+        context = self._log_context("update_returning", id=str(id))
+
+        columns = self.model.__table__.columns
+        for field in values:
+            if field not in columns or columns[field].primary_key:
+                raise InvalidFieldException(f"Field '{field}' is invalid for {self.model.__name__}")
+
+        if not values:
+            return await self.get_by_id(id, use_replica=False)
+
+        values = self._validate_values(values)
+        source = getattr(self.model, "__slug_source__", None)
+
+        try:
+            for attempt in range(SLUG_RETRY_ATTEMPTS):
+                if source is not None and values.get(source) is not None:
+                    values["slug"] = await slug_update_value(
+                        self.db, columns["slug"], values[source], columns["id"], id
+                    )
+
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == id)
+                    .values(**values)
+                    .returning(self.model)
+                    .execution_options(populate_existing=True)
+                )
+                try:
+                    async with self.db.begin_nested():
+                        result = await self.db.execute(stmt)
+                        db_obj = result.scalar_one_or_none()
+                    break
+                except IntegrityError as e:
+                    if not is_slug_violation(e) or "slug" not in values or attempt == SLUG_RETRY_ATTEMPTS - 1:
+                        raise
+
+            if db_obj is None:
+                raise NotFoundException(self.model.__name__, id)
+
+            if auto_commit:
+                await self.db.commit()
+
+            app_logger.log_success(
+                f"Successfully updated {self.model.__name__}",
+                extra=context
+            )
+
+            return db_obj
+
+        except NotFoundException:
+            raise
+        except IntegrityError as e:
+            await self.db.rollback()
+            app_logger.log_error(
+                f"Constraint violation updating {self.model.__name__}: {str(e)}",
+                error=e,
+                extra=context
+            )
+            await self._handle_integrity_error(e)
+        except Exception as e:
+            app_logger.log_error(
+                f"Error updating {self.model.__name__}: {str(e)}",
+                error=e,
+                extra=context
+            )
+            await self.db.rollback()
+            raise DatabaseError(f"Error updating {self.model.__name__}: {str(e)}")
+
+    def _bulk_conditions(self, filters: Dict[str, Any]) -> List[Any]:
+        """Equality predicates for set-based writes; refuses an empty filter."""
+        if not filters:
+            raise InvalidDataException("At least one filter is required for bulk operations")
+        self._table_columns(list(filters))
+        return [self.model.__table__.c[field] == value for field, value in filters.items()]
+
+    async def bulk_update(self, filters: Dict[str, Any], values: Dict[str, Any]) -> BulkResult:
+        """
+        Update every record matching ``filters`` with one UPDATE statement.
+
+        Args:
+            filters: Column equality filters, at least one
+            values: Column values to set
+
+        Returns:
+            BulkResult with the number of rows updated
+
+        Raises:
+            InvalidFieldException: If a column is unknown, or values touch the
+                primary key or the slug source column
+            InvalidDataException: If filters or values are empty
+            DatabaseError: If the update fails
+        """
+        context = self._log_context("bulk_update", filters=filters, values=values)
+
+        conditions = self._bulk_conditions(filters)
+        if not values:
+            raise InvalidDataException("No values to update")
+        columns = self.model.__table__.columns
+        source = getattr(self.model, "__slug_source__", None)
+        for field in self._table_columns(list(values)):
+            if columns[field].primary_key or field in (source, "slug"):
+                raise InvalidFieldException(f"Field '{field}' cannot be bulk updated for {self.model.__name__}")
+
+        async with managed_transaction(self.db):
+            try:
+                result = await self.db.execute(
+                    update(self.model)
+                    .where(*conditions)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+
+                app_logger.log_success(
+                    f"Successfully bulk updated {result.rowcount} {self.model.__name__} records",
+                    extra={**context, "affected": result.rowcount}
+                )
+
+                return BulkResult(affected=result.rowcount)
+
+            except Exception as e:
+                app_logger.log_error(
+                    f"Error bulk updating {self.model.__name__}: {str(e)}",
+                    error=e,
+                    extra=context
+                )
+                raise DatabaseError(f"Error bulk updating {self.model.__name__}: {str(e)}")
+
+    async def bulk_delete(self, filters: Dict[str, Any]) -> BulkResult:
+        """
+        Delete every record matching ``filters`` with one DELETE statement.
+
+        Args:
+            filters: Column equality filters, at least one
+
+        Returns:
+            BulkResult with the number of rows deleted
+
+        Raises:
+            InvalidFieldException: If a column is unknown
+            InvalidDataException: If filters are empty
+            DatabaseError: If the delete fails
+        """
+        context = self._log_context("bulk_delete", filters=filters)
+
+        conditions = self._bulk_conditions(filters)
+
+        async with managed_transaction(self.db):
+            try:
+                result = await self.db.execute(
+                    delete(self.model)
+                    .where(*conditions)
+                    .execution_options(synchronize_session=False)
+                )
+
+                app_logger.log_success(
+                    f"Successfully bulk deleted {result.rowcount} {self.model.__name__} records",
+                    extra={**context, "affected": result.rowcount}
+                )
+
+                return BulkResult(affected=result.rowcount)
+
+            except Exception as e:
+                app_logger.log_error(
+                    f"Error bulk deleting {self.model.__name__}: {str(e)}",
+                    error=e,
+                    extra=context
+                )
+                raise DatabaseError(f"Error bulk deleting {self.model.__name__}: {str(e)}")
+
+    async def _allocate_slugs(self, db_objs: List[ModelType]) -> None:
+        """Assign slugs to a batch in one query for models declaring __slug_source__."""
+        source = getattr(self.model, "__slug_source__", None)
+        if source is None:
+            return
+        slugs = await allocate_slugs(
+            self.db,
+            self.model.__table__.c.slug,
+            [getattr(obj, source) for obj in db_objs]
+        )
+        for obj, slug in zip(db_objs, slugs):
+            obj.slug = slug
+
     async def bulk_create(self, schemas: List[CreateSchemaType]) -> List[ModelType]:
-        """Create multiple records in bulk."""
+        """Create multiple records in bulk as ORM instances (see bulk_insert for large imports)."""
         context = self._log_context("bulk_create")
         
         async with managed_transaction(self.db):
             try:
                 db_objs = [self.model(**schema.model_dump()) for schema in schemas]
-                self.db.add_all(db_objs)
-                await self.db.flush()
+                await flush_with_slug_retry(
+                    self.db,
+                    db_objs,
+                    prepare=lambda: self._allocate_slugs(db_objs)
+                )
                 
                 app_logger.log_success(
                     f"Successfully bulk created {len(db_objs)} {self.model.__name__} records",
@@ -353,4 +805,151 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Patc
                     error=e,
                     extra=context
                 )
-                raise DatabaseError(f"Error bulk creating {self.model.__name__}: {str(e)}")
\ No newline at end of file
+                raise DatabaseError(f"Error bulk creating {self.model.__name__}: {str(e)}")
+
+    def _dialect_insert(self):
+        """INSERT construct supporting ON CONFLICT where the dialect has it."""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return pg_insert(self.model.__table__)
+        if dialect == "sqlite":
+            return sqlite_insert(self.model.__table__)
+        return insert(self.model.__table__)
+
+    def _table_columns(self, names: Optional[List[str]]) -> List[str]:
+        for name in names or []:
+            if name not in self.model.__table__.columns:
+                raise InvalidFieldException(f"Field '{name}' is invalid for {self.model.__name__}")
+        return list(names or [])
+
+    async def bulk_insert(
+        self,
+        schemas: List[CreateSchemaType],
+        *,
+        chunk_size: int = 1000,
+        on_conflict: Optional[str] = None,
+        conflict_columns: Optional[List[str]] = None,
+        update_columns: Optional[List[str]] = None,
+        returning: Optional[List[str]] = None
+    ) -> BulkResult:
+        """
+        High-throughput insert/upsert using multi-row Core INSERT statements.
+
+        Unlike bulk_create, no ORM instances are built and no per-row mapper
+        events fire. The INSERT is compiled once and each chunk is executed
+        as an executemany, which SQLAlchemy sends as batched
+        ``INSERT ... VALUES (...), (...)`` statements. All chunks share one
+        transaction. Slugs for every row are allocated up front inside it;
+        when a concurrent writer claims one of them first, the chunk is
+        retried after reallocating the rows not inserted yet.
+
+        Args:
+            schemas: Rows to insert
+            chunk_size: Rows per INSERT statement (capped by the bind parameter limit)
+            on_conflict: None, "nothing" (ON CONFLICT DO NOTHING) or "update" (DO UPDATE)
+            conflict_columns: Conflict target; required for both modes so that other
+                unique violations (e.g. on slug) still raise instead of being skipped
+            update_columns: Columns overwritten on conflict, defaults to every inserted column
+                except the conflict target
+            returning: Columns to return for the written rows
+
+        Returns:
+            BulkResult with the number of rows written and the requested columns
+
+        Raises:
+            InvalidFieldException: If a column name is unknown
+            InvalidDataException: If the conflict options are inconsistent
+            DatabaseError: If the insert fails
+        """
+        context = self._log_context(
+            "bulk_insert",
+            rows=len(schemas),
+            chunk_size=chunk_size,
+            on_conflict=on_conflict
+        )
+
+        if on_conflict not in (None, "nothing", "update"):
+            raise InvalidDataException("on_conflict must be 'nothing' or 'update'")
+        if on_conflict and not conflict_columns:
+            raise InvalidDataException(f"conflict_columns are required for on_conflict='{on_conflict}'")
+        if on_conflict and self.db.get_bind().dialect.name not in ("postgresql", "sqlite"):
+            raise InvalidDataException("on_conflict is not supported on this database")
+        conflict_columns = self._table_columns(conflict_columns)
+        update_columns = self._table_columns(update_columns)
+        returning = self._table_columns(returning)
+
+        rows = [schema.model_dump() for schema in schemas]
+        if not rows:
+            return BulkResult(affected=0)
+
+        table = self.model.__table__
+        source = getattr(self.model, "__slug_source__", None)
+
+        # Postgres accepts at most 32767 bind parameters per statement. Column
+        # defaults (id, timestamps) are rendered as parameters too, so budget
+        # for every column of the table rather than the keys of a row.
+        chunk_size = max(1, min(chunk_size, POSTGRES_MAX_BIND_PARAMS // len(table.c)))
+
+        async def assign_slugs(pending: List[Dict[str, Any]]) -> None:
+            slugs = await allocate_slugs(self.db, table.c.slug, [row[source] for row in pending])
+            for row, slug in zip(pending, slugs):
+                row["slug"] = slug
+
+        async with managed_transaction(self.db):
+            try:
+                if source is not None:
+                    await assign_slugs(rows)
+
+                stmt = self._dialect_insert()
+                if on_conflict == "nothing":
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+                elif on_conflict == "update":
+                    columns = update_columns or [
+                        name for name in rows[0] if name not in conflict_columns
+                    ]
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=conflict_columns,
+                        set_={name: stmt.excluded[name] for name in columns}
+                    )
+                # rowcount is unreliable for executemany; counting returned
+                # rows is exact, so return the primary key when nothing was asked
+                stmt = stmt.returning(
+                    *([table.c[name] for name in returning] or table.primary_key.columns)
+                )
+
+                affected = 0
+                returned: List[Dict[str, Any]] = []
+
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start:start + chunk_size]
+                    for attempt in range(SLUG_RETRY_ATTEMPTS):
+                        try:
+                            async with self.db.begin_nested():
+                                result = await self.db.execute(stmt, chunk)
+                                chunk_rows = [dict(row) for row in result.mappings()]
+                            break
+                        except IntegrityError as e:
+                            if source is None or not is_slug_violation(e) or attempt == SLUG_RETRY_ATTEMPTS - 1:
+                                raise
+                            # A concurrent writer claimed one of the slugs;
+                            # reallocate every row not inserted yet
+                            await assign_slugs(rows[start:])
+
+                    affected += len(chunk_rows)
+                    if returning:
+                        returned.extend(chunk_rows)
+
+                app_logger.log_success(
+                    f"Successfully bulk inserted {affected} {self.model.__name__} records",
+                    extra={**context, "affected": affected}
+                )
+
+                return BulkResult(affected=affected, rows=returned)
+
+            except Exception as e:
+                app_logger.log_error(
+                    f"Error bulk inserting {self.model.__name__}: {str(e)}",
+                    error=e,
+                    extra=context
+                )
+                raise DatabaseError(f"Error bulk inserting {self.model.__name__}: {str(e)}")
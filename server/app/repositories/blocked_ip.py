@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import select, delete, or_
+from app.models.blockedips import BlockedIP
+from app.schemas.blocked_ip import BlockedIPCreate
+from app.schemas.common import BulkResult
+from app.database.session import managed_transaction
+from app.exceptions.database import DatabaseError
+from app.core.logging import app_logger
+from .base import BaseRepository
+
+class BlockedIPRepository(BaseRepository[BlockedIP, BlockedIPCreate, BlockedIPCreate, BlockedIPCreate]):
+
+    async def import_blocks(self, ips: List[str], minutes: Optional[int] = None) -> BulkResult:
+        """
+        Block many addresses and CIDR ranges in one upsert.
+
+        Existing blocks for the same address or range are extended to the new
+        expiry. Duplicates in ``ips`` (after canonicalisation) are collapsed.
+
+        Raises:
+            ValueError: If an entry is not an IP address or CIDR range
+            DatabaseError: If the insert fails
+        """
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(minutes=minutes) if minutes else None
+        blocks = {}
+        for ip in ips:
+            block = BlockedIPCreate(ip=ip, blocked_at=now, expires_at=expires_at)
+            blocks[block.ip] = block
+
+        return await self.bulk_insert(
+            list(blocks.values()),
+            on_conflict="update",
+            conflict_columns=["ip"],
+            update_columns=["blocked_at", "expires_at"]
+        )
+
+    async def export_blocks(self) -> List[BlockedIP]:
+        """Return every active block, ranges and single addresses alike."""
+        context = self._log_context("export_blocks")
+
+        try:
+            now = datetime.now(timezone.utc)
+            result = await self.db.execute(
+                select(BlockedIP)
+                .where(or_(BlockedIP.expires_at.is_(None), BlockedIP.expires_at > now))
+                .order_by(BlockedIP.ip),
+                bind_arguments=self._read_bind()
+            )
+            return list(result.scalars().all())
+
+        except Exception as e:
+            app_logger.log_error(
+                f"Error exporting blocked IPs: {str(e)}",
+                error=e,
+                extra=context
+            )
+            raise DatabaseError(f"Error exporting blocked IPs: {str(e)}")
+
+    async def remove_blocks(self, ips: List[str]) -> BulkResult:
+        """Delete the blocks for the given addresses or ranges in one statement."""
+        context = self._log_context("remove_blocks", count=len(ips))
+        targets = list({BlockedIPCreate(ip=ip).ip for ip in ips})
+
+        async with managed_transaction(self.db):
+            try:
+                result = await self.db.execute(
+                    delete(BlockedIP)
+                    .where(BlockedIP.ip.in_(targets))
+                    .execution_options(synchronize_session=False)
+                )
+                return BulkResult(affected=result.rowcount)
+
+            except Exception as e:
+                app_logger.log_error(
+                    f"Error removing blocked IPs: {str(e)}",
+                    error=e,
+                    extra=context
+                )
+                raise DatabaseError(f"Error removing blocked IPs: {str(e)}")
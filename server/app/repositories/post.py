@@ -1,6 +1,113 @@
-from app.models.post import Post
-from app.schemas.post import PostCreate, PostUpdate, PostPatch
+from sqlalchemy import select, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from app.models.post import Post, POST_SEARCH_CONFIG
+from app.schemas.post import PostCreate, PostUpdate, PostPatch, PostSearchResponse
+from app.schemas.common import PaginatedResponse, CountMode
+from app.database.expressions import is_postgres
+from app.exceptions.database import DatabaseError
+from app.core.logging import app_logger
 from .base import BaseRepository
 
+# Generated column maintained by app.database.migrations (Postgres only)
+search_vector = literal_column("posts.search_vector", TSVECTOR)
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
 class PostRepository(BaseRepository[Post, PostCreate, PostUpdate,PostPatch]):
-    pass
\ No newline at end of file
+
+    async def search(
+        self,
+        value: str,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> PaginatedResponse[PostSearchResponse]:
+        """
+        Full-text search over title, author and content.
+
+        Uses the GIN-indexed ``search_vector`` column with websearch_to_tsquery
+        parsing, ts_rank ordering and ts_headline snippets. On non-Postgres
+        databases it falls back to get_by_any_field (ILIKE, no rank/snippet).
+
+        Args:
+            value: Search query in websearch syntax ("quoted phrases", -exclusions, or)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            count_mode: How the total is computed (exact, estimated or none)
+
+        Raises:
+            DatabaseError: If the search operation fails
+        """
+        if not is_postgres(self.db):
+            page = await self.get_by_any_field(value, skip=skip, limit=limit, count_mode=count_mode)
+            return page.model_copy(update={
+                "items": [PostSearchResponse.model_validate(item) for item in page.items]
+            })
+
+        context = self._log_context(
+            "search",
+            search_value=value,
+            skip=skip,
+            limit=limit,
+            count_mode=count_mode
+        )
+
+        try:
+            ts_query = func.websearch_to_tsquery(POST_SEARCH_CONFIG, value)
+            match = search_vector.op("@@")(ts_query)
+            rank = func.ts_rank(search_vector, ts_query)
+
+            total, count_mode = await self._count(select(self.model).where(match), count_mode)
+
+            # Rank and page on the index first so ts_headline only runs on the page rows
+            ranked = (
+                select(self.model.id, rank.label("rank"))
+                .where(match)
+                .order_by(rank.desc(), self.model.id)
+                .offset(skip)
+                .limit(limit + 1)
+                .subquery()
+            )
+            query = (
+                select(
+                    self.model,
+                    ranked.c.rank,
+                    func.ts_headline(
+                        POST_SEARCH_CONFIG, self.model.content, ts_query, HEADLINE_OPTIONS
+                    ).label("snippet")
+                )
+                .join(ranked, self.model.id == ranked.c.id)
+                .order_by(ranked.c.rank.desc(), self.model.id)
+            )
+
+            result = await self.db.execute(query, bind_arguments=self._read_bind())
+            rows = result.all()
+            has_more = len(rows) > limit
+            items = [
+                PostSearchResponse.model_validate(post).model_copy(
+                    update={"rank": row_rank, "snippet": snippet}
+                )
+                for post, row_rank, snippet in rows[:limit]
+            ]
+
+            app_logger.log_success(
+                f"Found {len(items)} matching {self.model.__name__} records",
+                extra={**context, "result_count": len(items)}
+            )
+
+            return PaginatedResponse(
+                items=items,
+                total=total,
+                page=(skip // limit) + 1,
+                page_size=limit,
+                has_more=has_more,
+                count_mode=count_mode
+            )
+
+        except Exception as e:
+            app_logger.log_error(
+                f"Error searching {self.model.__name__}: {str(e)}",
+                error=e,
+                extra=context
+            )
+            raise DatabaseError(f"Error searching {self.model.__name__}: {str(e)}")
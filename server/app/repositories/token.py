@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from app.core.logging import app_logger, log_operation
 from app.models.users import User
 from app.models.tokens import Token, ALLOWED_TOKEN_TYPES
+from app.utils.security import token_digest
 from app.exceptions.database import (
     TokenExpiredError,
     InvalidTokenError,
@@ -35,7 +36,7 @@ class TokenRepository:
             .options(selectinload(Token.user))
             .where(
                 and_(
-                    Token.token == token_string,
+                    Token.token_hash == token_digest(token_string),
                     Token.token_type == token_type,
                     Token.is_revoked == False
                 )
@@ -15,13 +15,19 @@ from app.exceptions.database import (
     NotFoundException,
     EmailSendError
 )
-from sqlalchemy import select
+from sqlalchemy import select, func, or_
 from app.models.email import EmailTemplate
 from app.services.email import EmailService
 from app.core.logging import app_logger, log_operation
 from app.utils.emailSettings import get_email_settings
 from app.config.email import EmailConfig
 from app.database.session import managed_transaction
+from app.database.slugs import flush_with_slug_retry
+from app.utils.password import PasswordHasher
+from app.database.expressions import is_postgres
+from app.schemas.common import PaginatedResponse, CountMode
+from app.config import get_settings
+from app.core.user_cache import user_cache
 
 # Type variables for generic type hints
 ModelType = TypeVar("ModelType", bound=User)
@@ -97,12 +103,10 @@ class UserRepository(
                     is_active=False,
                     last_login_ip=client_ip
                 )
-                db_obj.set_password(schema.password)
+                await db_obj.set_password_async(schema.password)
                 
-                # Add to session and flush to generate ID
-                db.add(db_obj)
-                app_logger.log_success("Added user to session")
-                await db.flush()
+                # Add to session and flush to generate ID, retrying on slug races
+                await flush_with_slug_retry(db, [db_obj])
                 app_logger.log_success("Flushed user to session")
                 
                 # Handle activation token and email
@@ -172,14 +176,14 @@ class UserRepository(
         """
         context = self._log_context("update", id=str(id))
         
-        user = await self.get_by_id(id)
+        user = await self.get_by_id(id, use_replica=False)
         if not user:
             raise NotFoundException("User", id)
         async with managed_transaction() as db:
             try:
                 # Handle password update
                 if schema.password:
-                    user.set_password(schema.password)
+                    await user.set_password_async(schema.password)
                 
                 # Update other fields
                 update_data = schema.model_dump(exclude={'password'}, exclude_unset=True)
@@ -189,6 +193,7 @@ class UserRepository(
                 if auto_commit:
                     await db.commit()
                     await db.refresh(user)
+                user_cache.invalidate(user.id)
                 
                 app_logger.log_success(
                     f"Successfully updated user {user.username}",
@@ -230,7 +235,7 @@ class UserRepository(
         """
         context = self._log_context("patch", id=str(id))
 
-        user = await self.get_by_id(id)
+        user = await self.get_by_id(id, use_replica=False)
         if not user:
             raise NotFoundException("User", id)
 
@@ -239,7 +244,7 @@ class UserRepository(
                 # Handle password update
                 patch_data = schema.model_dump(exclude_unset=True, exclude_none=True)
                 if patch_data.get('password'):
-                    user.set_password(patch_data.pop('password'))
+                    await user.set_password_async(patch_data.pop('password'))
                 
                 # Update other fields
                 await self._update_fields(user, patch_data)
@@ -248,6 +253,7 @@ class UserRepository(
                 if auto_commit:
                     await db.commit()
                     await db.refresh(user)
+                user_cache.invalidate(user.id)
                 
                 app_logger.log_success(
                     f"Successfully patched user {user.username}",
@@ -264,6 +270,38 @@ class UserRepository(
 
  
 
+    async def update_returning(
+        self,
+        *,
+        id: UUID,
+        values: dict,
+        auto_commit: bool = True
+    ) -> ModelType:
+        """
+        Update user with a single UPDATE ... RETURNING statement
+
+        A plain ``password`` value is hashed into ``password_hash`` first.
+
+        Raises:
+            NotFoundException: If user not found
+            InvalidFieldException: If invalid field in update data
+            InvalidDataException: If unique constraint violated
+        """
+        values = dict(values)
+        password = values.pop('password', None)
+        if password:
+            values['password_hash'] = await PasswordHasher.hash_password(password)
+
+        user = await super().update_returning(id=id, values=values, auto_commit=auto_commit)
+        user_cache.invalidate(id)
+        return user
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete a user and drop this worker's cached snapshot of it."""
+        deleted = await super().delete(id)
+        user_cache.invalidate(id)
+        return deleted
+
     @log_operation("delete_user_account")
     async def delete_account(self, id: UUID) -> None:
         """
@@ -278,7 +316,7 @@ class UserRepository(
         """
         context = self._log_context("delete", id=str(id))
         
-        user = await self.get_by_id(id)
+        user = await self.get_by_id(id, use_replica=False)
         if not user:
             raise NotFoundException("User", id)
         
@@ -286,6 +324,7 @@ class UserRepository(
             try:
                 await db.delete(user)
                 await db.commit()
+                user_cache.invalidate(id)
                 
                 app_logger.log_success(
                     "User account deleted successfully",
@@ -432,6 +471,94 @@ class UserRepository(
             raise DatabaseError(f"Error retrieving user by email: {str(e)}")
     
 
+    async def search(
+        self,
+        value: str,
+        skip: int = 0,
+        limit: int = 100,
+        threshold: Optional[float] = None,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> PaginatedResponse[User]:
+        """
+        Fuzzy typeahead search over username, email and slug.
+
+        On Postgres, matches are rows whose fields contain the value or have a
+        pg_trgm similarity of at least ``threshold``, both served by the
+        trigram GIN indexes, ordered by best similarity. Other databases fall
+        back to a plain ILIKE over the same three columns.
+
+        Args:
+            value: Search value
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            threshold: Minimum similarity (0-1), defaults to USER_SEARCH_SIMILARITY_THRESHOLD
+            count_mode: How the total is computed (exact, estimated or none)
+
+        Raises:
+            DatabaseError: If the search operation fails
+        """
+        if threshold is None:
+            threshold = get_settings().USER_SEARCH_SIMILARITY_THRESHOLD
+
+        context = self._log_context(
+            "search",
+            search_value=value,
+            skip=skip,
+            limit=limit,
+            threshold=threshold,
+            count_mode=count_mode
+        )
+        columns = (User.username, User.email, User.slug)
+
+        try:
+            contains = [column.icontains(value, autoescape=True) for column in columns]
+
+            if is_postgres(self.db):
+                # The % operator reads its cut-off from this setting; scope it to the transaction
+                await self.db.execute(
+                    select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True)),
+                    bind_arguments=self._read_bind()
+                )
+                match = or_(*contains, *[column.bool_op("%")(value) for column in columns])
+                rank = func.greatest(*[func.similarity(column, value) for column in columns])
+                order = (rank.desc(), User.id)
+            else:
+                match = or_(*contains)
+                order = (User.username, User.id)
+
+            query = select(User).where(match)
+            total, count_mode = await self._count(query, count_mode)
+
+            result = await self.db.execute(
+                query.order_by(*order).offset(skip).limit(limit + 1),
+                bind_arguments=self._read_bind()
+            )
+            items = list(result.scalars().all())
+            has_more = len(items) > limit
+            items = items[:limit]
+
+            app_logger.log_success(
+                f"Found {len(items)} matching users",
+                extra={**context, "result_count": len(items)}
+            )
+
+            return PaginatedResponse(
+                items=items,
+                total=total,
+                page=(skip // limit) + 1,
+                page_size=limit,
+                has_more=has_more,
+                count_mode=count_mode
+            )
+
+        except Exception as e:
+            app_logger.log_error(
+                f"Error searching users: {str(e)}",
+                error=e,
+                extra=context
+            )
+            raise DatabaseError(f"Error searching users: {str(e)}")
+
     @log_operation("get_inactive_user_by_email")
     async def get_inactive_user_by_email(self, email: str) -> User:
         """
@@ -1,18 +1,34 @@
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, IPvAnyAddress
+from datetime import datetime, timezone
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+from app.utils.ip_ranges import canonical_block
 
 class BlockedIPBase(BaseModel):
-    ip: IPvAnyAddress
+    ip: str = Field(..., description='IP address or CIDR range, e.g. 203.0.113.7 or 203.0.113.0/24')
     blocked_at: datetime
     expires_at: Optional[datetime]
 
+    @field_validator('ip')
+    @classmethod
+    def validate_ip(cls, v: str) -> str:
+        try:
+            return canonical_block(v)
+        except ValueError:
+            raise ValueError(f'Invalid IP address or CIDR range: {v}')
+
     class Config:
         from_attributes = True
-        orm_mode = True
 
 class BlockedIPCreate(BlockedIPBase):
-    pass
+    blocked_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: Optional[datetime] = None
 
 class BlockedIPResponse(BlockedIPBase):
-    blocked_at: datetime
\ No newline at end of file
+    blocked_at: datetime
+
+class BlockedIPImport(BaseModel):
+    ips: List[str] = Field(..., min_length=1, description='IP addresses and/or CIDR ranges')
+    minutes: Optional[int] = Field(None, ge=1, description='Block duration; omit to block until removed')
+
+class BlockedIPRemove(BaseModel):
+    ips: List[str] = Field(..., min_length=1, description='IP addresses and/or CIDR ranges to unblock')
@@ -1,13 +1,29 @@
+from enum import Enum
 from pydantic import BaseModel
-from typing import Generic, TypeVar, List
+from typing import Any, Dict, Generic, TypeVar, List, Optional
 
 T = TypeVar('T')
 
+class CountMode(str, Enum):
+    """How PaginatedResponse.total is produced"""
+    EXACT = "exact"          # SELECT count(*) with the page predicates
+    ESTIMATED = "estimated"  # planner row estimate, Postgres only
+    NONE = "none"            # no count, only has_more
+
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
+    has_more: Optional[bool] = None
+    count_mode: CountMode = CountMode.EXACT
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+
+class BulkResult(BaseModel):
+    """Outcome of a set-based write"""
+    affected: int
+    rows: List[Dict[str, Any]] = []
@@ -31,6 +31,28 @@ class PostResponse(PostBase):
     created_at: datetime
     updated_at: datetime
 
+class PostSearchResponse(PostResponse):
+    rank: Optional[float] = Field(None, description='Full-text search rank')
+    snippet: Optional[str] = Field(None, description='Content excerpt with matches wrapped in <mark> tags')
+
 class PostPatch(PostUpdate):
     model_config = ConfigDict(extra='forbid')
     pass
+
+class PostFilter(BaseModel):
+    author: Optional[str] = Field(None, min_length=1, description='Match posts by this author')
+    published: Optional[bool] = Field(None, description='Match posts by publication status')
+
+    model_config = ConfigDict(extra='forbid')
+
+class PostBulkValues(BaseModel):
+    published: Optional[bool] = Field(None, description='New publication status')
+    author: Optional[str] = Field(None, min_length=1, description='New author')
+
+    model_config = ConfigDict(extra='forbid')
+
+class PostBulkUpdate(BaseModel):
+    filters: PostFilter
+    values: PostBulkValues
+
+    model_config = ConfigDict(extra='forbid')
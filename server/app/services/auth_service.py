@@ -1,10 +1,10 @@
 from typing import Optional, Tuple
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from fastapi import Depends
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, or_
+from sqlalchemy import case, func, update, or_
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.database.session import get_db_session, managed_transaction
@@ -17,6 +17,8 @@ from app.models.tokens import Token, ALLOWED_TOKEN_TYPES
 from app.core.logging import app_logger, log_operation
 from app.utils.emailSettings import get_email_settings
 from app.services.token_service import TokenService
+from app.utils.security import JWTHandler
+from app.utils.password import PasswordHasher
 from app.repositories.user import UserRepository
 from app.exceptions.database import (
     DatabaseError, NotFoundException, InvalidDataException,
@@ -48,6 +50,11 @@ class AuthService:
     
     @log_operation("authenticate_user")
     async def authenticate_user(self, email: str, password: str) -> TokenSchema:
+        """
+        Log a user in on the request session: the user load, the login
+        attempt update and the new refresh family share one transaction
+        and are committed once.
+        """
         try:
             user = await self._user_repo.get_by_email(email)
             if not user:
@@ -56,25 +63,27 @@ class AuthService:
             if user.is_locked and user.account_unlock and user.account_unlock > datetime.now():
                 raise InvalidDataException(f"Account is locked. Please try again after {user.account_unlock}")
 
-            if not user.check_password(password):
-                async with managed_transaction():
-                    await self._handle_failed_login(user)
+            if not await user.check_password_async(password):
+                await self._handle_failed_login(user)
                 raise InvalidDataException("Invalid email or password")
 
             if not user.is_active:
                 raise InvalidDataException("Account is not activated. Please check your email for activation instructions")
 
-            async with managed_transaction():
-                await self._handle_successful_login(user)
-                tokens = await self._token_service.create_token_pair(user.id)
-                
-                return TokenSchema(
-                    access_token=tokens[0],
-                    token_type="bearer",
-                    refresh_token=tokens[1]
-                )
+            await self._handle_successful_login(user, password)
+            access_token, refresh_token = await self._token_service.stage_token_pair(
+                user.id, claims=JWTHandler.user_claims(user)
+            )
+            await self._session.commit()
+
+            return TokenSchema(
+                access_token=access_token,
+                token_type="bearer",
+                refresh_token=refresh_token
+            )
 
         except SQLAlchemyError as e:
+            await self._session.rollback()
             app_logger.log_error(
                 "Database error during authentication",
                 error=str(e),
@@ -91,6 +100,16 @@ class AuthService:
 
 
 
+    @log_operation("refresh_access_token")
+    async def refresh_access_token(self, refresh_token: str) -> TokenSchema:
+        """Rotate a refresh token and issue a new token pair."""
+        access_token, next_refresh_token = await self._token_service.refresh_access_token(refresh_token)
+        return TokenSchema(
+            access_token=access_token,
+            token_type="bearer",
+            refresh_token=next_refresh_token
+        )
+
     @log_operation("process_account_activation")
     async def process_account_activation(
         self, 
@@ -224,12 +243,12 @@ class AuthService:
                     status_code=status.HTTP_400_BAD_REQUEST
                 )
             
-            user = await self._user_repo.get_by_id(token_obj.user_id)
+            user = await self._user_repo.get_by_id(token_obj.user_id, use_replica=False)
             if not user:
                 raise NotFoundException("User", token_obj.user_id)
 
             async with managed_transaction():
-                user.set_password(new_password)
+                await user.set_password_async(new_password)
                 await self._token_service.revoke_all_user_tokens(user.id)
                 
                 app_logger.log_success(
@@ -267,13 +286,64 @@ class AuthService:
         )
 
     async def _handle_failed_login(self, user: User) -> None:
-        user.increment_login_attempts(MAX_LOGIN_ATTEMPTS)
-        await self._session.flush()
+        """
+        Count a failed attempt and lock the account once MAX_LOGIN_ATTEMPTS
+        is reached, in one atomic UPDATE so concurrent failures all count.
+        """
+        attempts = func.coalesce(User.login_attempts, 0) + 1
+        locks = attempts >= MAX_LOGIN_ATTEMPTS
+        result = await self._session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(
+                login_attempts=attempts,
+                is_locked=case((locks, True), else_=User.is_locked),
+                account_unlock=case(
+                    (locks, datetime.now() + timedelta(minutes=ACCOUNT_UNLOCK_DURATION)),
+                    else_=User.account_unlock
+                )
+            )
+            .returning(User.login_attempts, User.is_locked)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one()
+        await self._session.commit()
+        if row.is_locked:
+            app_logger.log_error(
+                "Account locked after failed login attempts",
+                error="too many failed logins",
+                extra={"user_id": str(user.id), "login_attempts": row.login_attempts}
+            )
 
-    async def _handle_successful_login(self, user: User) -> None:
-        user.reset_login_attempts()
-        user.last_login_at = datetime.now(timezone.utc)
-        await self._session.flush()
+    async def _handle_successful_login(self, user: User, password: str) -> None:
+        """
+        Reset the attempt counter, unless another request locked the account
+        since it was loaded; the lock check and reset are one atomic UPDATE.
+        """
+        values = {
+            "login_attempts": 0,
+            "is_locked": False,
+            "account_unlock": None,
+            "last_login_at": datetime.now(timezone.utc),
+        }
+        if PasswordHasher.needs_rehash(user.password_hash):
+            # Upgrade to the configured scheme and cost while the plain password is at hand
+            values["password_hash"] = await PasswordHasher.hash_password(password)
+
+        now = datetime.now()
+        unlocked = await self._session.scalar(
+            update(User)
+            .where(
+                User.id == user.id,
+                or_(User.is_locked.isnot(True), User.account_unlock.is_(None), User.account_unlock <= now)
+            )
+            .values(**values)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        if unlocked is None:
+            await self._session.rollback()
+            raise InvalidDataException("Account is locked. Please try again later")
 
     async def _handle_already_active_user(self, token: Token) -> None:
         await self._token_service.revoke_token(token)
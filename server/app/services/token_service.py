@@ -3,21 +3,24 @@ import secrets
 import uuid
 from typing import Optional, Tuple
 import pytz
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from app.models.tokens import Token, ALLOWED_TOKEN_TYPES
+from app.models.tokens import GlobalTokenRevocation, Token, ALLOWED_TOKEN_TYPES
 from app.models.users import User
-from app.utils.security import JWTHandler
+from app.utils.security import JWTHandler, token_digest
 from app.exceptions.database import (
     TokenCreationError,
     TokenExpiredError,
     InvalidTokenError,
     NotFoundException
 )
-from app.config import settings
+from app.config import get_settings
+from app.core.token_revocation import load_revocation_epoch, revocation_epoch, token_revocations
 from app.core.logging import app_logger, log_operation
 
+settings = get_settings()
+
 class TokenService:
     def __init__(self, session: AsyncSession, jwt_handler: Optional[JWTHandler] = None):
         self._session = session
@@ -84,7 +87,7 @@ class TokenService:
         try:
             query = select(Token).where(
                 and_(
-                    Token.token == token_string,
+                    Token.token_hash == token_digest(token_string),
                     Token.token_type == token_type,
                     Token.is_revoked == False,
                     Token.expires_at > datetime.now(pytz.UTC)
@@ -132,7 +135,7 @@ class TokenService:
          
         token = await self._session.scalar(
             select(Token).where(
-                Token.token == token_string,
+                Token.token_hash == token_digest(token_string),
                 Token.token_type == 'password_reset',
                 Token.is_revoked == False
             )
@@ -158,7 +161,7 @@ class TokenService:
             .options(selectinload(Token.user))
             .where(
                 and_(
-                    Token.token == token_string,
+                    Token.token_hash == token_digest(token_string),
                     Token.token_type == token_type,
                     Token.is_revoked == False,
                     Token.expires_at > datetime.now(pytz.UTC)
@@ -177,16 +180,66 @@ class TokenService:
             await self._session.rollback()
             raise TokenCreationError(detail=f"Failed to revoke token: {str(e)}")
 
-    async def revoke_all_user_tokens(self, user_id: str) -> None:
-        """Revoke all tokens for a specific user"""
+    async def revoke_all_user_tokens(self, user_id: str, deactivate: bool = False) -> Optional[int]:
+        """
+        Revoke all tokens for a specific user: stored tokens (refresh
+        families, activation and reset tokens) are flagged, and the token
+        version bump invalidates every access token issued so far.
+
+        With ``deactivate`` the account is disabled by the same UPDATE, so
+        the flag and the version bump commit together.
+
+        The revocation is applied to this worker's revocation cache at once;
+        other workers pick it up on their next refresh.
+
+        Returns:
+            The user's new token version, or None if the user does not exist
+        """
+        values = {"token_version": User.token_version + 1, "tokens_revoked_at": func.now()}
+        if deactivate:
+            values["is_active"] = False
         try:
             query = update(Token).where(Token.user_id == user_id).values(is_revoked=True)
             await self._session.execute(query)
+            token_version = await self._session.scalar(
+                update(User)
+                .where(User.id == user_id)
+                .values(**values)
+                .returning(User.token_version)
+                .execution_options(synchronize_session=False)
+            )
             await self._session.commit()
         except Exception as e:
             await self._session.rollback()
             raise TokenCreationError(detail=f"Failed to revoke user tokens: {str(e)}")
 
+        if token_version is not None:
+            token_revocations.add(user_id, token_version)
+        return token_version
+
+    async def revoke_all_tokens(self, revoked_by: Optional[uuid.UUID] = None) -> datetime:
+        """
+        Revoke every access and refresh token issued so far, for all users.
+
+        Records a single global revocation instead of touching each user or
+        token row: it starts a new revocation epoch, and tokens carrying an
+        older one are rejected on verification and refresh. The epoch is
+        applied to this worker's revocation cache at once.
+
+        Returns:
+            The revocation time
+        """
+        try:
+            revoked_at = datetime.now(pytz.UTC)
+            self._session.add(GlobalTokenRevocation(revoked_at=revoked_at, revoked_by=revoked_by))
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            raise TokenCreationError(detail=f"Failed to revoke all tokens: {str(e)}")
+
+        token_revocations.add_epoch(revocation_epoch(revoked_at))
+        return revoked_at
+
     async def revoke_user_tokens_by_type(self, user_id: str, token_type: str) -> None:
         """Revoke all tokens of a specific type for a user"""
         try:
@@ -202,86 +255,133 @@ class TokenService:
             await self._session.rollback()
             raise TokenCreationError(detail=f"Failed to revoke user tokens by type: {str(e)}")
 
-    async def create_token_pair(self, user_id: str) -> Tuple[str, str]:
-        """Create a new access/refresh token pair"""
-        try:
-            access_jwt = self.jwt_handler.create_access_token(subject=user_id)
-            refresh_jwt = self.jwt_handler.create_refresh_token(subject=user_id)
+    async def stage_token_pair(self, user_id: str, claims: Optional[dict] = None) -> Tuple[str, str]:
+        """
+        Create a new access/refresh token pair, starting a refresh family.
 
-            access_token = Token(
-                user_id=user_id,
-                token=access_jwt,
-                token_type='access',
-                expires_at=datetime.now(pytz.UTC) + timedelta(minutes=settings.access_token_expire_minutes)
-            )
+        The access token is stateless: ``claims`` (see JWTHandler.user_claims)
+        are embedded so it can be verified without loading the user, and it
+        is revoked by bumping the user's token version. Only the refresh
+        family is stored: one row whose id is the family id (``fam`` claim)
+        and whose ``token_hash`` is the digest of the family's current token.
 
-            refresh_token = Token(
-                user_id=user_id,
-                token=refresh_jwt,
-                token_type='refresh',
-                expires_at=datetime.now(pytz.UTC) + timedelta(days=settings.refresh_token_expire_days)
-            )
+        Both tokens carry the current global revocation epoch (``gen``).
 
-            self._session.add(access_token)
-            self._session.add(refresh_token)
+        The family row is only added to the session; the caller commits it,
+        together with any other changes of the same transaction.
+        """
+        family_id = uuid.uuid4()
+        epoch = await load_revocation_epoch(self._session)
+        access_jwt = self.jwt_handler.create_access_token(subject=user_id, claims={**(claims or {}), "gen": epoch})
+        refresh_jwt = self.jwt_handler.create_refresh_token(
+            subject=user_id, claims={"fam": str(family_id), "gen": epoch}
+        )
+
+        self._session.add(Token(
+            id=family_id,
+            user_id=user_id,
+            token=refresh_jwt,
+            token_type='refresh',
+            expires_at=datetime.now(pytz.UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        return access_jwt, refresh_jwt
+
+    async def create_token_pair(self, user_id: str, claims: Optional[dict] = None) -> Tuple[str, str]:
+        """Create a token pair (see stage_token_pair) and commit it."""
+        try:
+            tokens = await self.stage_token_pair(user_id, claims=claims)
             await self._session.commit()
-            
-            return access_jwt, refresh_jwt
+            return tokens
         except Exception as e:
             await self._session.rollback()
             raise TokenCreationError(detail=str(e))
 
-    async def verify_refresh_token(self, refresh_token: str) -> uuid.UUID:
-        """Verify the refresh token and return the user_id"""
+    async def rotate_refresh_token(self, refresh_token: str) -> Tuple[uuid.UUID, str, int]:
+        """
+        Exchange a refresh token for the next one in its family.
+
+        The family row is swapped to the new token's digest with a single
+        conditional UPDATE, so each refresh token is accepted at most once.
+        Presenting a validly signed token that is no longer the family's
+        current one means it was replayed: the whole family is revoked.
+        Tokens from before the last global revocation epoch are rejected.
+
+        Returns:
+            Tuple of the user id, the new refresh token and the current
+            global revocation epoch
+
+        Raises:
+            InvalidTokenError: If the token is invalid, expired, revoked or reused
+        """
+        payload = self.jwt_handler.decode_token(refresh_token, is_refresh=True)
+        try:
+            user_id = uuid.UUID(payload.get("sub"))
+            family_id = uuid.UUID(payload.get("fam"))
+        except (ValueError, TypeError):
+            raise InvalidTokenError(detail="Invalid refresh token", status_code=401)
+
+        now = datetime.now(pytz.UTC)
         try:
-            payload = self.jwt_handler.decode_token(refresh_token)
-            
-            if payload.get("type") != "refresh_token":
-                raise InvalidTokenError(detail="Invalid token type", status_code=401)
-            
-            try:
-                user_id = uuid.UUID(payload.get("sub"))
-            except (ValueError, TypeError):
-                raise InvalidTokenError(detail="Invalid user ID format in token", status_code=401)
-            
-            result = await self._session.execute(
-                select(Token).where(
-                    and_(
-                        Token.token == refresh_token,
-                        Token.token_type == "refresh",
-                        Token.is_revoked == False,
-                        Token.expires_at > datetime.now(pytz.UTC)
-                    )
+            epoch = await load_revocation_epoch(self._session)
+            if payload.get("gen", 0) < epoch:
+                raise InvalidTokenError(detail="Refresh token not found or revoked", status_code=401)
+            next_token = self.jwt_handler.create_refresh_token(
+                subject=str(user_id), claims={"fam": str(family_id), "gen": epoch}
+            )
+            rotated = await self._session.scalar(
+                update(Token)
+                .where(
+                    Token.id == family_id,
+                    Token.user_id == user_id,
+                    Token.token_type == 'refresh',
+                    Token.token_hash == token_digest(refresh_token),
+                    Token.is_revoked == False,
+                    Token.expires_at > now
                 )
+                .values(
+                    token_hash=token_digest(next_token),
+                    expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+                )
+                .returning(Token.id)
+                .execution_options(synchronize_session=False)
             )
-            token = result.scalar_one_or_none()
-            
-            if not token:
+            if rotated is None:
+                # Signed for this family but not its current token: a replay
+                revoked = await self._session.execute(
+                    update(Token)
+                    .where(Token.id == family_id, Token.is_revoked == False)
+                    .values(is_revoked=True)
+                    .execution_options(synchronize_session=False)
+                )
+                await self._session.commit()
+                if revoked.rowcount:
+                    app_logger.log_error(
+                        "Refresh token reuse detected, family revoked",
+                        error="refresh token reuse",
+                        extra={"user_id": str(user_id), "family_id": str(family_id)}
+                    )
                 raise InvalidTokenError(detail="Refresh token not found or revoked", status_code=401)
-                
-            return user_id
+            return user_id, next_token, epoch
+        except InvalidTokenError:
+            raise
         except Exception as e:
-            if hasattr(e, 'status_code'):
-                raise InvalidTokenError(detail=str(e), status_code=e.status_code)
-            raise InvalidTokenError(detail=f"Error verifying refresh token: {str(e)}", status_code=401)
+            await self._session.rollback()
+            raise TokenCreationError(detail=str(e))
 
-    async def refresh_access_token(self, refresh_token: str) -> Tuple[str, Token]:
-        """Create a new access token using a valid refresh token."""
+    async def refresh_access_token(self, refresh_token: str) -> Tuple[str, str]:
+        """Rotate a valid refresh token and issue a new access/refresh pair."""
         try:
-            user_id = await self.verify_refresh_token(refresh_token)
-            access_jwt = self.jwt_handler.create_access_token(subject=str(user_id))
-            
-            access_token = Token(
-                user_id=user_id,
-                token=access_jwt,
-                token_type='access',
-                expires_at=datetime.now(pytz.UTC) + timedelta(minutes=settings.access_token_expire_minutes)
+            user_id, next_refresh, epoch = await self.rotate_refresh_token(refresh_token)
+            user = await self._session.get(User, user_id)
+            if user is None or not user.is_active:
+                raise InvalidTokenError(detail="User not found or inactive", status_code=401)
+            access_jwt = self.jwt_handler.create_access_token(
+                subject=str(user_id),
+                claims={**self.jwt_handler.user_claims(user), "gen": epoch}
             )
-            
-            self._session.add(access_token)
             await self._session.commit()
             
-            return access_jwt, access_token
+            return access_jwt, next_refresh
         except Exception as e:
             await self._session.rollback()
             if isinstance(e, InvalidTokenError):
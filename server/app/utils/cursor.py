@@ -0,0 +1,92 @@
+import base64
+import hashlib
+import hmac
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+from uuid import UUID
+
+from app.config import get_settings
+from app.exceptions.database import InvalidDataException
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+class CursorHandler:
+    """
+    Opaque, signed keyset pagination cursors.
+
+    A cursor carries the sort key of a boundary row (followed by its id),
+    the order_by list it was produced for and the paging direction. The
+    payload is HMAC-signed with SECRET_KEY so clients cannot forge seek
+    values.
+    """
+    _DIGEST_SIZE = 16
+
+    @staticmethod
+    def _secret() -> bytes:
+        return get_settings().SECRET_KEY.encode("utf-8")
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, (UUID, Decimal)):
+            return str(value)
+        return value
+
+    @staticmethod
+    def _sign(payload: bytes) -> bytes:
+        return hmac.new(
+            CursorHandler._secret(), payload, hashlib.sha256
+        ).digest()[:CursorHandler._DIGEST_SIZE]
+
+    @staticmethod
+    def encode(
+        values: List[Any],
+        order_by: Optional[List[str]],
+        direction: str = CURSOR_NEXT
+    ) -> str:
+        """Encode boundary row values into a signed, url-safe cursor."""
+        payload = json.dumps(
+            {
+                "v": [CursorHandler._serialize(v) for v in values],
+                "o": list(order_by or []),
+                "d": direction,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        token = CursorHandler._sign(payload) + payload
+        return base64.urlsafe_b64encode(token).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def decode(cursor: str) -> dict:
+        """
+        Verify and decode a cursor.
+
+        Returns:
+            dict with keys ``values``, ``order_by`` and ``direction``
+
+        Raises:
+            InvalidDataException: If the cursor is malformed or tampered with
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            token = base64.urlsafe_b64decode(padded.encode("ascii"))
+            signature = token[:CursorHandler._DIGEST_SIZE]
+            payload = token[CursorHandler._DIGEST_SIZE:]
+            if not hmac.compare_digest(signature, CursorHandler._sign(payload)):
+                raise ValueError("signature mismatch")
+            data = json.loads(payload)
+            direction = data["d"]
+            if direction not in (CURSOR_NEXT, CURSOR_PREV):
+                raise ValueError("invalid direction")
+            return {
+                "values": list(data["v"]),
+                "order_by": list(data["o"]),
+                "direction": direction,
+            }
+        except Exception:
+            raise InvalidDataException("Invalid pagination cursor")
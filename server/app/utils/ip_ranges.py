@@ -0,0 +1,142 @@
+import heapq
+import math
+import socket
+from bisect import bisect_right
+from ipaddress import ip_network
+from typing import Iterable, List, Optional, Tuple
+
+IPv4 = 4
+IPv6 = 6
+
+_FAMILIES = {IPv4: (socket.AF_INET, 32), IPv6: (socket.AF_INET6, 128)}
+
+
+def parse_ip(address: str) -> Optional[Tuple[int, bytes]]:
+    """
+    (version, packed big-endian address) of ``address``, or None if it is
+    not an IP. Packed addresses of one version compare like their integer
+    values, so they can be bisected directly.
+    """
+    version = IPv6 if ":" in address else IPv4
+    try:
+        return version, socket.inet_pton(_FAMILIES[version][0], address)
+    except OSError:
+        return None
+
+
+def canonical_block(value: str) -> str:
+    """
+    Normalise an IP or CIDR for storage: single addresses are stored as the
+    bare address, ranges as the network in CIDR notation.
+
+    Raises:
+        ValueError: If ``value`` is neither an IP address nor a network
+    """
+    network = ip_network(value.strip(), strict=False)
+    if network.prefixlen == network.max_prefixlen:
+        return str(network.network_address)
+    return str(network)
+
+
+def network_bounds(value: str) -> Tuple[int, int, int]:
+    """
+    (version, first, last) integer addresses covered by an IP or CIDR.
+
+    Parses with inet_pton rather than ipaddress.ip_network, which dominates
+    the cost of building an index over many ranges.
+
+    Raises:
+        ValueError: If ``value`` is neither an IP address nor a network
+    """
+    address, _, prefix = value.partition("/")
+    parsed = parse_ip(address)
+    if parsed is None:
+        raise ValueError(f"Invalid IP address or CIDR range: {value}")
+    version, packed = parsed
+    bits = _FAMILIES[version][1]
+    prefixlen = int(prefix) if prefix else bits
+    if not 0 <= prefixlen <= bits:
+        raise ValueError(f"Invalid IP address or CIDR range: {value}")
+    host_mask = (1 << (bits - prefixlen)) - 1
+    first = int.from_bytes(packed, "big") & ~host_mask
+    return version, first, first | host_mask
+
+
+class IPRangeIndex:
+    """
+    Immutable lookup structure for blocked IPv4/IPv6 ranges.
+
+    Overlapping ranges are flattened into disjoint, sorted segments, each
+    keeping the latest expiry of the ranges covering it (inf for permanent
+    blocks). Segment bounds are stored packed, so a lookup is one inet_pton
+    and one C-level bisect: O(log n) and allocation-free however many
+    ranges are loaded.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[str, Optional[float]]] = ()):
+        by_version = {IPv4: [], IPv6: []}
+        for value, expires_at in ranges:
+            version, first, last = network_bounds(value)
+            by_version[version].append((first, last, math.inf if expires_at is None else expires_at))
+
+        self._segments = {
+            version: self._flatten(items, _FAMILIES[version][1] // 8)
+            for version, items in by_version.items()
+        }
+        self._size = sum(len(items) for items in by_version.values())
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _flatten(
+        ranges: List[Tuple[int, int, float]], width: int
+    ) -> Tuple[List[bytes], List[bytes], List[float]]:
+        starts: List[int] = []
+        ends: List[int] = []
+        expiries: List[float] = []
+        if ranges:
+            # Sweep over range boundaries keeping a max-heap of (expiry, end)
+            # for the ranges covering the current position
+            ranges.sort()
+            boundaries = sorted({first for first, _, _ in ranges} | {last + 1 for _, last, _ in ranges})
+            active: List[Tuple[float, int]] = []
+            position = 0
+            for start, end in zip(boundaries, boundaries[1:]):
+                while position < len(ranges) and ranges[position][0] <= start:
+                    first, last, expires_at = ranges[position]
+                    heapq.heappush(active, (-expires_at, last))
+                    position += 1
+                while active and active[0][1] < start:
+                    heapq.heappop(active)
+                if not active:
+                    continue
+                expires_at = -active[0][0]
+                if starts and ends[-1] == start - 1 and expiries[-1] == expires_at:
+                    ends[-1] = end - 1
+                else:
+                    starts.append(start)
+                    ends.append(end - 1)
+                    expiries.append(expires_at)
+        return (
+            [value.to_bytes(width, "big") for value in starts],
+            [value.to_bytes(width, "big") for value in ends],
+            expiries,
+        )
+
+    def expires_at(self, address: str) -> Optional[float]:
+        """Latest expiry of the ranges containing ``address``, or None if none do."""
+        version = IPv6 if ":" in address else IPv4
+        try:
+            packed = socket.inet_pton(_FAMILIES[version][0], address)
+        except OSError:
+            return None
+        starts, ends, expiries = self._segments[version]
+        i = bisect_right(starts, packed) - 1
+        if i >= 0 and packed <= ends[i]:
+            return expiries[i]
+        return None
+
+    def contains(self, address: str, now: float) -> bool:
+        expires_at = self.expires_at(address)
+        return expires_at is not None and expires_at > now
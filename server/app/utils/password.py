@@ -1,32 +1,195 @@
+import asyncio
 import bcrypt
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+from app.config import get_settings
+from app.core.protocols import PasswordScheme
+from app.exceptions.database import ServiceOverloadedError
+
+T = TypeVar("T")
+
+BCRYPT = "bcrypt"
+ARGON2ID = "argon2id"
+
+
+class BcryptScheme:
+    """bcrypt with a configurable cost (log2 rounds)."""
+    name = BCRYPT
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, rounds: int):
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # $2b$<rounds>$<salt+hash>
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+
+class Argon2idScheme:
+    """argon2id with configurable time cost, memory (KiB) and lanes."""
+    name = ARGON2ID
+    prefixes = ("$argon2id$",)
+
+    def __init__(self, time_cost: int, memory_cost: int, parallelism: int):
+        try:
+            from argon2 import PasswordHasher as Argon2Hasher
+            from argon2.exceptions import InvalidHashError, VerificationError
+        except ImportError as e:
+            raise ImportError("The argon2id password scheme requires the 'argon2-cffi' package") from e
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        self._errors = (VerificationError, InvalidHashError)
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        try:
+            return self._hasher.verify(hashed_password, password)
+        except self._errors:
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._hasher.check_needs_rehash(hashed_password)
+
+
+def create_scheme(name: str, **params) -> PasswordScheme:
+    """Build a scheme from explicit cost parameters (see calibration)."""
+    if name == BCRYPT:
+        return BcryptScheme(**params)
+    if name == ARGON2ID:
+        return Argon2idScheme(**params)
+    raise ValueError(f"Unknown password hash scheme: {name}")
+
 
 class PasswordHasher:
-    ROUNDS = 12
+    """
+    Hashes new passwords with the scheme named in PASSWORD_HASH_SCHEME and
+    verifies stored hashes with whichever scheme their prefix identifies,
+    so deployments can switch schemes or costs without invalidating
+    existing passwords. ``needs_rehash`` tells when a stored hash should be
+    replaced after a successful login.
+    """
+
+    # Hashing runs on a small thread pool (both schemes release the GIL),
+    # keeping the event loop responsive without the cost of a process pool
+    _executor: Optional[ThreadPoolExecutor] = None
+    _in_flight = 0
+    _schemes: Optional[Dict[str, PasswordScheme]] = None
+
+    @classmethod
+    def _registry(cls) -> Dict[str, PasswordScheme]:
+        if cls._schemes is None:
+            settings = get_settings()
+            schemes: Dict[str, PasswordScheme] = {BCRYPT: BcryptScheme(rounds=settings.BCRYPT_ROUNDS)}
+            try:
+                schemes[ARGON2ID] = Argon2idScheme(
+                    time_cost=settings.ARGON2_TIME_COST,
+                    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+                    parallelism=settings.ARGON2_PARALLELISM,
+                )
+            except ImportError:
+                if settings.PASSWORD_HASH_SCHEME == ARGON2ID:
+                    raise
+            cls._schemes = schemes
+        return cls._schemes
+
+    @classmethod
+    def default_scheme(cls) -> PasswordScheme:
+        return cls._registry()[get_settings().PASSWORD_HASH_SCHEME]
 
-    @staticmethod
-    def get_password_hash(password: str) -> str:
-        """ Hash password using bcrypt """
+    @classmethod
+    def identify(cls, hashed_password: str) -> Optional[PasswordScheme]:
+        """The registered scheme that produced ``hashed_password``, if any."""
+        for scheme in cls._registry().values():
+            if hashed_password.startswith(scheme.prefixes):
+                return scheme
+        return None
+
+    @classmethod
+    def get_password_hash(cls, password: str) -> str:
+        """ Hash password with the configured scheme """
         if not password:
             raise ValueError("Password cannot be empty")
+        return cls.default_scheme().hash(password)
 
-        # convert password into bytes
-        password_bytes = password.encode('utf-8')
-        # generate salt and hash the password
-        salt = bcrypt.gensalt(rounds=PasswordHasher.ROUNDS)
-        password_hash = bcrypt.hashpw(password_bytes, salt)
-        return password_hash.decode('utf-8')
-
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """ Verify password using bcrypt """
+    @classmethod
+    def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
+        """ Verify password with the scheme that produced the hash """
         if not plain_password or not hashed_password:
             return False
+        scheme = cls.identify(hashed_password)
+        if scheme is None:
+            return False
         try:
-            # convert plain_password into bytes
-            plain_password_bytes = plain_password.encode('utf-8')
-            # convert hashed_password into bytes
-            hashed_password_bytes = hashed_password.encode('utf-8')
-            return bcrypt.checkpw(plain_password_bytes, hashed_password_bytes)
+            return scheme.verify(plain_password, hashed_password)
         except Exception:
             return False
+
+    @classmethod
+    def needs_rehash(cls, hashed_password: str) -> bool:
+        """True if the hash uses another scheme or outdated cost parameters."""
+        scheme = cls.identify(hashed_password)
+        default = cls.default_scheme()
+        return scheme is not default or default.needs_rehash(hashed_password)
+
+    @classmethod
+    async def _run(cls, fn: Callable[..., T], *args) -> T:
+        """
+        Run ``fn`` on the hashing pool.
+
+        Raises:
+            ServiceOverloadedError: If PASSWORD_HASH_MAX_PENDING hashes are
+                already queued or running
+        """
+        settings = get_settings()
+        if cls._in_flight >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise ServiceOverloadedError("Too many concurrent logins, please retry shortly")
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+
+        # Count work until the thread finishes, even if the caller goes away
+        cls._in_flight += 1
+        future = asyncio.get_running_loop().run_in_executor(cls._executor, fn, *args)
+        future.add_done_callback(cls._release)
+        return await future
+
+    @classmethod
+    def _release(cls, _future) -> None:
+        cls._in_flight -= 1
+
+    @classmethod
+    async def hash_password(cls, password: str) -> str:
+        """ Hash password without blocking the event loop """
+        if not password:
+            raise ValueError("Password cannot be empty")
+        return await cls._run(cls.get_password_hash, password)
+
+    @classmethod
+    async def check_password(cls, plain_password: str, hashed_password: str) -> bool:
+        """ Verify password without blocking the event loop """
+        if not plain_password or not hashed_password:
+            return False
+        return await cls._run(cls.verify_password, plain_password, hashed_password)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
@@ -0,0 +1,95 @@
+"""
+Pick password hashing costs that take about a target time on this machine.
+
+Run on the deployment hardware and copy the printed settings into the
+environment:
+
+    python -m app.utils.password_calibration --target-ms 250
+    python -m app.utils.password_calibration --scheme argon2id --memory-kib 65536
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from app.utils.password import ARGON2ID, BCRYPT, create_scheme
+
+SAMPLE_PASSWORD = "Calibration-Passw0rd!"
+
+
+def measure_ms(scheme_name: str, samples: int = 3, **params) -> float:
+    """Median milliseconds for one hash with the given scheme parameters."""
+    scheme = create_scheme(scheme_name, **params)
+    timings: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        scheme.hash(SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int = 3) -> Dict[str, int]:
+    """Highest bcrypt cost whose hash time stays within ``target_ms``."""
+    # Each extra round doubles the work, so estimate from a cheap cost first
+    base_rounds = 8
+    base_ms = measure_ms(BCRYPT, samples, rounds=base_rounds)
+    rounds = base_rounds
+    while rounds < 31 and base_ms * 2 ** (rounds + 1 - base_rounds) <= target_ms:
+        rounds += 1
+    while rounds > 4 and measure_ms(BCRYPT, samples, rounds=rounds) > target_ms:
+        rounds -= 1
+    return {"BCRYPT_ROUNDS": rounds}
+
+
+def calibrate_argon2id(target_ms: float, memory_kib: int, parallelism: int, samples: int = 3) -> Dict[str, int]:
+    """
+    Highest argon2id time cost within ``target_ms`` at ``memory_kib``.
+    Memory is halved first if even one pass is too slow.
+    """
+    while memory_kib > 8 * 1024 and measure_ms(
+        ARGON2ID, samples, time_cost=1, memory_cost=memory_kib, parallelism=parallelism
+    ) > target_ms:
+        memory_kib //= 2
+
+    time_cost = 1
+    while measure_ms(
+        ARGON2ID, samples, time_cost=time_cost + 1, memory_cost=memory_kib, parallelism=parallelism
+    ) <= target_ms:
+        time_cost += 1
+    return {
+        "ARGON2_TIME_COST": time_cost,
+        "ARGON2_MEMORY_COST_KIB": memory_kib,
+        "ARGON2_PARALLELISM": parallelism,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scheme", choices=[BCRYPT, ARGON2ID], default=BCRYPT)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Target time for one hash")
+    parser.add_argument("--memory-kib", type=int, default=65536, help="argon2id memory per hash")
+    parser.add_argument("--parallelism", type=int, default=1, help="argon2id lanes per hash")
+    parser.add_argument("--samples", type=int, default=3, help="Hashes timed per candidate")
+    args = parser.parse_args()
+
+    if args.scheme == BCRYPT:
+        params = calibrate_bcrypt(args.target_ms, args.samples)
+        measured = measure_ms(BCRYPT, args.samples, rounds=params["BCRYPT_ROUNDS"])
+    else:
+        params = calibrate_argon2id(args.target_ms, args.memory_kib, args.parallelism, args.samples)
+        measured = measure_ms(
+            ARGON2ID,
+            args.samples,
+            time_cost=params["ARGON2_TIME_COST"],
+            memory_cost=params["ARGON2_MEMORY_COST_KIB"],
+            parallelism=params["ARGON2_PARALLELISM"],
+        )
+
+    print(f"# {args.scheme}: {measured:.0f} ms per hash (target {args.target_ms:.0f} ms)")
+    print(f"PASSWORD_HASH_SCHEME={args.scheme}")
+    for name, value in params.items():
+        print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,76 @@
+import hashlib
+import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import FrozenSet, Optional, Union
 from jose import jwt, JWTError
 from fastapi import HTTPException
 from uuid import UUID
-from app.config import settings
+from app.config import get_settings
 import pytz
 from app.exceptions.database import TokenCreationError, TokenExpiredError, InvalidTokenError
 
+settings = get_settings()
+
+
+def token_digest(token: str) -> bytes:
+    """SHA-256 digest under which a token is stored instead of the token itself."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+@dataclass(frozen=True)
+class TokenPrincipal:
+    """
+    Authenticated user as described by the signed claims of an access token.
+
+    Exposes the subset of the User API needed for authorization (id,
+    is_active, is_admin, has_role) without loading the user.
+    """
+    id: UUID
+    is_active: bool
+    roles: FrozenSet[str]
+    token_version: int
+    issued_at: int
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "TokenPrincipal":
+        return cls(
+            id=UUID(payload["sub"]),
+            is_active=bool(payload["active"]),
+            roles=frozenset(role.lower() for role in payload["roles"]),
+            token_version=int(payload["ver"]),
+            issued_at=int(payload.get("iat", 0)),
+        )
+
+    @classmethod
+    def from_user(cls, user, issued_at: int = 0) -> "TokenPrincipal":
+        claims = JWTHandler.user_claims(user)
+        return cls.from_claims({**claims, "sub": str(user.id), "iat": issued_at})
+
+    @property
+    def is_admin(self) -> bool:
+        return "admin" in self.roles
+
+    def has_role(self, role_name: str) -> bool:
+        return role_name.lower() in self.roles
+
 class JWTHandler:
+    # Claims that let an access token be verified without loading the user
+    USER_CLAIMS = ("active", "roles", "ver")
+
+    @staticmethod
+    def user_claims(user) -> dict:
+        """Authorization claims embedded in access tokens issued for ``user``."""
+        return {
+            "active": bool(user.is_active),
+            "roles": sorted(role.name for role in user.roles),
+            "ver": user.token_version or 0,
+        }
+
+    @staticmethod
+    def has_user_claims(payload: dict) -> bool:
+        return all(claim in payload for claim in JWTHandler.USER_CLAIMS)
+
     @staticmethod
     def _current_utc_time() -> datetime:
         """Utility method to get current UTC time."""
@@ -20,7 +83,7 @@ class JWTHandler:
         claims: dict = None
     ) -> str:
         """Creates an access token."""
-        expires_delta = expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
+        expires_delta = expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         jwt_claims = {
             "type": "access_token",
@@ -35,8 +98,8 @@ class JWTHandler:
         try:
             return jwt.encode(
                 jwt_claims,
-                settings.jwt_secret_key,
-                algorithm=settings.jwt_algorithm
+                settings.JWT_SECRET_KEY,
+                algorithm=settings.JWT_ALGORITHM
             )
         except Exception as e:
             raise TokenCreationError(detail=str(e))
@@ -44,23 +107,29 @@ class JWTHandler:
     @staticmethod
     def create_refresh_token(
         subject: Union[str, UUID],
-        expires_delta: Optional[timedelta] = None
+        expires_delta: Optional[timedelta] = None,
+        claims: dict = None
     ) -> str:
         """Creates a refresh token."""
-        expires_delta = expires_delta or timedelta(days=settings.refresh_token_expire_days)
+        expires_delta = expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
         jwt_claims = {
             "type": "refresh_token",
             "exp": int(JWTHandler._current_utc_time().timestamp() + expires_delta.total_seconds()),
             "iat": int(JWTHandler._current_utc_time().timestamp()),
-            "sub": str(subject)
+            "sub": str(subject),
+            # Unique per token, so rotations within one second still differ
+            "jti": secrets.token_urlsafe(16)
         }
 
+        if claims:
+            jwt_claims.update(claims)
+
         try:
             return jwt.encode(
                 jwt_claims,
-                settings.jwt_refresh_secret_key,  # Using refresh secret key
-                algorithm=settings.jwt_algorithm
+                settings.JWT_REFRESH_SECRET_KEY,  # Using refresh secret key
+                algorithm=settings.JWT_ALGORITHM
             )
         except Exception as e:
             raise TokenCreationError(detail=str(e))
@@ -70,8 +139,8 @@ class JWTHandler:
         """Decodes a JWT token and verifies it."""
         try:
             # Use appropriate secret key based on token type
-            secret_key = settings.jwt_refresh_secret_key if is_refresh else settings.jwt_secret_key
-            payload = jwt.decode(token, secret_key, algorithms=[settings.jwt_algorithm])
+            secret_key = settings.JWT_REFRESH_SECRET_KEY if is_refresh else settings.JWT_SECRET_KEY
+            payload = jwt.decode(token, secret_key, algorithms=[settings.JWT_ALGORITHM])
             
             # Verify token type
             expected_type = "refresh_token" if is_refresh else "access_token"
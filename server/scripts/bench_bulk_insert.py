@@ -0,0 +1,124 @@
+"""
+Benchmark BaseRepository.bulk_insert against the ORM bulk_create.
+
+Inserts ``--rows`` rows with each method and reports rows/s, for two
+models:
+
+- blocked_ips: no slug, so the numbers show the INSERT path itself
+  (multi-row Core INSERT vs ORM flush).
+- posts: a slug is allocated per row (half of the rows share a title).
+  Both methods allocate slugs with the same batched stats queries, and
+  those dominate.
+
+Uses the configured DATABASE_URL. The tables are dropped and recreated,
+so point it at a scratch database and pass --reset to confirm.
+
+    cd server && PYTHONPATH=. python scripts/bench_bulk_insert.py --reset
+
+Recorded on the single-core development VM (2026-10-17), 20000 rows,
+chunk size 1000, two runs each (the VM is noisy):
+
+    Postgres 16 (asyncpg, unix socket)
+        blocked_ips  bulk_create   10.5k-15.9k rows/s
+        blocked_ips  bulk_insert   34.3k-51.9k rows/s
+        posts        bulk_create    1.2k-1.5k rows/s
+        posts        bulk_insert    1.5k-1.6k rows/s
+    SQLite (aiosqlite)
+        blocked_ips  bulk_create   13.3k-17.8k rows/s
+        blocked_ips  bulk_insert   50.3k-57.4k rows/s
+        posts        bulk_create    1.9k-2.1k rows/s
+        posts        bulk_insert    2.1k-2.3k rows/s
+
+Slug allocation costs about 1 ms per distinct title here, mostly building
+and compiling its stats query, so it caps the posts numbers for both
+methods.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.database.base import Base
+from app.database.migrations import POSTGRES_MIGRATIONS
+from app.database.session import AsyncSessionLocal, engine
+from app.models.blockedips import BlockedIP
+from app.models.post import Post
+from app.repositories.base import BaseRepository
+from app.schemas.blocked_ip import BlockedIPCreate
+from app.schemas.post import PostCreate
+
+
+def blocked_ip_rows(count: int):
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    return [
+        BlockedIPCreate(ip=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", expires_at=expires_at)
+        for i in range(count)
+    ]
+
+
+def post_rows(count: int):
+    return [
+        PostCreate(
+            title="Shared title" if i % 2 else f"Post number {i}",
+            content="Lorem ipsum dolor sit amet " * 8,
+            author=f"author {i % 50}",
+        )
+        for i in range(count)
+    ]
+
+
+async def reset_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    if engine.dialect.name != "postgresql":
+        return
+    # The slug prefix indexes live in the migrations; apply them one by one
+    # so a missing extension (pg_trgm) does not skip the rest
+    for name, statements in POSTGRES_MIGRATIONS:
+        try:
+            async with engine.begin() as conn:
+                for statement in statements:
+                    await conn.execute(text(statement))
+        except DBAPIError as e:
+            print(f"skipped migration {name}: {e.orig}")
+
+
+async def run(model, method: str, rows, chunk_size: int):
+    await reset_tables()
+    async with AsyncSessionLocal() as session:
+        repo = BaseRepository(model, session)
+        started = time.perf_counter()
+        if method == "bulk_insert":
+            await repo.bulk_insert(rows, chunk_size=chunk_size)
+        else:
+            await repo.bulk_create(rows)
+        elapsed = time.perf_counter() - started
+    print(f"{model.__tablename__:12} {method:12} {len(rows) / elapsed:>9,.0f} rows/s  ({elapsed:.2f} s)")
+
+
+async def main(args):
+    print(f"{engine.dialect.name}, {args.rows} rows, chunk size {args.chunk_size}")
+    for model, make_rows in ((BlockedIP, blocked_ip_rows), (Post, post_rows)):
+        rows = make_rows(args.rows)
+        for method in ("bulk_create", "bulk_insert"):
+            await run(model, method, rows, args.chunk_size)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--reset", action="store_true", help="confirm the tables may be dropped")
+    args = parser.parse_args()
+    if not args.reset:
+        sys.exit("refusing to drop the tables of DATABASE_URL without --reset")
+    # Per-batch success logs are not what is being measured
+    logging.disable(logging.INFO)
+    asyncio.run(main(args))
@@ -0,0 +1,92 @@
+"""
+Benchmark IPAddressMiddleware against the BaseHTTPMiddleware it replaced.
+
+Both wrap a one-route Starlette app that echoes request.state.client_ip.
+Requests are sent as direct ASGI calls (no HTTP client or server), from a
+trusted proxy peer with an X-Forwarded-For header, so the numbers show
+the middleware and routing overhead only.
+
+    cd server && PYTHONPATH=. python scripts/bench_ip_middleware.py
+
+Recorded on the single-core development VM (2026-10-17), 20000 requests,
+three runs:
+
+    BaseHTTPMiddleware    4.6k-5.5k req/s
+    pure ASGI            34.8k-43.7k req/s
+"""
+import argparse
+import asyncio
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.middleware.ip_address_middleware import IPAddressMiddleware
+
+
+class BaseHTTPIPAddressMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, kept here as the baseline."""
+
+    async def dispatch(self, request: Request, call_next):
+        if x_forwarded_for := request.headers.get("X-Forwarded-For"):
+            request.state.client_ip = x_forwarded_for.split(",")[0].strip()
+        else:
+            request.state.client_ip = request.client.host
+        return await call_next(request)
+
+
+async def client_ip(request: Request):
+    return PlainTextResponse(request.state.client_ip)
+
+
+def build(middleware: Middleware) -> Starlette:
+    return Starlette(routes=[Route("/", client_ip)], middleware=[middleware])
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"api"), (b"x-forwarded-for", b"203.0.113.7, 10.0.0.9")],
+    "client": ("10.0.0.5", 40000),
+    "server": ("api", 80),
+}
+
+
+async def measure(name: str, app: Starlette, requests: int):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE, state={}), receive, send)
+    elapsed = time.perf_counter() - started
+    print(f"{name:20} {requests / elapsed:>9,.0f} req/s")
+
+
+async def main(args):
+    await measure("BaseHTTPMiddleware", build(Middleware(BaseHTTPIPAddressMiddleware)), args.requests)
+    await measure(
+        "pure ASGI",
+        build(Middleware(IPAddressMiddleware, trusted_proxies=["10.0.0.0/8"])),
+        args.requests,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,140 @@
+"""
+Benchmark login throughput and the statements each login runs.
+
+Seeds ``--users`` users, then ``--clients`` concurrent clients log in
+through the ASGI app for ``--duration`` seconds, cycling over the users.
+Before the load, one successful and one failed login are traced and the
+SQL statements and commits they issue are printed.
+
+Run it with a low BCRYPT_ROUNDS so the database path, not hashing,
+dominates. Uses the configured DATABASE_URL. The tables are dropped and
+recreated, so point it at a scratch database and pass --reset to confirm.
+
+    cd server && BCRYPT_ROUNDS=4 PYTHONPATH=. python scripts/bench_login.py --reset
+
+Recorded on the single-core development VM (2026-10-17), Postgres 16
+over a unix socket, BCRYPT_ROUNDS=4, 50 users, 16 clients, 10 s. "before"
+is the same script run against the tree preceding the single-transaction
+login, with runs alternated:
+
+    before   85.5-108.2 logins/s, p99 249-338 ms (4 runs)
+    after    82.5-110.7 logins/s, p99 207-329 ms (5 runs)
+
+Throughput is the same within run-to-run noise. Per login:
+
+    before   success: SELECT 2, UPDATE 1, INSERT 1, COMMIT 1
+             failure: SELECT 2, UPDATE 1 (never committed)
+    after    success: SELECT 3, UPDATE 1, INSERT 1, COMMIT 1
+             failure: SELECT 2, UPDATE 1, COMMIT 1
+
+The extra SELECT on success reads the global revocation epoch for the
+token's ``gen`` claim.
+"""
+import argparse
+import asyncio
+import collections
+import logging
+import sys
+import time
+
+import email_validator
+import httpx
+from sqlalchemy import event
+
+# The seeded addresses are synthetic; skip the DNS deliverability check
+email_validator.CHECK_DELIVERABILITY = False
+
+from app.database.base import Base
+from app.database.session import AsyncSessionLocal, engine
+from app.main import app
+from app.models.roles import Role
+from app.models.users import User
+from app.utils.password import PasswordHasher
+
+API = "/api/v1/api/v1"
+PASSWORD = "Secret1!x"
+
+statements = collections.Counter()
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements[statement.split(None, 1)[0].upper()] += 1
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def count_commit(conn):
+    statements["COMMIT"] += 1
+
+
+async def create_users(count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    password_hash = PasswordHasher.get_password_hash(PASSWORD)
+    async with AsyncSessionLocal() as session:
+        session.add(Role(name="user"))
+        for i in range(count):
+            session.add(User(
+                username=f"user{i:04}",
+                email=f"user{i}@example.com",
+                is_active=True,
+                password_hash=password_hash,
+            ))
+        await session.commit()
+
+
+async def login(client: httpx.AsyncClient, user: int, password: str = PASSWORD) -> httpx.Response:
+    return await client.post(
+        f"{API}/auth/login", json={"email": f"user{user}@example.com", "password": password}
+    )
+
+
+async def main(args):
+    await create_users(args.users)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up connections and caches before tracing
+        await login(client, 0)
+        for name, user, password in (("successful", 0, PASSWORD), ("failed", 1, "Wrong-pass1")):
+            statements.clear()
+            response = await login(client, user, password)
+            print(f"{name} login ({response.status_code}): {dict(statements)}")
+
+        latencies = []
+        stop = time.perf_counter() + args.duration
+
+        async def worker(first: int):
+            user = first
+            while time.perf_counter() < stop:
+                started = time.perf_counter()
+                response = await login(client, user % args.users)
+                assert response.status_code == 200, response.text
+                latencies.append(time.perf_counter() - started)
+                user += args.clients
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.clients)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{len(latencies)} logins in {elapsed:.1f} s: {len(latencies) / elapsed:.1f} logins/s, "
+        f"p50 {latencies[len(latencies) // 2] * 1000:.0f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.0f} ms"
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--reset", action="store_true", help="confirm the tables may be dropped")
+    args = parser.parse_args()
+    if not args.reset:
+        sys.exit("refusing to drop the tables of DATABASE_URL without --reset")
+    logging.disable(logging.INFO)
+    asyncio.run(main(args))
@@ -0,0 +1,129 @@
+"""
+Benchmark event loop responsiveness during a login storm.
+
+Sends ``--logins`` concurrent logins through the ASGI app while /health
+is requested every 10 ms. Probe latency is measured from each probe's
+scheduled send time, so a blocked event loop shows up as probe delay.
+``--mode inline`` verifies passwords on the event loop, as before the
+hashing pool; ``--mode pool`` uses PasswordHasher's thread pool.
+
+Uses the configured DATABASE_URL. The tables are dropped and recreated,
+so point it at a scratch database and pass --reset to confirm.
+
+    cd server && PYTHONPATH=. python scripts/bench_password_hashing.py --reset --mode inline
+    cd server && PYTHONPATH=. python scripts/bench_password_hashing.py --reset --mode pool
+
+Recorded on the single-core development VM (2026-10-17), SQLite,
+BCRYPT_ROUNDS=12 (one verify takes about 350 ms), 24 concurrent logins,
+two runs each:
+
+    inline   /health p50 3447-3560 ms, p99 8033-8220 ms
+    pool     /health p50 2.7-3.4 ms,   p99 13.1-18.0 ms
+
+With PASSWORD_HASH_MAX_PENDING=4 in the environment, 20 of the 24
+logins got 503 and the storm was over in 1.9 s instead of queueing.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+import email_validator
+import httpx
+
+# The seeded addresses are synthetic; skip the DNS deliverability check
+email_validator.CHECK_DELIVERABILITY = False
+
+from app.database.base import Base
+from app.database.session import AsyncSessionLocal, engine
+from app.main import app
+from app.models.roles import Role
+from app.models.users import User
+from app.utils.password import PasswordHasher
+
+API = "/api/v1/api/v1"
+PASSWORD = "Secret1!x"
+PROBE_INTERVAL = 0.01
+
+
+async def create_users(count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    password_hash = PasswordHasher.get_password_hash(PASSWORD)
+    async with AsyncSessionLocal() as session:
+        session.add(Role(name="user"))
+        for i in range(count):
+            session.add(User(
+                username=f"user{i:04}",
+                email=f"user{i}@example.com",
+                is_active=True,
+                password_hash=password_hash,
+            ))
+        await session.commit()
+
+
+def percentile(values, fraction: float) -> float:
+    return values[min(len(values) - 1, int(fraction * len(values)))] * 1000
+
+
+async def main(args):
+    if args.mode == "inline":
+        async def check_password_inline(self, password: str) -> bool:
+            return self.check_password(password)
+        User.check_password_async = check_password_inline
+
+    await create_users(args.logins)
+    password_hash = PasswordHasher.get_password_hash(PASSWORD)
+    started = time.perf_counter()
+    PasswordHasher.verify_password(PASSWORD, password_hash)
+    print(f"one verify: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        delays = []
+        done = False
+
+        async def probe():
+            scheduled = time.perf_counter()
+            while not done:
+                scheduled += PROBE_INTERVAL
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                await client.get("/api/v1/health")
+                delays.append(time.perf_counter() - scheduled)
+
+        async def login(i: int) -> int:
+            response = await client.post(
+                f"{API}/auth/login", json={"email": f"user{i}@example.com", "password": PASSWORD}
+            )
+            return response.status_code
+
+        prober = asyncio.create_task(probe())
+        await asyncio.sleep(0.2)
+        started = time.perf_counter()
+        codes = await asyncio.gather(*(login(i) for i in range(args.logins)))
+        wall = time.perf_counter() - started
+        done = True
+        await prober
+
+    delays.sort()
+    statuses = {code: codes.count(code) for code in sorted(set(codes))}
+    print(
+        f"{args.mode}: {args.logins} logins {statuses} in {wall:.1f} s, "
+        f"/health p50 {percentile(delays, 0.5):.1f} ms, p99 {percentile(delays, 0.99):.1f} ms, "
+        f"max {delays[-1] * 1000:.0f} ms"
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=["inline", "pool"], default="pool")
+    parser.add_argument("--logins", type=int, default=24)
+    parser.add_argument("--reset", action="store_true", help="confirm the tables may be dropped")
+    args = parser.parse_args()
+    if not args.reset:
+        sys.exit("refusing to drop the tables of DATABASE_URL without --reset")
+    logging.disable(logging.INFO)
+    asyncio.run(main(args))
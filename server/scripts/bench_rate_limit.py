@@ -0,0 +1,50 @@
+"""
+Benchmark rate limit checks per second for each algorithm.
+
+Every check goes through the backend's ``hit``, as AsyncRateLimiter does.
+The keys are ``--keys`` distinct client IPs visited round-robin for
+``--passes`` passes, so each check is for a different key than the one
+before it. With --redis-url, the same checks also go to a RedisBackend
+(which is one network round-trip per check).
+
+    cd server && PYTHONPATH=. python scripts/bench_rate_limit.py
+
+Recorded on the single-core development VM (2026-10-17), MemoryBackend,
+100k keys, 3 passes, three runs:
+
+    token_bucket     192k-277k checks/s
+    sliding_window   197k-218k checks/s
+
+RedisBackend was not measured; no Redis server was available.
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.ratelimit import SLIDING_WINDOW, TOKEN_BUCKET, MemoryBackend, RateLimit, create_backend
+
+
+async def measure(name: str, backend, keys, passes: int):
+    for algorithm in (TOKEN_BUCKET, SLIDING_WINDOW):
+        limit = RateLimit(100, 60, algorithm)
+        started = time.perf_counter()
+        for _ in range(passes):
+            for key in keys:
+                await backend.hit(key, limit)
+        elapsed = time.perf_counter() - started
+        print(f"{name:8} {algorithm:16} {len(keys) * passes / elapsed:>10,.0f} checks/s")
+
+
+async def main(args):
+    keys = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.keys)]
+    await measure("memory", MemoryBackend(max_keys=max(args.keys * 2, 100_000)), keys, args.passes)
+    if args.redis_url:
+        await measure("redis", create_backend("redis", args.redis_url), keys, args.passes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--redis-url", help="also benchmark RedisBackend against this server")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,54 @@
+import os
+import tempfile
+
+# Settings are read at import time, so configure the app before importing it
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "test-jwt-refresh-secret")
+os.environ.setdefault("SMTP_USER", "test")
+os.environ.setdefault("SMTP_PASSWORD", "test")
+os.environ.setdefault("RATE_LIMIT_POLICIES", "[]")
+
+import email_validator
+import httpx
+import pytest
+
+email_validator.CHECK_DELIVERABILITY = False
+
+from app.database.base import Base
+from app.database.session import AsyncSessionLocal, engine
+from app.main import app
+
+API = "/api/v1/api/v1"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(db_tables):
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+async def client(db_tables):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import event, func, select
+
+from app.database import slugs
+from app.database.session import engine
+from app.exceptions.database import InvalidDataException
+from app.models.blockedips import BlockedIP
+from app.models.post import Post
+from app.repositories import base
+from app.repositories.blocked_ip import BlockedIPRepository
+from app.repositories.post import PostRepository
+from app.schemas.blocked_ip import BlockedIPCreate
+from app.schemas.post import PostCreate
+
+pytestmark = pytest.mark.anyio
+
+
+def posts(n, title="Bulk"):
+    return [PostCreate(title=title, content="body", author="someone") for _ in range(n)]
+
+
+async def test_on_conflict_nothing_requires_conflict_columns(session):
+    repo = PostRepository(Post, session)
+    with pytest.raises(InvalidDataException):
+        await repo.bulk_insert(posts(2), on_conflict="nothing")
+
+    assert await session.scalar(select(func.count()).select_from(Post)) == 0
+
+
+async def test_duplicate_titles_get_distinct_slugs(session):
+    result = await PostRepository(Post, session).bulk_insert(posts(5), returning=["slug"])
+
+    assert result.affected == 5
+    assert sorted(row["slug"] for row in result.rows) == [
+        "bulk", "bulk-1", "bulk-2", "bulk-3", "bulk-4"
+    ]
+
+
+async def test_chunk_size_budgets_for_every_table_column(session, monkeypatch):
+    columns = len(Post.__table__.c)
+    limit = columns * 2 - 1
+    monkeypatch.setattr(base, "POSTGRES_MAX_BIND_PARAMS", limit)
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO posts"):
+            inserts.append(len(parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        result = await PostRepository(Post, session).bulk_insert(posts(5))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_inserts)
+
+    assert result.affected == 5
+    assert max(inserts) <= limit
+
+
+async def test_bulk_create_allocates_slugs_in_batches(session, monkeypatch):
+    monkeypatch.setattr(slugs, "SLUG_STATS_BATCH", 3)
+    schemas = [PostCreate(title=f"Post {i % 4}", content="body", author="someone") for i in range(10)]
+
+    created = await PostRepository(Post, session).bulk_create(schemas)
+
+    assert sorted(post.slug for post in created) == sorted(
+        ["post-0", "post-0-1", "post-0-2", "post-1", "post-1-1", "post-1-2",
+         "post-2", "post-2-1", "post-3", "post-3-1"]
+    )
+
+
+async def test_affected_counts_only_written_rows(session):
+    repo = BlockedIPRepository(BlockedIP, session)
+    await repo.bulk_insert([BlockedIPCreate(ip="10.0.0.1"), BlockedIPCreate(ip="10.0.0.2")])
+
+    fresh = [BlockedIPCreate(ip=ip) for ip in ("10.0.0.2", "10.0.0.3", "10.0.0.4")]
+    skipped = await repo.bulk_insert(fresh, on_conflict="nothing", conflict_columns=["ip"])
+    assert skipped.affected == 2
+
+    upserted = await repo.bulk_insert(
+        fresh, on_conflict="update", conflict_columns=["ip"], returning=["ip"]
+    )
+    assert upserted.affected == 3
+    assert sorted(row["ip"] for row in upserted.rows) == ["10.0.0.2", "10.0.0.3", "10.0.0.4"]
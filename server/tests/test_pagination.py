@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import text
+
+from tests.conftest import API
+
+pytestmark = pytest.mark.anyio
+
+POSTS = 7
+
+
+@pytest.fixture
+async def posts(client, session):
+    for i in range(POSTS):
+        response = await client.post(
+            f"{API}/posts/", json={"title": f"Post {i}", "content": "body", "author": f"author {i % 2}"}
+        )
+        assert response.status_code == 201, response.text
+    # Spread created_at over a few seconds, with ties, in the format the
+    # server default stores
+    await session.execute(text(
+        "UPDATE posts SET created_at = datetime('now', printf('-%d seconds', rowid % 3))"
+    ))
+    await session.commit()
+
+
+async def walk(client, order_by, cursor_key="next_cursor", cursor=None):
+    seen = []
+    for _ in range(POSTS + 1):
+        params = {"limit": 2, "order_by": order_by}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(f"{API}/posts/", params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        items = [item["id"] for item in page["items"]]
+        seen = items + seen if cursor_key == "prev_cursor" else seen + items
+        cursor = page[cursor_key]
+        if cursor is None:
+            return seen, page
+    pytest.fail("cursor pagination did not terminate")
+
+
+@pytest.mark.parametrize("order_by", [["-created_at"], ["created_at"], ["-created_at", "title"], ["author", "-created_at"]])
+async def test_cursor_walks_every_page(client, posts, order_by):
+    response = await client.get(f"{API}/posts/", params={"limit": POSTS, "order_by": order_by})
+    expected = [item["id"] for item in response.json()["items"]]
+    assert len(expected) == POSTS
+
+    forward, last_page = await walk(client, order_by)
+    assert forward == expected
+
+    backward, _ = await walk(
+        client, order_by, cursor_key="prev_cursor", cursor=last_page["prev_cursor"]
+    )
+    tail = len(last_page["items"])
+    assert backward == expected[:-tail]
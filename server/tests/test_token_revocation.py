@@ -0,0 +1,83 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.core.token_revocation import token_revocations
+from app.models.roles import Role
+from app.models.users import User
+from tests.conftest import API
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "Secret1!x"
+
+
+@pytest.fixture
+async def users(session):
+    admin_role = Role(name="admin")
+    session.add_all([admin_role, Role(name="user")])
+    admin = User(username="admin", email="admin@example.com", is_active=True)
+    admin.set_password(PASSWORD)
+    admin.roles.append(admin_role)
+    bobby = User(username="bobby", email="bobby@example.com", is_active=True)
+    bobby.set_password(PASSWORD)
+    session.add_all([admin, bobby])
+    await session.commit()
+    # Start from a fresh snapshot so checks are served by the cache
+    await token_revocations.refresh()
+    return admin, bobby
+
+
+async def login(client, email):
+    response = await client.post(f"{API}/auth/login", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def test_logout_revokes_access_token_on_this_worker(client, users, monkeypatch):
+    headers = await login(client, "bobby@example.com")
+    assert (await client.get(f"{API}/auth/me", headers=headers)).status_code == 200
+
+    async def unavailable():
+        raise RuntimeError("database unavailable")
+
+    # Reloading the snapshot is the background task's job, not logout's
+    monkeypatch.setattr(token_revocations, "refresh", unavailable)
+
+    assert (await client.post(f"{API}/auth/logout", headers=headers)).status_code == 200
+
+    assert token_revocations.is_fresh()
+    assert (await client.get(f"{API}/auth/me", headers=headers)).status_code == 401
+
+
+async def test_logout_all_users_revokes_access_tokens_on_this_worker(client, users):
+    admin_headers = await login(client, "admin@example.com")
+    headers = await login(client, "bobby@example.com")
+
+    response = await client.post(f"{API}/auth/admin/logout/all-users", headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    assert (await client.get(f"{API}/auth/me", headers=headers)).status_code == 401
+
+
+async def test_revoke_user_access_deactivates_and_bumps_version(client, session, users):
+    _, bobby = users
+    admin_headers = await login(client, "admin@example.com")
+    headers = await login(client, "bobby@example.com")
+
+    response = await client.post(f"{API}/auth/admin/revoke/{bobby.id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    row = (await session.execute(
+        select(User.is_active, User.token_version).where(User.id == bobby.id)
+    )).one()
+    assert row == (False, bobby.token_version + 1)
+    assert (await client.get(f"{API}/auth/me", headers=headers)).status_code == 401
+
+
+async def test_revoke_unknown_user_returns_404(client, users):
+    admin_headers = await login(client, "admin@example.com")
+
+    response = await client.post(f"{API}/auth/admin/revoke/{uuid.uuid4()}", headers=admin_headers)
+    assert response.status_code == 404
@@ -0,0 +1,58 @@
+import pytest
+
+from app.exceptions.database import InvalidDataException
+from app.models.users import User
+from app.repositories.user import UserRepository
+from tests.conftest import API
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_post(client, title):
+    response = await client.post(
+        f"{API}/posts/", json={"title": title, "content": "body", "author": "someone"}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_put_with_unchanged_title_keeps_slug(client):
+    posts = [await create_post(client, "Same Title") for _ in range(3)]
+    assert [p["slug"] for p in posts] == ["same-title", "same-title-1", "same-title-2"]
+
+    for post in posts:
+        response = await client.put(
+            f"{API}/posts/{post['id']}", json={"title": "Same Title", "content": "edited"}
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["slug"] == post["slug"]
+
+
+async def test_put_with_new_title_reallocates_slug(client):
+    await create_post(client, "Taken")
+    post = await create_post(client, "Original")
+
+    response = await client.put(f"{API}/posts/{post['id']}", json={"title": "Taken"})
+    assert response.status_code == 200, response.text
+    assert response.json()["slug"] == "taken-1"
+
+
+async def create_user(session):
+    user = User(username="bobby", email="bobby@example.com", is_active=True)
+    user.set_password("Secret1!x")
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def test_update_returning_runs_model_validators(session):
+    user = await create_user(session)
+    repo = UserRepository(session)
+
+    updated = await repo.update_returning(id=user.id, values={"email": "Bobby@EXAMPLE.COM"})
+    assert updated.email == "Bobby@example.com"
+
+    with pytest.raises(InvalidDataException):
+        await repo.update_returning(id=user.id, values={"username": "ab"})
+    with pytest.raises(InvalidDataException):
+        await repo.update_returning(id=user.id, values={"email": "not-an-email"})